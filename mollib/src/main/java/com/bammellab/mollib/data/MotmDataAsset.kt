@@ -0,0 +1,268 @@
+/*
+ *  Copyright 2026 Bammellab / James Andreas
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License
+ */
+
+package com.bammellab.mollib.data
+
+import android.content.res.AssetManager
+import java.io.File
+import java.io.FileInputStream
+import java.nio.ByteBuffer
+import java.nio.ByteOrder
+import java.nio.channels.FileChannel
+import java.nio.charset.StandardCharsets
+import java.util.*
+
+/**
+ * Reader for the MotM data asset (assets/motm_data.bin): the PDB titles,
+ * sorted by code, with a trigram search index over them.
+ * The asset is memory mapped and only the records and strings a lookup
+ * touches are decoded.  The application installs one instance at
+ * startup; PdbInfo reads the PDB titles from it.
+ *
+ * Generated by scripts/export_assets.py - do not edit by hand.
+ */
+class MotmDataAsset(private val buffer: ByteBuffer) {
+
+    companion object {
+        const val ASSET_NAME = "motm_data.bin"
+        const val FORMAT_VERSION = 6
+        private const val NO_STRING = -1
+
+        @Volatile
+        private var installed: MotmDataAsset? = null
+
+        /**
+         * the instance installed by the application
+         */
+        val current: MotmDataAsset
+            get() = installed ?: error("MotmDataAsset.install has not been called")
+
+        fun install(asset: MotmDataAsset) {
+            installed = asset
+        }
+
+        /**
+         * map the asset straight out of the APK - it is stored uncompressed,
+         * so openFd gives its range of the APK file
+         */
+        fun load(assets: AssetManager): MotmDataAsset {
+            val fd = assets.openFd(ASSET_NAME)
+            return fd.createInputStream().use {
+                MotmDataAsset(it.channel.map(FileChannel.MapMode.READ_ONLY, fd.startOffset, fd.length))
+            }
+        }
+
+        /**
+         * map an asset file, e.g. src/main/assets/motm_data.bin in the JVM unit tests
+         */
+        fun load(file: File): MotmDataAsset {
+            return FileInputStream(file).use {
+                MotmDataAsset(it.channel.map(FileChannel.MapMode.READ_ONLY, 0, it.channel.size()))
+            }
+        }
+    }
+
+    private val tables = HashMap<String, Int>()
+
+    init {
+        buffer.order(ByteOrder.LITTLE_ENDIAN)
+        require(ascii(0, 8) == "MOTMDATA") { "not a MotM data asset" }
+        val version = buffer.getShort(8).toInt()
+        require(version == FORMAT_VERSION) { "asset format version $version, expected $FORMAT_VERSION" }
+        val count = buffer.getShort(10).toInt()
+        for (i in 0 until count) {
+            val entry = 16 + i * 16
+            tables[ascii(entry, 8).trimEnd('\u0000')] = buffer.getInt(entry + 8)
+        }
+    }
+
+    // absolute reads on a duplicate, so lookups from several threads do not share a position
+    private fun bytesAt(offset: Int, length: Int): ByteArray {
+        val bytes = ByteArray(length)
+        val view = buffer.duplicate()
+        view.position(offset)
+        view.get(bytes)
+        return bytes
+    }
+
+    private fun ascii(offset: Int, length: Int) = String(bytesAt(offset, length), StandardCharsets.US_ASCII)
+
+    private fun table(name: String) = tables[name] ?: error("table $name missing")
+
+    private fun string(ref: Int): String? {
+        if (ref == NO_STRING) return null
+        val start = table("strings") + ref
+        val length = buffer.getShort(start).toInt() and 0xffff
+        return String(bytesAt(start + 2, length), StandardCharsets.UTF_8)
+    }
+
+    private fun pdbCode(offset: Int) = ascii(offset, 4)
+
+    /**
+     * binary search of the code-sorted pdbinfo table
+     */
+    fun pdbTitle(pdbName: String): String? {
+        val key = pdbName.lowercase(Locale.ROOT)
+        val base = table("pdbinfo")
+        var lo = 0
+        var hi = buffer.getInt(base)
+        while (lo < hi) {
+            val mid = (lo + hi) ushr 1
+            val record = base + 4 + mid * 8
+            val found = pdbCode(record).compareTo(key)
+            when {
+                found == 0 -> return string(buffer.getInt(record + 4))
+                found < 0 -> lo = mid + 1
+                else -> hi = mid
+            }
+        }
+        return null
+    }
+
+    val pdbInfoCount: Int get() = buffer.getInt(table("pdbinfo"))
+
+    /**
+     * the pdbinfo record at index, 0 until pdbInfoCount, in code order
+     */
+    fun pdbInfoEntry(index: Int): PdbInfo.PdbEntryInfo {
+        val record = table("pdbinfo") + 4 + index * 8
+        return PdbInfo.PdbEntryInfo(pdbCode(record), string(buffer.getInt(record + 4)) ?: "")
+    }
+
+    /**
+     * PDB codes whose title contains searchTerm or that equal it, in code
+     * order - the entries of PdbInfo.searchPdbInfo
+     */
+    fun searchPdbInfo(searchTerm: String): List<String> {
+        val base = table("pdbinfo") + 4
+        val codes = search(searchTerm).map { pdbCode(base + it * 8) }
+        val name = searchTerm.lowercase(Locale.ROOT)
+        if (name in codes || pdbTitle(name) == null) return codes
+        return (codes + name).sorted()
+    }
+
+    private fun codePoints(s: String): IntArray {
+        val points = ArrayList<Int>()
+        var i = 0
+        while (i < s.length) {
+            val point = s.codePointAt(i)
+            points.add(point)
+            i += Character.charCount(point)
+        }
+        return points.toIntArray()
+    }
+
+    private fun gramKey(points: IntArray, start: Int, length: Int): Long {
+        var key = 0L
+        for (i in 0 until 3) {
+            key = (key shl 21) or (if (i < length) points[start + i].toLong() else 0L)
+        }
+        return key
+    }
+
+    private fun gramKeyAt(grams: Int, index: Int) = buffer.getLong(grams + 4 + index * 12)
+
+    // index of the first trigram whose key is >= key
+    private fun lowerBound(grams: Int, key: Long): Int {
+        var lo = 0
+        var hi = buffer.getInt(grams)
+        while (lo < hi) {
+            val mid = (lo + hi) ushr 1
+            if (gramKeyAt(grams, mid) < key) lo = mid + 1 else hi = mid
+        }
+        return lo
+    }
+
+    private fun postingOffset(grams: Int, index: Int) = buffer.getInt(grams + 4 + index * 12 + 8)
+
+    // postings of every trigram with a key in [low, high): adjacent keys have adjacent lists,
+    // each a run of varint gaps from the previous position (the first from -1)
+    private fun postings(low: Long, high: Long): IntArray {
+        val grams = table("pgrams")
+        val post = table("ppost")
+        val docs = ArrayList<Int>()
+        for (index in lowerBound(grams, low) until lowerBound(grams, high)) {
+            var pos = post + postingOffset(grams, index)
+            val end = post + postingOffset(grams, index + 1)
+            var doc = -1
+            while (pos < end) {
+                var gap = 0
+                var shift = 0
+                do {
+                    val byte = buffer.get(pos++).toInt()
+                    gap = gap or ((byte and 0x7f) shl shift)
+                    shift += 7
+                } while ((byte and 0x80) != 0)
+                doc += gap
+                docs.add(doc)
+            }
+        }
+        return docs.toIntArray()
+    }
+
+    // the PDB title a search document was indexed from
+    private fun title(doc: Int) = string(buffer.getInt(table("pdbinfo") + 4 + doc * 8 + 4))
+
+    private fun intersect(a: IntArray, b: IntArray): IntArray {
+        val out = ArrayList<Int>()
+        var i = 0
+        var j = 0
+        while (i < a.size && j < b.size) {
+            when {
+                a[i] < b[j] -> i++
+                a[i] > b[j] -> j++
+                else -> {
+                    out.add(a[i])
+                    i++
+                    j++
+                }
+            }
+        }
+        return out.toIntArray()
+    }
+
+    /**
+     * sorted pdbinfo positions of the titles that contain searchTerm:
+     * a short term is a range of trigram keys, a longer one the
+     * intersection of its trigrams' posting lists checked with contains
+     */
+    private fun search(searchTerm: String): IntArray {
+        val query = searchTerm.lowercase(Locale.ROOT)
+        if (query.isEmpty()) return IntArray(pdbInfoCount) { it }
+        val points = codePoints(query)
+
+        if (points.size < 3) {
+            val low = gramKey(points, 0, points.size)
+            val found = BitSet()
+            for (doc in postings(low, low + (1L shl 21 * (3 - points.size)))) found.set(doc)
+            val docs = IntArray(found.cardinality())
+            var doc = found.nextSetBit(0)
+            for (k in docs.indices) {
+                docs[k] = doc
+                doc = found.nextSetBit(doc + 1)
+            }
+            return docs
+        }
+
+        // trigrams covering the query without overlap narrow it down, contains does the rest
+        val starts = ((0 until points.size - 2 step 3) + (points.size - 3)).distinct()
+        val lists = starts.map { gramKey(points, it, 3) }.distinct().map { key ->
+            val docs = postings(key, key + 1)
+            if (docs.isEmpty()) return IntArray(0)
+            docs
+        }.sortedBy { it.size }
+        var candidates = lists[0]
+        for (list in lists.drop(1)) candidates = intersect(candidates, list)
+        return candidates.filter { title(it)?.lowercase(Locale.ROOT)?.contains(query) == true }.toIntArray()
+    }
+}
@@ -0,0 +1,75 @@
+/*
+ *  Copyright 2026 Bammellab / James Andreas
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License
+ */
+
+package com.bammellab.mollib.data
+
+import org.junit.jupiter.api.Assertions.*
+import org.junit.jupiter.api.DisplayName
+import org.junit.jupiter.api.Test
+import java.io.File
+import java.util.*
+
+/**
+ * The data asset is generated by scripts/export_assets.py - these tests
+ * fail when it is out of date with pdb_info.tsv.
+ * Unit tests run with the mollib module as the working directory.
+ */
+internal class MotmDataAssetTest {
+
+    private val asset = MotmDataAsset.load(File("src/main/assets/${MotmDataAsset.ASSET_NAME}"))
+
+    /**
+     * every word of the MotM titles and tag lines, their first two letters
+     * and a middle slice, plus a few short, odd and PDB code queries
+     */
+    private fun searchTerms(): List<String> {
+        val terms = sortedSetOf("", "a", "zq", "dna", "DNA", "hiv-1", "  ", "x-ray", "1hho", "4hhb", "Ribosom")
+        for (motmNumber in 1..Corpus.numMonths) {
+            val text = Corpus.motmTitleGet(motmNumber) + " " + Corpus.motmTagLinesGet(motmNumber - 1)
+            for (word in text.split(" ").filter { it.isNotEmpty() }) {
+                terms.add(word)
+                terms.add(word.take(2))
+                if (word.length > 1) terms.add(word.substring(1, minOf(word.length, 5)))
+            }
+        }
+        return terms.toList()
+    }
+
+    @Test
+    @DisplayName("pdbTitle finds every entry of pdb_info.tsv")
+    fun pdbTitleLookup() {
+        val entries = File("data/pdb_info.tsv").readLines()
+            .filter { !it.startsWith("#") && it.contains('\t') }
+            .map { it.split('\t', limit = 2) }
+        assertEquals(entries.size, asset.pdbInfoCount)
+        for ((pdbName, title) in entries) {
+            assertEquals(title, asset.pdbTitle(pdbName), pdbName)
+            assertEquals(title, asset.pdbTitle(pdbName.uppercase()), pdbName)
+        }
+        val codes = (0 until asset.pdbInfoCount).map { asset.pdbInfoEntry(it).pdbName }
+        assertEquals(codes.sorted(), codes)
+        assertNull(asset.pdbTitle("zzzz"))
+    }
+
+    @Test
+    @DisplayName("searchPdbInfo finds what a substring scan of the PDB titles finds")
+    fun searchPdbInfoMatchesScan() {
+        val entries = (0 until asset.pdbInfoCount).map { asset.pdbInfoEntry(it) }
+        val terms = searchTerms() + entries.filterIndexed { i, _ -> i % 25 == 0 }.map { it.pdbInfo.drop(5).take(9) }
+        for (term in terms) {
+            val s = term.lowercase(Locale.ROOT)
+            val scan = entries.filter { it.pdbInfo.lowercase(Locale.ROOT).contains(s) || it.pdbName == s }
+            assertEquals(scan.map { it.pdbName }, asset.searchPdbInfo(term), term)
+        }
+    }
+}
@@ -21,6 +21,7 @@ import org.junit.jupiter.api.Assertions.*
 import org.junit.jupiter.api.BeforeEach
 import org.junit.jupiter.api.DisplayName
 import org.junit.jupiter.api.Test
+import java.io.File
 
 internal class PDBsTest {
     // MAINTENANCE - update last MotM number as they are added
@@ -35,6 +36,8 @@ internal class PDBsTest {
      */
     @BeforeEach
     fun setUp() {
+        // PdbInfo reads the PDB titles from the data asset
+        MotmDataAsset.install(MotmDataAsset.load(File("src/main/assets/${MotmDataAsset.ASSET_NAME}")))
         mapFromMotmNUmberToPdbList = pullTheMap()
         assertNotNull(mapFromMotmNUmberToPdbList)
     }
@@ -62,7 +65,7 @@ internal class PDBsTest {
      * verify that for all PDB codes in each map entry that there is a pdbInfoList entry
      *
      * This verifies the consistency of the two lists in one direction.
-     * Note: Many historical PDB entries are not yet in PdbInfoArray - this test
+     * Note: Many historical PDB entries are not yet in pdb_info.tsv - this test
      * identifies them but doesn't fail for missing entries.
      */
 
@@ -76,7 +79,7 @@ internal class PDBsTest {
                 val resultList = searchPdbInfoForNameMatch(pdb)
                 assertNotNull(resultList)
                 if (resultList.isEmpty()) {
-                    // Track missing entries but don't fail - many historical entries aren't in PdbInfoArray
+                    // Track missing entries but don't fail - many historical entries aren't in pdb_info.tsv
                     missingCount++
                     continue
                 }
@@ -90,7 +93,7 @@ internal class PDBsTest {
             }
         }
         if (missingCount > 0) {
-            println("Note: $missingCount PDB codes in PDBs.kt are not yet in PdbInfoArray.kt")
+            println("Note: $missingCount PDB codes in PDBs.kt are not yet in pdb_info.tsv")
         }
         assertEquals(0, duplicateCount, "Found $duplicateCount duplicate entries in pdbInfoList")
     }
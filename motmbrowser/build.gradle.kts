@@ -88,6 +88,12 @@ android {
         targetCompatibility = JavaVersion.VERSION_17
     }
 
+    // MotmDataAsset maps motm_data.bin with AssetManager.openFd, which
+    // needs the asset stored uncompressed in the APK
+    androidResources {
+        noCompress += "bin"
+    }
+
     lint {
         abortOnError = false
         checkDependencies = true
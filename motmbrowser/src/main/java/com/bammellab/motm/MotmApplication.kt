@@ -16,6 +16,7 @@ package com.bammellab.motm
 
 import android.app.Application
 import android.content.Context
+import com.bammellab.mollib.data.MotmDataAsset
 import com.bammellab.motm.util.PrefsUtil
 import okhttp3.OkHttpClient
 import timber.log.Timber
@@ -32,6 +33,9 @@ class MotmApplication : Application() {
 
         PrefsUtil.prefsContext = context
 
+        // the PDB titles for search are read from the mapped data asset
+        MotmDataAsset.install(MotmDataAsset.load(assets))
+
 
         /*
          * this is added as suggested here:
@@ -0,0 +1,1230 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the MotM scraping scripts
+
+Each benchmark runs against a local stand-in server so no requests are
+sent to rcsb.org, and the results can be compared between commits.
+
+Usage:
+    python bench_scrapers.py pdb-info [--entries N] [--batch-size N] [--latency S]
+    python bench_scrapers.py parse [--pages DIR] [--repeat N]
+    python bench_scrapers.py pdb-codes [--pages DIR] [--repeat N]
+    python bench_scrapers.py holdings [--entries N] [--lookups N]
+    python bench_scrapers.py rate [--pages N] [--capacity R] [--workers N]
+    python bench_scrapers.py tls [--requests N] [--latency S]
+    python bench_scrapers.py pipeline [--pages DIR] [--count N] [--workers N] [--parse-workers N]
+    python bench_scrapers.py mirror [--entries N] [--size KB] [--workers N]
+    python bench_scrapers.py structures [--mirror DIR] [--repeat N]
+    python bench_scrapers.py search [--repeat N]
+    python bench_scrapers.py latest [--known N] [--latency S]
+    python bench_scrapers.py archive [--cassette FILE] [--latency S] [--workers N] [--history FILE]
+
+Benchmarks:
+- pdb-info: per-entry REST fetches vs batched GraphQL fetches in
+  scrape_pdb_info.py against a local RCSB data API stub
+- parse: pages/sec of extract_molecule_data and extract_pdb_codes for
+  each HTML parser backend, over the MotM pages in the response cache
+  (or a directory of saved pages, or the test fixture pages if the cache
+  is empty).  Every backend's output is checked
+  against the html.parser reference; a mismatch exits non-zero.
+- pdb-codes: the compiled single-scan PDB code matcher in
+  scrape_pdb_codes.py vs the previous per-call regex version, over the
+  page text and links of the cached pages (parsing excluded).
+- holdings: opening and querying the memory-mapped PDB holdings index
+  (pdb_holdings.py) vs loading the holdings JSON into a Python set, over
+  a synthetic list of `entries` IDs.  Both must give the same answers.
+- rate: fixed-rate TokenBucket vs AdaptiveRateLimiter fetching MotM
+  pages from a stub server that allows `capacity` requests/second, answers
+  429 + Retry-After above that, and slows down as it gets busier.
+- tls: a bare requests.get() per request vs the pooled keep-alive
+  HttpClient in motm_http.py, against a local HTTPS stand-in with a
+  throwaway self-signed certificate (made with the openssl command line
+  tool).  Counts the TLS handshakes the server sees.
+- pipeline: fetch + parse of the combined scraper with parsing inline in
+  the main process vs fetch_parse_ordered with a process pool, over
+  `count` pages served by a local stub (cached pages repeated as needed).
+  Reports pages/sec and the peak memory allocated in the main process,
+  and checks both modes extract the same data.
+- mirror: mirror_pdb_files.py against a local files.rcsb.org stand-in
+  with ETags and Range support that cuts off the first transfer of some
+  files half way.  Times a first mirror, a repeat (conditional requests
+  only) and a repeat after some files changed, reports the bytes sent by
+  the server, and checks every mirrored file against the source.
+- latest: finding the newest MotM entry by fetching every page after
+  Corpus.numMonths (the previous find_latest_motm) vs HEAD probes with
+  exponential then binary search, for several numbers of new entries,
+  against a stub that serves pages up to a given number.  Both must find
+  the same entry.
+- archive: the full scrape of a recorded cassette (see Cassette in
+  motm_http.py), replayed offline with --latency seconds per response:
+  end-to-end time and pages/sec, parse time per page (mean and p95),
+  per page time of extract_molecule_data and extract_pdb_codes, time of
+  categorize_molecules and the Kotlin generators, and peak RSS.  Each
+  run is appended to a history file with the git commit; metrics more
+  than --tolerance worse than the last run of another commit with the
+  same settings are reported as regressions (exit status 1).  Without a
+  cassette, one is built from --pages DIR or the response cache.  Record
+  the 315 issue archive once with
+      python scrape_motm_pages.py 1 315 --no-cache --record motm_cassette.zip
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+SCRIPT_DIR = Path(__file__).parent
+HISTORY_PATH = SCRIPT_DIR / ".bench_history.jsonl"
+FIXTURE_PAGES_DIR = SCRIPT_DIR / "tests" / "fixtures" / "pages"
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog of 5 drops bursts of new connections from
+    # many worker threads, and each dropped SYN costs a 1 s retransmit
+    request_queue_size = 64
+
+
+def start_stub_server(handler_class) -> ThreadingHTTPServer:
+    """Start a local HTTP server on a free port in a background thread."""
+    server = StubServer(("127.0.0.1", 0), handler_class)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    """Base URL of a stub server."""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Base request handler: fixed latency per request, JSON replies, no logging."""
+
+    latency = 0.0
+    requests_served = 0
+
+    def send_json(self, status: int, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RcsbDataStub(StubHandler):
+    """Stand-in for data.rcsb.org: REST core/entry and GraphQL entries queries."""
+
+    known_entries = set()
+
+    def do_GET(self):
+        type(self).requests_served += 1
+        time.sleep(self.latency)
+        url = urlparse(self.path)
+
+        if url.path.startswith("/rest/v1/core/entry/"):
+            code = url.path.rsplit("/", 1)[1].lower()
+            if code in self.known_entries:
+                self.send_json(200, {"struct": {"title": f"Stub structure {code}"}})
+            else:
+                self.send_json(404, {"message": "not found"})
+            return
+
+        if url.path == "/graphql":
+            variables = json.loads(parse_qs(url.query)["variables"][0])
+            entries = []
+            errors = []
+            for code in variables["ids"]:
+                if code.lower() in self.known_entries:
+                    entries.append({"rcsb_id": code, "struct": {"title": f"Stub structure {code.lower()}"}})
+                else:
+                    errors.append({"message": f"No data found for entry {code}"})
+            payload = {"data": {"entries": entries}}
+            if errors:
+                payload["errors"] = errors
+            self.send_json(200, payload)
+            return
+
+        self.send_json(404, {"message": "not found"})
+
+
+class ThrottlingMotmStub(StubHandler):
+    """Stand-in for pdb101.rcsb.org that throttles clients above `capacity` requests/second."""
+
+    capacity = 10.0
+    throttled = 0
+    lock = threading.Lock()
+    recent = []
+
+    def do_GET(self):
+        now = time.monotonic()
+        with self.lock:
+            cls = type(self)
+            cls.requests_served += 1
+            # Requests in the last second, including throttled ones
+            cls.recent = [t for t in cls.recent if now - t < 1.0] + [now]
+            load = len(cls.recent) / self.capacity
+            over = load > 1.0
+            if over:
+                cls.throttled += 1
+
+        if over:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        # Latency grows as the server approaches its capacity
+        time.sleep(self.latency * (1 + 4 * load * load))
+        body = f"<html><head><title>Molecule {self.path}</title></head><body></body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def bench_rate(args):
+    """Fixed vs adaptive request rate against a throttling stub server."""
+    import motm_http
+    from motm_fetch import AdaptiveRateLimiter, TokenBucket, fetch_ordered
+
+    ThrottlingMotmStub.capacity = args.capacity
+    ThrottlingMotmStub.latency = args.latency
+    server = start_stub_server(ThrottlingMotmStub)
+    base_url = server_url(server) + "/motm/"
+    motm_http._cache = None
+
+    print(f"{args.pages} pages, {args.workers} workers, server capacity {args.capacity:g} requests/s "
+          f"(429 + Retry-After: 1 above that)")
+    print()
+    print(f"{'limiter':<26}{'seconds':>9}{'pages/s':>9}{'requests':>10}{'429s':>7}{'failed':>8}")
+
+    limiters = (
+        (f"fixed {args.capacity / 4:g}/s", TokenBucket(args.capacity / 4)),
+        (f"fixed {args.capacity * 2:g}/s", TokenBucket(args.capacity * 2)),
+        (f"adaptive from {args.capacity / 4:g}/s",
+         AdaptiveRateLimiter(args.capacity / 4, max_rate=args.capacity * 2)),
+    )
+    for label, limiter in limiters:
+        ThrottlingMotmStub.requests_served = 0
+        ThrottlingMotmStub.throttled = 0
+        ThrottlingMotmStub.recent = []
+        time.sleep(1.0)
+        start = time.perf_counter()
+        failed = sum(html is None for _, html in fetch_ordered(
+            range(1, args.pages + 1),
+            lambda num: motm_http.fetch_molecule_page(num, retries=5, limiter=limiter, base_url=base_url),
+            args.workers))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<26}{elapsed:>9.2f}{args.pages / elapsed:>9.1f}"
+              f"{ThrottlingMotmStub.requests_served:>10}{ThrottlingMotmStub.throttled:>7}{failed:>8}")
+
+    server.shutdown()
+
+
+class KeepAliveStub(StubHandler):
+    """HTTP/1.1 stub that keeps connections open and counts new ones (TLS handshakes)."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACKs add ~40 ms to every response on a kept-alive connection
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        type(self).requests_served += 1
+        time.sleep(self.latency)
+        self.send_json(200, {"struct": {"title": f"Stub structure {self.path}"}})
+
+
+def make_certificate(directory: Path) -> tuple:
+    """Create a self-signed certificate for 127.0.0.1 with openssl; return (cert, key) paths."""
+    cert = directory / "cert.pem"
+    key = directory / "key.pem"
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-keyout", str(key), "-out", str(cert), "-subj", "/CN=127.0.0.1",
+                    "-addext", "subjectAltName=IP:127.0.0.1"],
+                   check=True, capture_output=True)
+    return cert, key
+
+
+def bench_tls(args):
+    """Per-request connections vs the pooled keep-alive client over TLS."""
+    import requests
+    from motm_http import HttpClient, httpx
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            cert, key = make_certificate(Path(tmp))
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Could not create a test certificate with openssl: {e}")
+            sys.exit(1)
+
+        KeepAliveStub.latency = args.latency
+        server = start_stub_server(KeepAliveStub)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        host, port = server.server_address[:2]
+        base_url = f"https://{host}:{port}/rest/v1/core/entry/"
+
+        clients = [("requests.get per request", lambda url: requests.get(url, timeout=30, verify=str(cert))),
+                   ("HttpClient (keep-alive)", HttpClient(verify=str(cert)).get)]
+        if httpx is not None:
+            clients.append(("HttpClient (httpx, HTTP/2)", HttpClient(http2=True, verify=str(cert)).get))
+
+        print(f"{args.requests} sequential requests, {args.latency * 1000:.0f} ms server latency")
+        print()
+        print(f"{'client':<28}{'seconds':>9}{'ms/request':>12}{'handshakes':>12}")
+
+        for label, get in clients:
+            KeepAliveStub.connections = 0
+            start = time.perf_counter()
+            for i in range(args.requests):
+                get(f"{base_url}{i:04d}").raise_for_status()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<28}{elapsed:>9.2f}{elapsed * 1000 / args.requests:>12.2f}"
+                  f"{KeepAliveStub.connections:>12}")
+
+        server.shutdown()
+
+
+class PageStub(StubHandler):
+    """Serves /motm/N from a list of pages, cycling through it."""
+
+    pages = []
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        num = int(self.path.rsplit("/", 1)[1])
+        body = self.pages[(num - 1) % len(self.pages)].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def bench_pipeline(args):
+    """Inline parsing vs the fetch thread / parse process pipeline."""
+    import tracemalloc
+    from functools import partial
+
+    import motm_http
+    from motm_fetch import fetch_ordered, fetch_parse_ordered
+    from scrape_motm_pages import extract_page_data
+
+    pages = load_pages(args.pages)
+    if not pages:
+        print("No pages found - run a scraper first to fill the response cache, or use --pages DIR")
+        sys.exit(1)
+
+    PageStub.pages = [html for _, html in pages]
+    PageStub.latency = args.latency
+    server = start_stub_server(PageStub)
+    base_url = server_url(server) + "/motm/"
+    motm_http._cache = None
+    numbers = range(1, args.count + 1)
+
+    def fetch(num):
+        return motm_http.fetch_molecule_page(num, base_url=base_url)
+
+    parse = partial(extract_page_data, backend="auto")
+    modes = (
+        ("inline parse", lambda: ((num, parse(html, num)) for num, html in
+                                  fetch_ordered(numbers, fetch, args.workers))),
+        (f"{args.parse_workers} parse processes",
+         lambda: fetch_parse_ordered(numbers, fetch, parse, args.workers, args.parse_workers)),
+    )
+
+    print(f"{args.count} pages, {args.workers} fetch threads, {args.latency * 1000:.0f} ms server latency, "
+          f"{os.cpu_count()} CPUs")
+    print()
+    print(f"{'mode':<22}{'seconds':>9}{'pages/s':>9}{'peak MB':>9}")
+
+    results = {}
+    for label, run in modes:
+        tracemalloc.start()
+        start = time.perf_counter()
+        results[label] = [(num, page["molecule"]["title"], page["pdb_codes"]["pdb_codes"])
+                          for num, page in run()]
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        print(f"{label:<22}{elapsed:>9.2f}{args.count / elapsed:>9.1f}{peak:>9.1f}")
+
+    server.shutdown()
+    inline, pipelined = results.values()
+    if inline != pipelined:
+        print("\nMISMATCH: pipeline results differ from inline parsing")
+        sys.exit(1)
+    print("\nBoth modes extract the same data")
+
+
+def bench_pdb_info(args):
+    """Per-entry REST vs batched GraphQL title fetches."""
+    import scrape_pdb_info
+
+    codes = [f"{1 + i % 9}{i:03x}" for i in range(args.entries)]
+    # Every 20th code is unknown to exercise the per-ID fallback
+    RcsbDataStub.known_entries = {code for i, code in enumerate(codes) if i % 20}
+    RcsbDataStub.latency = args.latency
+    server = start_stub_server(RcsbDataStub)
+    data_url = server_url(server)
+
+    print(f"{args.entries} entries, {args.latency * 1000:.0f} ms simulated latency per request")
+    print()
+    print(f"{'mode':<24}{'requests':>10}{'seconds':>10}{'entries/s':>12}")
+
+    results = {}
+    for mode, batch_size in (("REST per entry", 0), (f"GraphQL batch {args.batch_size}", args.batch_size)):
+        RcsbDataStub.requests_served = 0
+        start = time.perf_counter()
+        results[mode] = list(scrape_pdb_info.fetch_all_pdb_info(codes, batch_size, data_url=data_url))
+        elapsed = time.perf_counter() - start
+        print(f"{mode:<24}{RcsbDataStub.requests_served:>10}{elapsed:>10.2f}{len(codes) / elapsed:>12.1f}")
+
+    server.shutdown()
+    rest, batched = results.values()
+    if rest != batched:
+        print("\nMISMATCH: batched results differ from per-entry results")
+        sys.exit(1)
+    print("\nBatched results match per-entry results")
+
+
+def load_pages(pages_dir: Path = None) -> list:
+    """
+    Return (motm_number, html) pairs, sorted by number.
+
+    Pages come from a directory of saved pages named N or N.html, or by
+    default from the MotM pages in the shared response cache.  With an
+    empty cache the small fixture set of the script tests is used, so
+    the backends can still be compared offline.
+    """
+    pages = []
+    if pages_dir:
+        for path in Path(pages_dir).iterdir():
+            match = re.fullmatch(r'(\d+)(?:\.html?)?', path.name)
+            if match:
+                pages.append((int(match.group(1)), path.read_text(encoding="utf-8", errors="replace")))
+        return sorted(pages)
+
+    from motm_http import ResponseCache
+    cache = ResponseCache()
+    for meta_path in cache.meta_dir.glob("*.json"):
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        match = re.search(r'/motm/(\d+)$', meta["url"])
+        if match:
+            pages.append((int(match.group(1)), cache.load_body(meta).decode("utf-8", errors="replace")))
+    if not pages and FIXTURE_PAGES_DIR.is_dir():
+        print(f"Response cache is empty - using the fixture pages in {FIXTURE_PAGES_DIR}")
+        return load_pages(FIXTURE_PAGES_DIR)
+    return sorted(pages)
+
+
+def bench_parse(args):
+    """HTML parser backends for the page extractors: pages/sec and equivalence."""
+    from html_parse import HAVE_LXML, parse_page
+    from scrape_motm_categories import extract_molecule_data
+    from scrape_pdb_codes import extract_pdb_codes
+
+    pages = load_pages(args.pages)
+    if not pages:
+        print("No pages found - run a scraper first to fill the response cache, or use --pages DIR")
+        sys.exit(1)
+
+    def run_molecule(backend, strained):
+        return [extract_molecule_data(html, num, parse_page(html, backend, strained))
+                for num, html in pages]
+
+    def run_pdb_codes(backend):
+        return [extract_pdb_codes(html, num, backend=backend) for num, html in pages]
+
+    def timed(func):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return result, len(pages) / best
+
+    reference_molecules = run_molecule("html.parser", False)
+    reference_codes = run_pdb_codes("html.parser")
+
+    backends = ["html.parser"] + (["lxml"] if HAVE_LXML else [])
+    print(f"{len(pages)} pages, best of {args.repeat} runs" + ("" if HAVE_LXML else " (lxml not installed)"))
+    print()
+    print(f"{'extractor':<24}{'backend':<14}{'pages/s':>10}  output")
+
+    mismatches = 0
+    for backend in backends:
+        for label, func, reference in (
+                ("molecule data (full)", lambda: run_molecule(backend, False), reference_molecules),
+                ("molecule data (strain)", lambda: run_molecule(backend, True), reference_molecules),
+                ("pdb codes", lambda: run_pdb_codes(backend), reference_codes)):
+            result, rate = timed(func)
+            same = result == reference
+            mismatches += not same
+            print(f"{label:<24}{backend:<14}{rate:>10.1f}  {'identical' if same else 'DIFFERS'}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+def legacy_pdb_codes(hrefs: list, text: str) -> set:
+    """The per-call regex PDB code matching used before the compiled engine."""
+    def is_likely(code):
+        if re.match(r'^(19|20)\d{2}$', code):
+            return False
+        if code in {'1000', '2000', '3000', '4000', '5000', '100k', '200k'}:
+            return False
+        return not code[1:].isdigit()
+
+    pdb_codes = set()
+    for href in hrefs:
+        match = re.search(r'/structure/([0-9A-Za-z]{4})(?:[^0-9A-Za-z]|$)', href)
+        if match:
+            pdb_codes.add(match.group(1).lower())
+            continue
+        match = re.search(r'/3d-view/([0-9A-Za-z]{4})(?:[^0-9A-Za-z]|$)', href)
+        if match:
+            pdb_codes.add(match.group(1).lower())
+
+    pdb_pattern = re.compile(r'\b([0-9][0-9A-Za-z]{3})\b')
+    for match in pdb_pattern.finditer(text):
+        code = match.group(1).lower()
+        if is_likely(code):
+            pdb_codes.add(code)
+
+    pdb_explicit = re.compile(r'PDB[:\s]+(?:ID[:\s]+)?(?:entry[:\s]+)?([0-9][0-9A-Za-z]{3})\b', re.IGNORECASE)
+    for match in pdb_explicit.finditer(text):
+        pdb_codes.add(match.group(1).lower())
+    return pdb_codes
+
+
+def bench_pdb_codes(args):
+    """Compiled single-scan PDB code matching vs the previous per-call regexes."""
+    from html_parse import parse_page
+    from scrape_pdb_codes import link_pdb_code, text_pdb_codes
+
+    pages = load_pages(args.pages)
+    if not pages:
+        print("No pages found - run a scraper first to fill the response cache, or use --pages DIR")
+        sys.exit(1)
+
+    inputs = []
+    for _, html in pages:
+        soup = parse_page(html)
+        inputs.append(([link['href'] for link in soup.find_all('a', href=True)], soup.get_text()))
+
+    def current(hrefs, text):
+        pdb_codes = {link_pdb_code(href) for href in hrefs}
+        pdb_codes.discard(None)
+        return pdb_codes | text_pdb_codes(text)
+
+    print(f"{len(pages)} pages, {sum(len(text) for _, text in inputs) / 1e6:.1f} MB of text, "
+          f"best of {args.repeat} runs")
+    print()
+    print(f"{'matcher':<16}{'seconds':>10}{'pages/s':>12}")
+
+    results = {}
+    for label, func in (("previous", legacy_pdb_codes), ("compiled", current)):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[label] = [func(hrefs, text) for hrefs, text in inputs]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{label:<16}{best:>10.3f}{len(pages) / best:>12.1f}")
+
+    if results["previous"] != results["compiled"]:
+        print("\nMISMATCH: compiled matcher finds different PDB codes")
+        sys.exit(1)
+    print("\nBoth matchers find the same PDB codes")
+
+
+def bench_holdings(args):
+    """Memory-mapped holdings index lookups vs a set loaded from the holdings JSON."""
+    import random
+    import string
+    import tracemalloc
+    from pdb_holdings import PdbHoldings, write_holdings
+
+    rng = random.Random(16)
+    alphabet = string.digits + string.ascii_lowercase
+    ids = set()
+    while len(ids) < args.entries:
+        ids.add(rng.choice(string.digits[1:]) + "".join(rng.choices(alphabet, k=3)))
+    ids = sorted(ids)
+    obsolete = [(code, rng.choice(ids)) for code in rng.sample(ids, len(ids) // 20)]
+    current = sorted(set(ids) - {old for old, _ in obsolete})
+    candidates = [rng.choice(alphabet[1:10]) + "".join(rng.choices(alphabet, k=3)) for _ in range(args.lookups)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_holdings(directory, current, obsolete)
+        json_path = directory / "current.json"
+        json_path.write_text(json.dumps([code.upper() for code in current]))
+        index_size = sum(path.stat().st_size for path in directory.glob("*.ids"))
+
+        print(f"{len(current)} current and {len(obsolete)} obsolete IDs, {len(candidates)} lookups")
+        print(f"Index files: {index_size / 1e6:.2f} MB, holdings JSON: {json_path.stat().st_size / 1e6:.2f} MB")
+        print()
+        print(f"{'method':<16}{'open ms':>10}{'lookup us':>12}{'heap MB':>10}")
+
+        def load_set():
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return {code.lower() for code in json.load(f)}
+
+        def measure(label, open_index, lookup):
+            # Timed without tracemalloc, which slows every allocation down
+            start = time.perf_counter()
+            index = open_index()
+            opened = time.perf_counter()
+            answers = [lookup(index, code) for code in candidates]
+            done = time.perf_counter()
+            del index
+            # The peak is kept after the index is freed again
+            tracemalloc.start()
+            open_index()
+            heap = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:<16}{(opened - start) * 1e3:>10.1f}"
+                  f"{(done - opened) / len(candidates) * 1e6:>12.2f}{heap / 1e6:>10.2f}")
+            return answers
+
+        set_answers = measure("json set", load_set, lambda index, code: code in index)
+        index_answers = measure("mmap index", lambda: PdbHoldings(directory),
+                                lambda index, code: index.is_current(code))
+
+    if set_answers != index_answers:
+        print("\nMISMATCH: index and set disagree")
+        sys.exit(1)
+    print(f"\nBoth agree; {sum(index_answers)} of {len(candidates)} candidates are current entries")
+
+
+class PdbFileStub(StubHandler):
+    """Stand-in for files.rcsb.org: ETag / If-None-Match, Range, and dropped first transfers."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    files = {}
+    cut_off = set()
+    bytes_sent = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        code = self.path.rsplit("/", 1)[1].split(".")[0]
+        body = self.files.get(code)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        match = re.match(r"bytes=(\d+)-$", self.headers.get("Range", ""))
+        if match and self.headers.get("If-Range", etag) == etag:
+            start = int(match.group(1))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        with self.lock:
+            cut = code in self.cut_off
+            self.cut_off.discard(code)
+        payload = body[start:start + (len(body) - start) // 2] if cut else body[start:]
+        self.wfile.write(payload)
+        with self.lock:
+            type(self).bytes_sent += len(payload)
+        if cut:
+            self.close_connection = True
+
+
+def bench_mirror(args):
+    """First mirror, repeat, and repeat after changes with mirror_pdb_files.py."""
+    import gzip
+    import random
+    from motm_fetch import fetch_ordered
+    from mirror_pdb_files import download_pdb, file_digest
+
+    rng = random.Random(18)
+    codes = [f"{i % 9 + 1}{i:03x}" for i in range(args.entries)]
+
+    def make_file(code):
+        lines = [f"ATOM  {n:5d}  CA  ALA A{n % 999:4d}    {rng.uniform(-99, 99):8.3f}"
+                 f"{rng.uniform(-99, 99):8.3f}{rng.uniform(-99, 99):8.3f}  1.00 20.00           C\n"
+                 for n in range(args.size * 1024 // 81 * 4)]
+        return gzip.compress(f"HEADER    {code}\n{''.join(lines)}END\n".encode("ascii"), 6)
+
+    PdbFileStub.files = {code: make_file(code) for code in codes[:-2]}
+    PdbFileStub.latency = args.latency
+    server = start_stub_server(PdbFileStub)
+    download_url = f"{server_url(server)}/download/"
+    total = sum(len(body) for body in PdbFileStub.files.values())
+    print(f"{len(codes)} entries ({len(PdbFileStub.files)} with a file, {total / 1e6:.1f} MB), "
+          f"{args.workers} workers, {args.latency * 1000:.0f} ms latency")
+    print()
+    print(f"{'run':<28}{'seconds':>9}{'MB sent':>10}{'downloaded':>12}{'unchanged':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp)
+        manifest = {}
+
+        def run(label):
+            PdbFileStub.bytes_sent = 0
+            counts = {"downloaded": 0, "unchanged": 0, "missing": 0, "failed": 0}
+            start = time.perf_counter()
+            fetch = lambda code: download_pdb(code, output, manifest.get(code, {}), download_url=download_url)
+            for code, result in fetch_ordered(codes, fetch, args.workers):
+                counts[result.pop("status")] += 1
+                if result.get("sha256"):
+                    manifest[code] = result
+            elapsed = time.perf_counter() - start
+            print(f"{label:<28}{elapsed:>9.2f}{PdbFileStub.bytes_sent / 1e6:>10.2f}"
+                  f"{counts['downloaded']:>12}{counts['unchanged']:>11}")
+            return counts
+
+        # Every 10th transfer is cut off half way and has to be resumed
+        PdbFileStub.cut_off = set(codes[::10])
+        first = run("first mirror (10% resumed)")
+        run("repeat")
+        changed = codes[5:len(codes) - 2:20]
+        for code in changed:
+            PdbFileStub.files[code] = make_file(code)
+        again = run(f"repeat, {len(changed)} changed")
+
+        server.shutdown()
+        wrong = [code for code, body in PdbFileStub.files.items()
+                 if file_digest(output / f"{code}.pdb.gz") != hashlib.sha256(body).hexdigest()]
+
+    if first["failed"] or again["downloaded"] != len(changed) or wrong:
+        print(f"\nMISMATCH: {first['failed']} failed, {len(wrong)} files differ from the source")
+        sys.exit(1)
+    print(f"\nAll {len(PdbFileStub.files)} mirrored files match the source; {first['missing']} missing as expected")
+
+
+def bench_structures(args):
+    """Blob size and load time vs gzip + text parsing for compile_structures.py."""
+    import gzip
+    import numpy as np
+    from compile_structures import BLOB_SUFFIX, compile_structure, load_structure, parse_pdb, read_bond_info
+
+    bond_info = read_bond_info()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sources = sorted(args.mirror.glob("*.pdb.gz")) if args.mirror.exists() else []
+        if not sources:
+            samples = Path(__file__).resolve().parent.parent / "standalone" / "src" / "main" / "assets"
+            print(f"No .pdb.gz files in {args.mirror}; using the sample files in {samples}")
+            for path in sorted(samples.glob("*.pdb")):
+                target = tmp / f"{path.stem.lower()}.pdb.gz"
+                target.write_bytes(gzip.compress(path.read_bytes(), 6))
+                sources.append(target)
+
+        blobs = []
+        text_bytes = 0
+        start = time.perf_counter()
+        for source in sources:
+            blob = tmp / (source.name[:-len(".pdb.gz")] + BLOB_SUFFIX)
+            compile_structure(source, blob, bond_info)
+            blobs.append(blob)
+        compile_time = time.perf_counter() - start
+        for source in sources:
+            with gzip.open(source, 'rb') as f:
+                text_bytes += len(f.read())
+        gz_bytes = sum(source.stat().st_size for source in sources)
+        blob_bytes = sum(blob.stat().st_size for blob in blobs)
+
+        def load_text():
+            for source in sources:
+                with gzip.open(source, 'rt', encoding='ascii', errors='replace') as f:
+                    arrays = parse_pdb(f.read(), bond_info)
+                float(arrays["coords"].sum())
+
+        def load_blobs():
+            for blob in blobs:
+                structure = load_structure(blob)
+                # Touch the coordinates and bonds so the pages are really read
+                float(structure["coords"].sum())
+                int(structure["bonds"].sum())
+
+        def best(load):
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                load()
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        atoms = sum(load_structure(blob).atom_count for blob in blobs)
+        print(f"{len(sources)} structures, {atoms} atoms, compiled in {compile_time:.2f} s")
+        print()
+        print(f"{'format':<22}{'MB':>8}{'load s':>10}{'ms/structure':>14}")
+        text_time = best(load_text)
+        blob_time = best(load_blobs)
+        print(f"{'pdb text':<22}{text_bytes / 1e6:>8.2f}{'':>10}{'':>14}")
+        print(f"{'pdb.gz + parse':<22}{gz_bytes / 1e6:>8.2f}{text_time:>10.3f}{text_time / len(sources) * 1e3:>14.2f}")
+        print(f"{'mmap blob':<22}{blob_bytes / 1e6:>8.2f}{blob_time:>10.3f}{blob_time / len(sources) * 1e3:>14.2f}")
+        print(f"\nBlob loading is {text_time / blob_time:.0f}x faster")
+
+        wrong = []
+        for source, blob in zip(sources, blobs):
+            with gzip.open(source, 'rt', encoding='ascii', errors='replace') as f:
+                expected = parse_pdb(f.read(), bond_info)
+            structure = load_structure(blob)
+            if (expected.keys() != structure.arrays.keys()
+                    or not all(np.array_equal(expected[name], structure[name]) for name in expected)):
+                wrong.append(source.name)
+
+    if wrong:
+        print(f"\nMISMATCH: {', '.join(wrong)} differ from a fresh parse")
+        sys.exit(1)
+    print(f"All {len(blobs)} blobs match a fresh parse of their source")
+
+
+def bench_search(args):
+    """Per-keystroke PDB title scans vs the trigram search index of export_assets.py."""
+    from export_assets import MotmDataAsset, build_asset, read_datasets
+
+    datasets = read_datasets()
+    asset = MotmDataAsset(build_asset(datasets))
+    pdb_info = sorted(dict(reversed(datasets["pdb_info"])).items())
+
+    def scan(term):
+        # What PdbInfo.searchPdbInfo did: lowercase every title, contains
+        s = term.lower()
+        return [code for code, title in pdb_info if s in title.lower() or code == s]
+
+    def indexed(term):
+        return asset.search_pdb_info(term)
+
+    words = ["hemoglobin", "ribosome", "insulin", "HIV protease", "dna polymerase",
+             "photosystem", "4hhb", "crispr", "zika", "antibodies"]
+    keystrokes = [word[:n] for word in words for n in range(1, len(word) + 1)]
+    print(f"{len(pdb_info)} PDB titles, {len(keystrokes)} keystrokes over {len(words)} search words")
+    print()
+    print(f"{'method':<16}{'total ms':>10}{'us/keystroke':>14}")
+
+    results = {}
+    for label, search in (("scan", scan), ("trigram index", indexed)):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[label] = [search(term) for term in keystrokes]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{label:<16}{best * 1e3:>10.1f}{best / len(keystrokes) * 1e6:>14.0f}")
+
+    wrong = [term for term, a, b in zip(keystrokes, results["scan"], results["trigram index"]) if a != b]
+    if wrong:
+        print(f"\nMISMATCH: {', '.join(repr(term) for term in wrong)}")
+        sys.exit(1)
+    print(f"\nBoth return the same entries for all {len(keystrokes)} keystrokes")
+
+
+class PublishedMotmStub(StubHandler):
+    """Serves /motm/N (GET and HEAD) for N up to `latest`, 404 after that; counts body bytes."""
+
+    latest = 0
+    page = b""
+    bytes_sent = 0
+
+    def reply(self, with_body: bool):
+        type(self).requests_served += 1
+        time.sleep(self.latency)
+        num = int(self.path.rsplit("/", 1)[1])
+        body = self.page if num <= self.latest else b"not found"
+        self.send_response(200 if num <= self.latest else 404)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            type(self).bytes_sent += len(body)
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self.reply(True)
+
+    def do_HEAD(self):
+        self.reply(False)
+
+
+def legacy_find_latest_motm(last_known: int, base_url: str) -> int:
+    """The previous find_latest_motm: GET each page after last_known until one is missing."""
+    from motm_http import http_get
+
+    num = last_known
+    while http_get(f"{base_url}{num + 1}").status_code == 200:
+        num += 1
+    return num
+
+
+def bench_latest(args):
+    """Linear page fetches vs exponential + binary HEAD probes to find the newest MotM."""
+    import contextlib
+    import io
+    import motm_http
+
+    PublishedMotmStub.latency = args.latency
+    PublishedMotmStub.page = b"<html>" + b"x" * 60000 + b"</html>"
+    server = start_stub_server(PublishedMotmStub)
+    base_url = server_url(server) + "/motm/"
+    motm_http._cache = None
+
+    print(f"Newest known entry {args.known}, stub latency {args.latency * 1e3:.0f} ms")
+    print()
+    print(f"{'new entries':>11}  {'method':<18}{'requests':>9}{'KB sent':>9}{'seconds':>9}")
+
+    wrong = []
+    for new in (0, 1, 3, 12, 60, 250):
+        PublishedMotmStub.latest = args.known + new
+        found = []
+        for label, find in (("linear GET", lambda: legacy_find_latest_motm(args.known, base_url)),
+                            ("exp + binary HEAD",
+                             lambda: motm_http.find_latest_motm(args.known, base_url=base_url))):
+            PublishedMotmStub.requests_served = 0
+            PublishedMotmStub.bytes_sent = 0
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                found.append(find())
+            elapsed = time.perf_counter() - start
+            print(f"{new:>11}  {label:<18}{PublishedMotmStub.requests_served:>9}"
+                  f"{PublishedMotmStub.bytes_sent / 1024:>9.0f}{elapsed:>9.2f}")
+        if found != [PublishedMotmStub.latest] * 2:
+            wrong.append(f"{new} new: found {found}, expected {PublishedMotmStub.latest}")
+
+    server.shutdown()
+    if wrong:
+        print(f"\nMISMATCH: {'; '.join(wrong)}")
+        sys.exit(1)
+    print("\nBoth find the newest entry in every case")
+
+
+def git_commit() -> str:
+    """Short hash of HEAD, with "+" if tracked files have changed; "unknown" outside git."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=SCRIPT_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("+" if dirty else "")
+
+
+# Archive benchmark metrics: (name, higher is better)
+ARCHIVE_METRICS = [
+    ("end_to_end_s", False),
+    ("pages_per_s", True),
+    ("parse_ms_mean", False),
+    ("parse_ms_p95", False),
+    ("extract_molecule_data_ms", False),
+    ("extract_pdb_codes_ms", False),
+    ("categorize_ms", False),
+    ("kotlin_generators_ms", False),
+    ("peak_rss_mb", False),
+]
+
+
+def compare_history(history_path: Path, record: dict, tolerance: float) -> list:
+    """
+    Print record next to the last run of another commit with the same
+    settings; return the names of metrics more than tolerance worse.
+    """
+    previous = None
+    if history_path.exists():
+        with open(history_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["settings"] == record["settings"] and entry["commit"] != record["commit"]:
+                    previous = entry
+
+    print()
+    if previous is None:
+        print(f"{'metric':<28}{record['commit']:>12}")
+        for name, _ in ARCHIVE_METRICS:
+            print(f"{name:<28}{record['metrics'][name]:>12.2f}")
+        print("\nNo earlier run of another commit with the same settings to compare with")
+        return []
+
+    print(f"{'metric':<28}{previous['commit']:>12}{record['commit']:>12}{'change':>9}")
+    regressions = []
+    for name, higher_is_better in ARCHIVE_METRICS:
+        old, new = previous["metrics"][name], record["metrics"][name]
+        change = (new - old) / old if old else 0.0
+        worse = -change if higher_is_better else change
+        flag = ""
+        if worse > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<28}{old:>12.2f}{new:>12.2f}{change:>+9.1%}{flag}")
+    return regressions
+
+
+def bench_archive(args):
+    """End-to-end scrape of a replayed cassette, tracked across commits."""
+    import statistics
+    from functools import partial
+
+    import motm_http
+    from motm_fetch import fetch_ordered, fetch_parse_ordered
+    from motm_http import MOTM_URL_PREFIX, Cassette, ReplayClient
+    from scrape_motm_categories import (categorize_molecules, extract_molecule_data,
+                                        generate_kotlin_category_updates, generate_kotlin_corpus_updates)
+    from scrape_motm_pages import extract_page_data
+    from scrape_pdb_codes import extract_pdb_codes, generate_kotlin_updates
+
+    tmp_dir = None
+    if args.cassette.exists():
+        cassette = Cassette(args.cassette)
+    else:
+        pages = load_pages(args.pages)
+        if not pages:
+            print(f"No cassette {args.cassette} and no saved pages - record one with")
+            print("    python scrape_motm_pages.py 1 315 --no-cache --record motm_cassette.zip")
+            sys.exit(1)
+        # Build a cassette from the saved pages, as if they had been recorded
+        tmp_dir = tempfile.TemporaryDirectory()
+        cassette = Cassette(Path(tmp_dir.name) / "pages.zip")
+        for num, html in pages:
+            response = motm_http.requests.Response()
+            response.status_code = 200
+            response.headers["Content-Type"] = "text/html; charset=utf-8"
+            response._content = html.encode("utf-8")
+            cassette.add("GET", f"{MOTM_URL_PREFIX}{num}", response)
+        cassette.save()
+        print(f"No cassette {args.cassette}: replaying {len(pages)} saved pages")
+
+    # The MotM pages of the cassette, wherever they were recorded from
+    recorded = {}
+    for url in cassette.urls("GET"):
+        match = re.fullmatch(r'(.*/motm/)(\d+)', url)
+        if match and cassette.response("HEAD", url).status_code == 200:
+            recorded.setdefault(match.group(1), []).append(int(match.group(2)))
+    if not recorded:
+        print(f"No MotM pages in {cassette.path}")
+        sys.exit(1)
+    base_url, numbers = max(recorded.items(), key=lambda item: len(item[1]))
+    numbers.sort()
+
+    motm_http._cache = None
+    motm_http._client = ReplayClient(cassette, args.latency)
+
+    def fetch(num):
+        return motm_http.fetch_molecule_page(num, base_url=base_url)
+
+    print(f"{len(numbers)} pages (MotM {numbers[0]}-{numbers[-1]}), {args.workers} fetch threads, "
+          f"{args.parse_workers} parse processes, {args.latency * 1000:.0f} ms replay latency")
+
+    # End to end: fetch, parse, categorize and generate the Kotlin updates
+    start = time.perf_counter()
+    parse = partial(extract_page_data, backend="auto")
+    if args.parse_workers > 0:
+        pages = list(fetch_parse_ordered(numbers, fetch, parse, args.workers, args.parse_workers))
+    else:
+        pages = [(num, parse(html, num)) for num, html in fetch_ordered(numbers, fetch, args.workers)]
+    molecules = [page["molecule"] for _, page in pages if page]
+    pdb_codes = [page["pdb_codes"] for _, page in pages if page]
+    sections, _ = categorize_molecules(molecules)
+    generate_kotlin_category_updates(sections)
+    generate_kotlin_corpus_updates(molecules)
+    generate_kotlin_updates(pdb_codes)
+    end_to_end = time.perf_counter() - start
+
+    # The stages on their own, over the pages in memory
+    htmls = [(num, cassette.response("GET", f"{base_url}{num}").text) for num in numbers]
+
+    def per_page_ms(function) -> list:
+        times = []
+        for num, html in htmls:
+            start = time.perf_counter()
+            function(html, num)
+            times.append((time.perf_counter() - start) * 1e3)
+        return times
+
+    def best_ms(function) -> float:
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            function()
+            elapsed = (time.perf_counter() - start) * 1e3
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    parse_times = per_page_ms(parse)
+    metrics = {
+        "end_to_end_s": end_to_end,
+        "pages_per_s": len(numbers) / end_to_end,
+        "parse_ms_mean": statistics.fmean(parse_times),
+        "parse_ms_p95": sorted(parse_times)[int(0.95 * (len(parse_times) - 1))],
+        "extract_molecule_data_ms": statistics.fmean(per_page_ms(extract_molecule_data)),
+        "extract_pdb_codes_ms": statistics.fmean(per_page_ms(extract_pdb_codes)),
+        "categorize_ms": best_ms(lambda: categorize_molecules(molecules)),
+        "kotlin_generators_ms": best_ms(lambda: (generate_kotlin_category_updates(sections),
+                                                 generate_kotlin_corpus_updates(molecules),
+                                                 generate_kotlin_updates(pdb_codes))),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    if tmp_dir:
+        tmp_dir.cleanup()
+
+    record = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": {"pages": len(numbers), "latency": args.latency, "workers": args.workers,
+                     "parse_workers": args.parse_workers},
+        "metrics": metrics,
+    }
+    regressions = compare_history(args.history, record, args.tolerance)
+    if not args.no_save:
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"\nSaved to {args.history}")
+    if regressions:
+        print(f"\nREGRESSION (more than {args.tolerance:.0%} worse): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process and its finished children in MB (0 where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MotM scraper benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    p = subparsers.add_parser("pdb-info", help=bench_pdb_info.__doc__)
+    p.add_argument("--entries", type=int, default=400)
+    p.add_argument("--batch-size", type=int, default=200)
+    p.add_argument("--latency", type=float, default=0.05,
+                   help="simulated server latency in seconds")
+    p.set_defaults(func=bench_pdb_info)
+
+    p = subparsers.add_parser("parse", help=bench_parse.__doc__)
+    p.add_argument("--pages", type=Path, help="directory of saved MotM pages (default: response cache)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_parse)
+
+    p = subparsers.add_parser("pdb-codes", help=bench_pdb_codes.__doc__)
+    p.add_argument("--pages", type=Path, help="directory of saved MotM pages (default: response cache)")
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_pdb_codes)
+
+    p = subparsers.add_parser("holdings", help=bench_holdings.__doc__)
+    p.add_argument("--entries", type=int, default=230000)
+    p.add_argument("--lookups", type=int, default=20000)
+    p.set_defaults(func=bench_holdings)
+
+    p = subparsers.add_parser("rate", help=bench_rate.__doc__)
+    p.add_argument("--pages", type=int, default=120)
+    p.add_argument("--capacity", type=float, default=20.0,
+                   help="requests/second the stub server accepts before answering 429")
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--latency", type=float, default=0.02,
+                   help="stub server latency in seconds when idle")
+    p.set_defaults(func=bench_rate)
+
+    p = subparsers.add_parser("tls", help=bench_tls.__doc__)
+    p.add_argument("--requests", type=int, default=100)
+    p.add_argument("--latency", type=float, default=0.0,
+                   help="stub server latency in seconds")
+    p.set_defaults(func=bench_tls)
+
+    p = subparsers.add_parser("pipeline", help=bench_pipeline.__doc__)
+    p.add_argument("--pages", type=Path, help="directory of saved MotM pages (default: response cache)")
+    p.add_argument("--count", type=int, default=200, help="number of pages to fetch and parse")
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--parse-workers", type=int, default=os.cpu_count() or 2)
+    p.add_argument("--latency", type=float, default=0.01,
+                   help="stub server latency in seconds")
+    p.set_defaults(func=bench_pipeline)
+
+    p = subparsers.add_parser("mirror", help=bench_mirror.__doc__)
+    p.add_argument("--entries", type=int, default=200)
+    p.add_argument("--size", type=int, default=256, help="approximate compressed file size in KB")
+    p.add_argument("--workers", type=int, default=8)
+    p.add_argument("--latency", type=float, default=0.02,
+                   help="stub server latency in seconds")
+    p.set_defaults(func=bench_mirror)
+
+    p = subparsers.add_parser("structures", help=bench_structures.__doc__)
+    p.add_argument("--mirror", type=Path, default=Path(__file__).parent / "pdb_mirror",
+                   help="PDB mirror directory (default: mirror_pdb_files.py output)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_structures)
+
+    p = subparsers.add_parser("search", help=bench_search.__doc__)
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_search)
+
+    p = subparsers.add_parser("latest", help=bench_latest.__doc__)
+    p.add_argument("--known", type=int, default=313, help="Corpus.numMonths to start from")
+    p.add_argument("--latency", type=float, default=0.02,
+                   help="stub server latency in seconds")
+    p.set_defaults(func=bench_latest)
+
+    p = subparsers.add_parser("archive", help=bench_archive.__doc__)
+    p.add_argument("--cassette", type=Path, default=SCRIPT_DIR / "motm_cassette.zip",
+                   help="recorded responses to replay (default motm_cassette.zip)")
+    p.add_argument("--pages", type=Path,
+                   help="directory of saved MotM pages to use when there is no cassette")
+    p.add_argument("--latency", type=float, default=0.0,
+                   help="seconds to wait before each replayed response")
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--parse-workers", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--history", type=Path, default=HISTORY_PATH,
+                   help=f"results of earlier runs (default {HISTORY_PATH.name})")
+    p.add_argument("--tolerance", type=float, default=0.15,
+                   help="fraction by which a metric may get worse before it counts as a regression")
+    p.add_argument("--no-save", action="store_true", help="do not add this run to the history")
+    p.set_defaults(func=bench_archive)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Compile the mirrored PDB files into binary structure blobs
+
+ParserPdbFile re-parses the PDB text every time a structure is opened and
+rebuilds the CONECT bonds and the BondInfo residue bonds from scratch.
+This script does that work once, offline: every pdb_mirror/<code>.pdb.gz
+(see mirror_pdb_files.py) is parsed the same way - first MODEL only,
+alternate location "A", O5T/O3T skipped, CONECT bonds longer than
+sqrt(20) A rejected, residue bonds from pdbparser's BondInfo.kt, C-N and
+O3'-P links between consecutive residues - and written as
+
+    pdb_structures/<code>.mstr
+    pdb_structures/structures_manifest.json   source SHA-256, sizes
+
+Blob layout (little-endian, version FORMAT_VERSION):
+
+    header    "MOTMSTRC", uint16 version, uint16 section count, uint32 0
+    sections  count x (8s name, 4s dtype, uint32 columns, uint64 offset,
+              uint64 rows)
+    data      each section at a 16-byte aligned offset
+
+    coords    float32 [atoms, 3]
+    serial    int32   [atoms]       PDB atom serial number
+    element   uint8   [atoms]       index into elemtab
+    atomname  uint16  [atoms]       index into atomtab
+    atomflag  uint8   [atoms]       ATOM_HETATM
+    resstart  uint32  [residues+1]  first atom of each residue
+    resname   uint16  [residues]    index into restab
+    resseq    int32   [residues]
+    resicode  uint8   [residues]    insertion code (ASCII)
+    reschain  uint8   [residues]    index into chaintab
+    bonds     uint32  [bonds, 2]    atom index pairs, sorted
+    helix     uint32  [helices, 2]  residue ranges [first, last + 1)
+    sheet     uint32  [strands, 2]  residue ranges [first, last + 1)
+    elemtab, atomtab, restab, chaintab   NUL separated ASCII strings
+
+so a reader maps the file and points its arrays at it without copying
+(load_structure() does that with numpy.frombuffer).
+
+Usage:
+    python compile_structures.py [--mirror DIR] [--output DIR] [--force]
+    python compile_structures.py --info CODE
+
+Example:
+    python compile_structures.py --workers 4
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: Required packages not installed.")
+    print("Run: pip install numpy")
+    sys.exit(1)
+
+MIRROR_DIR = Path(__file__).parent / "pdb_mirror"
+MIRROR_MANIFEST_NAME = "mirror_manifest.json"
+STRUCTURES_DIR = Path(__file__).parent / "pdb_structures"
+MANIFEST_NAME = "structures_manifest.json"
+BOND_INFO_PATH = (Path(__file__).resolve().parent.parent / "pdbparser" / "src" / "main" / "java"
+                  / "com" / "kotmol" / "pdbParser" / "BondInfo.kt")
+
+MAGIC = b"MOTMSTRC"
+FORMAT_VERSION = 1
+BLOB_SUFFIX = ".mstr"
+HEADER = struct.Struct("<8sHHI")
+SECTION = struct.Struct("<8s4sIQQ")
+ALIGNMENT = 16
+
+ATOM_HETATM = 1
+
+# ParserPdbFile.validateBond: CONECT bonds longer than this (squared, A^2) are bad
+MAX_CONECT_DISTANCE_SQUARED = 20.0
+# ParserPdbFile.connectResidues: longest C-N / O3'-P link between residues
+MAX_LINK_DISTANCE = 2.0
+
+STRING_TABLES = {"element": "elemtab", "atomname": "atomtab", "resname": "restab", "reschain": "chaintab"}
+
+BOND_LIST_RE = re.compile(r'val (\w+) = listOf\(')
+BOND_RECORD_RE = re.compile(r'KotmolBondRecord\(\s*atom_1 = "([^"]*)",\s*atom_2 = "([^"]*)"')
+BOND_LOOKUP_RE = re.compile(r'val kotmolBondLookup = hashMapOf\((.*?)\n\s*\)', re.DOTALL)
+BOND_LOOKUP_ENTRY_RE = re.compile(r'"(\w+)" to (\w+)')
+COMMENT_RE = re.compile(r'/\*.*?\*/|//[^\n]*', re.DOTALL)
+
+
+def read_bond_info(path: Path = BOND_INFO_PATH) -> dict:
+    """Residue name (lower case) -> [(atom_1, atom_2), ...] from BondInfo.kt."""
+    text = COMMENT_RE.sub("", path.read_text(encoding="utf-8"))
+    starts = list(BOND_LIST_RE.finditer(text))
+    lists = {}
+    for i, match in enumerate(starts):
+        end = starts[i + 1].start() if i + 1 < len(starts) else len(text)
+        lists[match.group(1)] = BOND_RECORD_RE.findall(text, match.end(), end)
+    lookup = BOND_LOOKUP_RE.search(text)
+    if not lookup:
+        raise ValueError(f"kotmolBondLookup not found in {path}")
+    return {name: lists[list_name] for name, list_name in BOND_LOOKUP_ENTRY_RE.findall(lookup.group(1))}
+
+
+def _int(field: str) -> int:
+    """ParserPdbFile.parseInteger: blank or malformed fields are 0."""
+    try:
+        return int(field)
+    except ValueError:
+        return 0
+
+
+class _Interner:
+    """Strings -> small integer indexes, in order of first appearance."""
+
+    def __init__(self):
+        self.index = {}
+
+    def __call__(self, value: str) -> int:
+        found = self.index.get(value)
+        if found is None:
+            found = self.index[value] = len(self.index)
+        return found
+
+    def table(self) -> bytes:
+        return "\0".join(self.index).encode("ascii", "replace")
+
+
+def parse_pdb(text: str, bond_info: dict) -> dict:
+    """
+    Parse PDB text into the blob arrays (section name -> numpy array).
+
+    Follows ParserPdbFile: ATOM/HETATM/TER/HELIX/SHEET records of the first
+    model and the CONECT records of the whole file.
+    """
+    serials, coords, flags = [], [], []
+    elements, atom_names = _Interner(), _Interner()
+    element_ids, atom_name_ids = [], []
+    res_names, chains = _Interner(), _Interner()
+    res_start, res_name_ids, res_seq, res_icode, res_chain = [], [], [], [], []
+    res_keys = []
+    helices, sheets, conects = [], [], []
+    ter_after = set()
+    last_key = None
+    skip_to_end = False
+
+    for line in text.splitlines():
+        record = line[:6]
+        if record == "CONECT":
+            conects.append(line)
+            continue
+        if skip_to_end:
+            continue
+        if line.startswith("ATOM") or record == "HETATM":
+            if len(line) < 78:
+                line = line.ljust(80)
+            name = line[12:16].strip()
+            if name == "O5T" or name == "O3T":
+                continue
+            if line[16] != " " and line[16] != "A":
+                continue
+            try:
+                xyz = (float(line[30:38]), float(line[38:46]), float(line[46:54]))
+            except ValueError:
+                continue
+            hetatm = record == "HETATM"
+            residue = line[17:20].strip()
+            chain = line[21]
+            seq = _int(line[22:26])
+            icode = line[26]
+            key = (seq, icode, residue, chain, hetatm)
+            if key != last_key or len(serials) in ter_after:
+                res_start.append(len(serials))
+                res_name_ids.append(res_names(residue))
+                res_seq.append(seq)
+                res_icode.append(ord(icode) if icode.isascii() else 32)
+                res_chain.append(chains(chain))
+                res_keys.append(key)
+                last_key = key
+            serials.append(_int(line[6:11]))
+            coords.append(xyz)
+            flags.append(ATOM_HETATM if hetatm else 0)
+            element_ids.append(elements(line[76:78].strip()))
+            atom_name_ids.append(atom_names(name))
+        elif line.startswith("TER"):
+            # A residue never continues across a TER record
+            ter_after.add(len(serials))
+        elif line.startswith("HELIX"):
+            line = line.ljust(80)
+            helices.append((line[19], _int(line[21:25]), line[31], _int(line[33:37])))
+        elif line.startswith("SHEET"):
+            line = line.ljust(80)
+            sheets.append((line[21], _int(line[22:26]), line[32], _int(line[33:37])))
+        elif record == "ENDMDL":
+            skip_to_end = True
+
+    atom_count = len(serials)
+    res_start.append(atom_count)
+    coord_array = np.array(coords, dtype=np.float32).reshape(atom_count, 3)
+    serial_array = np.array(serials, dtype=np.int32)
+    names = list(atom_names.index)
+    name_array = [names[i] for i in atom_name_ids]
+
+    bonds = set()
+
+    def add_bond(a: int, b: int):
+        if a != b:
+            bonds.add((a, b) if a < b else (b, a))
+
+    # CONECT records (ParserPdbFile.parseConect / validateBond)
+    serial_to_index = {}
+    for index, serial in enumerate(serials):
+        serial_to_index.setdefault(serial, index)
+    for line in conects:
+        base = serial_to_index.get(_int(line[6:11]))
+        if base is None:
+            continue
+        for start in (11, 16, 21, 26):
+            other = serial_to_index.get(_int(line[start:start + 5]))
+            if other is None:
+                continue
+            delta = coord_array[base] - coord_array[other]
+            if float(np.dot(delta, delta)) <= MAX_CONECT_DISTANCE_SQUARED:
+                add_bond(base, other)
+
+    # Residue bonds from BondInfo (ParserPdbFile.mapBonds / matchBonds)
+    for r, (_, _, residue, _, hetatm) in enumerate(res_keys):
+        pairs = None if hetatm else bond_info.get(residue.lower())
+        if not pairs:
+            continue
+        in_residue = {}
+        for index in range(res_start[r], res_start[r + 1]):
+            in_residue.setdefault(name_array[index], index)
+        for atom_1, atom_2 in pairs:
+            a, b = in_residue.get(atom_1), in_residue.get(atom_2)
+            if a is not None and b is not None:
+                add_bond(a, b)
+
+    # Links between consecutive residues (ParserPdbFile.connectResidues)
+    last_atom, last_seq = None, 0
+    for r, (seq, _, _, _, hetatm) in enumerate(res_keys):
+        if hetatm:
+            continue
+        for index in range(res_start[r], res_start[r + 1]):
+            name = name_array[index]
+            if name == "O3'" or name == "C":
+                last_atom, last_seq = index, seq
+            elif (name == "P" or name == "N") and last_atom is not None and seq == last_seq + 1:
+                if float(np.linalg.norm(coord_array[index] - coord_array[last_atom])) < MAX_LINK_DISTANCE:
+                    add_bond(index, last_atom)
+                last_atom = None
+
+    # HELIX / SHEET residue ranges
+    residue_index = {}
+    for r, (seq, _, _, chain, hetatm) in enumerate(res_keys):
+        if not hetatm:
+            residue_index.setdefault((chain, seq), r)
+
+    def residue_ranges(records):
+        ranges = []
+        for chain, first, end_chain, last in records:
+            start = residue_index.get((chain, first))
+            end = residue_index.get((end_chain, last))
+            if start is not None and end is not None and end >= start:
+                ranges.append((start, end + 1))
+        return np.array(ranges, dtype=np.uint32).reshape(len(ranges), 2)
+
+    bond_array = np.array(sorted(bonds), dtype=np.uint32).reshape(len(bonds), 2)
+    return {
+        "coords": coord_array,
+        "serial": serial_array,
+        "element": np.array(element_ids, dtype=np.uint8),
+        "atomname": np.array(atom_name_ids, dtype=np.uint16),
+        "atomflag": np.array(flags, dtype=np.uint8),
+        "resstart": np.array(res_start, dtype=np.uint32),
+        "resname": np.array(res_name_ids, dtype=np.uint16),
+        "resseq": np.array(res_seq, dtype=np.int32),
+        "resicode": np.array(res_icode, dtype=np.uint8),
+        "reschain": np.array(res_chain, dtype=np.uint8),
+        "bonds": bond_array,
+        "helix": residue_ranges(helices),
+        "sheet": residue_ranges(sheets),
+        "elemtab": np.frombuffer(elements.table(), dtype=np.uint8),
+        "atomtab": np.frombuffer(atom_names.table(), dtype=np.uint8),
+        "restab": np.frombuffer(res_names.table(), dtype=np.uint8),
+        "chaintab": np.frombuffer(chains.table(), dtype=np.uint8),
+    }
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def encode_structure(arrays: dict) -> bytes:
+    """The blob for a dict of section name -> array."""
+    table_size = HEADER.size + SECTION.size * len(arrays)
+    offset = _align(table_size)
+    entries, chunks = [], []
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        rows = array.shape[0]
+        columns = array.shape[1] if array.ndim > 1 else 1
+        entries.append(SECTION.pack(name.encode("ascii"), array.dtype.str[1:].encode("ascii"),
+                                    columns, offset, rows))
+        data = array.tobytes()
+        chunks.append((offset, data))
+        offset = _align(offset + len(data))
+
+    blob = bytearray(offset)
+    blob[:HEADER.size] = HEADER.pack(MAGIC, FORMAT_VERSION, len(arrays), 0)
+    blob[HEADER.size:table_size] = b"".join(entries)
+    for start, data in chunks:
+        blob[start:start + len(data)] = data
+    return bytes(blob)
+
+
+class Structure:
+    """
+    A memory-mapped structure blob.  Every section is a read-only numpy
+    array that points into the mapping (no copy is made).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, _ = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a structure blob")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} has format version {version}, expected {FORMAT_VERSION}")
+        self.arrays = {}
+        for i in range(count):
+            name, dtype, columns, offset, rows = SECTION.unpack_from(self._data, HEADER.size + i * SECTION.size)
+            array = np.frombuffer(self._data, dtype=np.dtype("<" + dtype.rstrip(b"\0").decode("ascii")),
+                                  count=rows * columns, offset=offset)
+            self.arrays[name.rstrip(b"\0").decode("ascii")] = array.reshape(rows, columns) if columns > 1 else array
+
+    def __getitem__(self, name: str):
+        return self.arrays[name]
+
+    def strings(self, section: str) -> list:
+        """The string table for an index section ("element", "atomname", "resname", "reschain")."""
+        table = self.arrays[STRING_TABLES[section]].tobytes()
+        return table.decode("ascii").split("\0") if table else []
+
+    @property
+    def atom_count(self) -> int:
+        return len(self.arrays["serial"])
+
+    def close(self):
+        # numpy views keep the mapping alive; it is unmapped once they are gone
+        self.arrays = {}
+        self._data = None
+
+
+def load_structure(path: Path) -> Structure:
+    """Map a structure blob; raises ValueError if it is not a current-version blob."""
+    return Structure(path)
+
+
+def compile_structure(source: Path, target: Path, bond_info: dict) -> dict:
+    """Parse source (.pdb or .pdb.gz) and write the blob to target via a temporary file."""
+    opener = gzip.open if source.suffix == ".gz" else open
+    with opener(source, 'rt', encoding='ascii', errors='replace') as f:
+        arrays = parse_pdb(f.read(), bond_info)
+    blob = encode_structure(arrays)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, target)
+    return {"atoms": len(arrays["serial"]), "residues": len(arrays["resname"]),
+            "bonds": len(arrays["bonds"]), "size": len(blob)}
+
+
+_bond_info = None
+
+
+def _init_worker(bond_info):
+    global _bond_info
+    _bond_info = bond_info
+
+
+def _compile_job(job):
+    """Worker process entry point: (code, source, target, source_sha256) -> (code, entry or error)."""
+    code, source, target, sha256 = job
+    try:
+        entry = compile_structure(source, target, _bond_info)
+    except (OSError, ValueError, EOFError) as e:
+        return code, str(e)
+    entry.update(source_sha256=sha256, version=FORMAT_VERSION)
+    return code, entry
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 of a file (the same digest mirror_pdb_files.py records)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_manifest(path: Path, manifest: dict):
+    """Write the manifest via a temporary file."""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def print_info(path: Path):
+    """Print the sections and counts of one blob."""
+    structure = load_structure(path)
+    print(f"{path}: format version {FORMAT_VERSION}, {path.stat().st_size} bytes")
+    for name, array in structure.arrays.items():
+        print(f"  {name:<10}{str(array.dtype):>8}  {' x '.join(str(n) for n in array.shape)}")
+    print(f"  elements: {' '.join(structure.strings('element'))}")
+    print(f"  chains:   {' '.join(structure.strings('reschain'))}")
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Compile mirrored PDB files into binary structure blobs")
+    parser.add_argument("--mirror", type=Path, default=MIRROR_DIR,
+                        help=f"PDB mirror directory (default {MIRROR_DIR})")
+    parser.add_argument("--output", type=Path, default=STRUCTURES_DIR,
+                        help=f"blob directory (default {STRUCTURES_DIR})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of compile processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="recompile every structure")
+    parser.add_argument("--info", metavar="CODE",
+                        help="describe the compiled blob of one PDB code and exit")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.info:
+        path = args.output / f"{args.info.lower()}{BLOB_SUFFIX}"
+        if not path.exists():
+            print(f"Error: {path} not found")
+            sys.exit(1)
+        print_info(path)
+        return
+
+    sources = sorted(args.mirror.glob("*.pdb.gz"))
+    if not sources:
+        print(f"Error: no .pdb.gz files in {args.mirror}")
+        print("Run mirror_pdb_files.py first to download them")
+        sys.exit(1)
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    mirror_manifest = {}
+    if (args.mirror / MIRROR_MANIFEST_NAME).exists():
+        with open(args.mirror / MIRROR_MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            mirror_manifest = json.load(f)
+    manifest_path = args.output / MANIFEST_NAME
+    manifest = {}
+    if manifest_path.exists() and not args.force:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    jobs = []
+    for source in sources:
+        code = source.name[:-len(".pdb.gz")]
+        target = args.output / f"{code}{BLOB_SUFFIX}"
+        sha256 = mirror_manifest.get(code, {}).get("sha256") or _file_digest(source)
+        entry = manifest.get(code, {})
+        if (entry.get("source_sha256") == sha256 and entry.get("version") == FORMAT_VERSION
+                and target.exists() and target.stat().st_size == entry.get("size")):
+            continue
+        jobs.append((code, source, target, sha256))
+
+    print(f"{len(sources)} mirrored structures, {len(jobs)} to compile into {args.output}")
+    print(f"Workers: {args.workers}")
+    print()
+
+    bond_info = read_bond_info()
+    failed = []
+    if args.workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                                 initargs=(bond_info,)) as pool:
+            results = pool.map(_compile_job, jobs, chunksize=4)
+            for i, (code, entry) in enumerate(results):
+                failed += _record(manifest, code, entry, i, len(jobs))
+    else:
+        _init_worker(bond_info)
+        for i, job in enumerate(jobs):
+            code, entry = _compile_job(job)
+            failed += _record(manifest, code, entry, i, len(jobs))
+
+    # Drop blobs whose source left the mirror
+    compiled = {source.name[:-len(".pdb.gz")] for source in sources}
+    for code in sorted(set(manifest) - compiled):
+        del manifest[code]
+        (args.output / f"{code}{BLOB_SUFFIX}").unlink(missing_ok=True)
+    save_manifest(manifest_path, manifest)
+
+    source_bytes = sum(source.stat().st_size for source in sources)
+    blob_bytes = sum(entry["size"] for entry in manifest.values())
+    print(f"\n{len(manifest)} blobs, {blob_bytes / 1e6:.1f} MB "
+          f"(mirror: {source_bytes / 1e6:.1f} MB .pdb.gz)")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\nDone! The blobs are in {args.output}")
+
+
+def _record(manifest: dict, code: str, entry, index: int, total: int) -> list:
+    """Store one compile result; returns [code] if it failed."""
+    if isinstance(entry, str):
+        print(f"  ERROR: {code}: {entry}")
+        manifest.pop(code, None)
+        return [code]
+    manifest[code] = entry
+    print(f"[{index + 1}/{total}] {code}: {entry['atoms']} atoms, {entry['bonds']} bonds, {entry['size']} bytes")
+    return []
+
+
+if __name__ == "__main__":
+    main()
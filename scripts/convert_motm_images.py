@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Convert the MotM illustration TIFs to PNGs with a transparent background
+
+The screensaver and detail view show David Goodsell's Molecule of the
+Month illustrations (CC-BY-4.0, https://pdb101.rcsb.org/motm/motm-image-download)
+as PNGs whose white background has been made transparent for dark mode.
+Turning every white pixel transparent also punches holes in white areas
+inside the molecules, which is why MotmImageDownload.buildMotmImageList
+only uses the first image of each month.
+
+This converter only clears the background: near-white pixels that are
+connected to the image border.  White regions enclosed by the molecule
+stay opaque.  The fill is vectorized with NumPy, alternating row and
+column passes over runs of white pixels until nothing changes.
+
+The image names come from MotmImageDownload.imageList (see
+kotlin_sources.py); each <name>.tif (or .tiff) found in the source
+directory is written to <name>.png in the output directory.  A manifest
+of source hashes in the output directory lets unchanged images be
+skipped on the next run.
+
+Usage:
+    python convert_motm_images.py [--source DIR] [--output DIR] [--jobs N]
+
+Example:
+    python convert_motm_images.py --source ~/motm_tif --output ~/MotmImages/docs/motm_png
+
+Requires: pip install numpy pillow
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("Error: Required packages not installed.")
+    print("Run: pip install numpy pillow")
+    sys.exit(1)
+
+from kotlin_sources import read_image_list
+
+SOURCE_DIR = Path(__file__).parent / "motm_tif"
+OUTPUT_DIR = Path(__file__).parent / "motm_png"
+MANIFEST_NAME = "convert_manifest.json"
+
+# A pixel is background white if every channel is at least this bright
+WHITE_THRESHOLD = 240
+
+# Illustrations are huge TIFs; Pillow's decompression bomb check would refuse them
+Image.MAX_IMAGE_PIXELS = None
+
+
+def _fill_runs(seed, mask):
+    """Grow seed along each row to cover every run of mask pixels it touches."""
+    rows = mask.shape[0]
+    # A False column keeps runs from wrapping onto the next row
+    padded_mask = np.zeros((rows, mask.shape[1] + 1), dtype=bool)
+    padded_mask[:, :-1] = mask
+    padded_seed = np.zeros_like(padded_mask)
+    padded_seed[:, :-1] = seed
+
+    flat_mask = padded_mask.ravel()
+    flat_seed = padded_seed.ravel()
+    starts = flat_mask.copy()
+    starts[1:] &= ~flat_mask[:-1]
+    run_ids = np.cumsum(starts)
+
+    seeded_runs = np.zeros(run_ids[-1] + 1, dtype=bool)
+    seeded_runs[run_ids[flat_seed]] = True
+    filled = flat_mask & seeded_runs[run_ids]
+    return filled.reshape(padded_mask.shape)[:, :-1]
+
+
+def edge_connected(mask):
+    """The pixels of mask that are 4-connected to the image border."""
+    seed = np.zeros_like(mask)
+    seed[0, :] = mask[0, :]
+    seed[-1, :] = mask[-1, :]
+    seed[:, 0] = mask[:, 0]
+    seed[:, -1] = mask[:, -1]
+
+    # Each pass floods whole runs, so this converges in a few passes
+    # (one per turn in the path to the border), not one per pixel
+    count = np.count_nonzero(seed)
+    while True:
+        seed = _fill_runs(seed, mask)
+        seed = _fill_runs(seed.T, mask.T).T
+        new_count = np.count_nonzero(seed)
+        if new_count == count:
+            return seed
+        count = new_count
+
+
+def background_alpha(rgb, threshold: int = WHITE_THRESHOLD):
+    """Alpha channel for an RGB array: 0 for background white, 255 elsewhere."""
+    white = (rgb >= threshold).all(axis=2)
+    return np.where(edge_connected(white), 0, 255).astype(np.uint8)
+
+
+def convert_image(source: Path, target: Path, threshold: int = WHITE_THRESHOLD) -> tuple:
+    """Convert one TIF to a PNG with a transparent background; return (size, cleared fraction)."""
+    with Image.open(source) as image:
+        rgb = np.asarray(image.convert("RGB"))
+    alpha = background_alpha(rgb, threshold)
+    rgba = np.dstack((rgb, alpha))
+
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    Image.fromarray(rgba, "RGBA").save(tmp_path, format="PNG", optimize=True)
+    os.replace(tmp_path, target)
+    return rgb.shape[1::-1], float(np.count_nonzero(alpha == 0)) / alpha.size
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_source(source_dir: Path, name: str) -> Path:
+    """The TIF for an image name, or None."""
+    for suffix in (".tif", ".tiff", ".TIF", ".TIFF"):
+        path = source_dir / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Convert MotM TIFs to PNGs with a transparent background")
+    parser.add_argument("--source", type=Path, default=SOURCE_DIR,
+                        help=f"directory of <name>.tif files (default {SOURCE_DIR})")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR,
+                        help=f"directory for <name>.png files (default {OUTPUT_DIR})")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of conversion processes (default: one per CPU)")
+    parser.add_argument("--threshold", type=int, default=WHITE_THRESHOLD,
+                        help=f"minimum channel value counted as background white (default {WHITE_THRESHOLD})")
+    parser.add_argument("--first-only", action="store_true",
+                        help="only convert the first image of each month")
+    parser.add_argument("--force", action="store_true",
+                        help="convert every image even if its source is unchanged")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    image_list = read_image_list()
+    names = [name for number in sorted(image_list)
+             for name in (image_list[number][:1] if args.first_only else image_list[number])]
+    print(f"imageList: {len(names)} images for {len(image_list)} months")
+
+    manifest_path = args.output / MANIFEST_NAME
+    manifest = {}
+    if manifest_path.exists() and not args.force:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    # Work out what needs converting: source present, and new or changed
+    todo = []
+    missing = []
+    skipped = 0
+    for name in names:
+        source = find_source(args.source, name)
+        if source is None:
+            missing.append(name)
+            continue
+        key = {"sha256": file_sha256(source), "threshold": args.threshold}
+        entry = manifest.get(name, {})
+        if {k: entry.get(k) for k in key} == key and (args.output / f"{name}.png").exists():
+            skipped += 1
+            continue
+        todo.append((name, source, key))
+
+    print(f"Converting {len(todo)} images ({skipped} unchanged, {len(missing)} without a source TIF)")
+    print(f"Jobs: {args.jobs}")
+    print()
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(convert_image, source, args.output / f"{name}.png", args.threshold): (name, key)
+                   for name, source, key in todo}
+        for i, future in enumerate(as_completed(futures)):
+            name, key = futures[future]
+            try:
+                (width, height), cleared = future.result()
+            except Exception as e:
+                print(f"[{i + 1}/{len(todo)}] {name}: ERROR - {e}")
+                failed.append(name)
+                continue
+            manifest[name] = dict(key, size=[width, height], background=round(cleared, 4))
+            print(f"[{i + 1}/{len(todo)}] {name}: {width}x{height}, {cleared:.0%} background")
+
+            # Save as we go so an interrupted run keeps its finished images
+            tmp_path = manifest_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+
+    if missing:
+        print(f"\nNo source TIF for {len(missing)} images, e.g. {', '.join(missing[:5])}")
+    if failed:
+        print(f"\nFailed: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\nDone! PNGs are in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,715 @@
+#!/usr/bin/env python3
+"""
+Export the PDB titles as one compact binary asset
+
+The search screen looks PDB titles up by code and searches them on every
+keystroke (PdbInfo.searchPdbInfo).  This script reads the titles from
+mollib/data/pdb_info.tsv and writes them, with a trigram search index,
+to
+
+    mollib/src/main/assets/motm_data.bin
+
+plus the Kotlin reader for it, MotmDataAsset.kt, so the app can map one
+small file and only decode the titles it looks up.  The titles are only
+in the asset: PdbInfo reads them through MotmDataAsset.  The MotM corpus,
+PDB lists and categories stay Kotlin literals (Corpus.kt, PDBs.kt,
+MotmByCategory.kt), which the scrapers update; the asset holds nothing
+that is also in the dex.  The app stores .bin assets uncompressed
+(motmbrowser/build.gradle.kts) so that AssetManager.openFd can hand out
+a mappable range of the APK.
+
+Asset layout (little-endian, version FORMAT_VERSION):
+
+    header     "MOTMDATA", uint16 version, uint16 table count, uint32 0
+    directory  count x (8s name, uint32 offset, uint32 length)
+    tables     4-byte aligned
+
+    strings    string pool: uint16 UTF-8 length + bytes per string; every
+               distinct string is stored once and referred to by its
+               offset in the pool (NO_STRING = none)
+    pdbinfo    uint32 count, then (4s PDB code, uint32 title) sorted by
+               code, for binary search
+    pgrams     uint32 count, then (uint64 trigram, uint32 ppost byte
+               offset) sorted by trigram, plus an end record (GRAM_END,
+               total bytes); a posting list ends where the next starts
+    ppost      posting lists of the lower case PDB titles (searchPdbInfo):
+               sorted pdbinfo record positions, each stored as the
+               difference to the previous one (the first as position + 1)
+               in LEB128 varint bytes
+
+A trigram key packs three code points, 21 bits each, first one highest.
+Every text ends in two NULs, so each character starts a trigram: a query
+of three or more characters intersects the posting lists of trigrams
+that cover it and checks the candidates with a substring test; a
+shorter query is a prefix, i.e. one contiguous range of the sorted
+trigram keys and so one run of consecutive posting lists.  Candidates
+are checked against the lower cased titles themselves, so the search
+needs no second copy of the texts.  MotM searches stay a scan of the
+Corpus lists (Corpus.searchMotmInfo): a few hundred short strings do not
+pay for an index.
+
+Usage:
+    python export_assets.py [--pdb-info FILE] [--output FILE] [--kotlin FILE] [--check]
+
+Example:
+    python export_assets.py
+
+--check writes nothing: it builds the asset in memory, reads it back
+against pdb_info.tsv and compares it and MotmDataAsset.kt byte for
+byte with the files in the tree, and exits with status 1 if anything
+differs (for CI or a pre-commit hook).
+"""
+
+import argparse
+import os
+import struct
+import sys
+from pathlib import Path
+from string import Template
+
+from kotlin_sources import MOLLIB_DATA_DIR, PDB_INFO_PATH, read_pdb_info
+
+ASSET_PATH = MOLLIB_DATA_DIR.parents[4] / "assets" / "motm_data.bin"
+KOTLIN_PATH = MOLLIB_DATA_DIR / "MotmDataAsset.kt"
+
+MAGIC = b"MOTMDATA"
+FORMAT_VERSION = 6
+HEADER = struct.Struct("<8sHHI")
+DIRECTORY_ENTRY = struct.Struct("<8sII")
+PDB_INFO_RECORD = struct.Struct("<4sI")
+GRAM_RECORD = struct.Struct("<QI")
+ALIGNMENT = 4
+NO_STRING = 0xFFFFFFFF
+MAX_STRING_BYTES = 0xFFFF
+GRAM_BITS = 21
+GRAM_END = (1 << 3 * GRAM_BITS) - 1
+SEARCH_SEPARATOR = "\0"
+
+
+class StringPool:
+    """Interned, length-prefixed UTF-8 strings."""
+
+    def __init__(self):
+        self.offsets = {}
+        self.data = bytearray()
+
+    def add(self, value) -> int:
+        """Pool offset of value (NO_STRING for None), adding it on first use."""
+        if value is None:
+            return NO_STRING
+        offset = self.offsets.get(value)
+        if offset is None:
+            encoded = value.encode("utf-8")
+            if len(encoded) > MAX_STRING_BYTES:
+                raise ValueError(f"string too long for the asset ({len(encoded)} bytes): {value[:40]}...")
+            offset = self.offsets[value] = len(self.data)
+            self.data += struct.pack("<H", len(encoded)) + encoded
+        return offset
+
+
+def read_datasets(pdb_info_path: Path = PDB_INFO_PATH) -> dict:
+    """Every list that goes into the asset: the (code, title) pairs of pdb_info.tsv."""
+    return {"pdb_info": read_pdb_info(pdb_info_path)}
+
+
+def _pdb_code(code: str) -> bytes:
+    encoded = code.lower().encode("ascii")
+    if len(encoded) != 4:
+        raise ValueError(f"not a 4 character PDB code: {code}")
+    return encoded
+
+
+def _counted(records: list, record_struct: struct.Struct, *values) -> bytes:
+    """uint32 count (and any extra header values) followed by the packed records."""
+    header = struct.pack(f"<{1 + len(values)}I", len(records), *values)
+    return header + b"".join(record_struct.pack(*record) for record in records)
+
+
+def normalize(text: str) -> str:
+    """Search form of a text (the app lowercases queries with Locale.ROOT)."""
+    return text.lower()
+
+
+def gram_key(gram: str) -> int:
+    """Trigram key: up to three code points packed from the top (missing ones are 0)."""
+    key = 0
+    for i in range(3):
+        key = (key << GRAM_BITS) | (ord(gram[i]) if i < len(gram) else 0)
+    return key
+
+
+def gram_range(prefix: str) -> tuple:
+    """[low, high) of the keys of all trigrams that start with a one or two character prefix."""
+    low = gram_key(prefix)
+    return low, low + (1 << GRAM_BITS * (3 - len(prefix)))
+
+
+def encode_postings(docs: list) -> bytes:
+    """Sorted document positions as LEB128 varint gaps (the first one is position + 1)."""
+    out = bytearray()
+    previous = -1
+    for doc in docs:
+        gap = doc - previous
+        previous = doc
+        while gap >= 0x80:
+            out.append(gap & 0x7F | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return bytes(out)
+
+
+def decode_postings(data) -> list:
+    """The document positions of one encode_postings list."""
+    docs = []
+    doc, gap, shift = -1, 0, 0
+    for byte in data:
+        gap |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            doc += gap
+            docs.append(doc)
+            gap, shift = 0, 0
+    return docs
+
+
+def search_tables(texts: list) -> tuple:
+    """(grams, postings) tables of the trigram index over normalized texts."""
+    postings = {}
+    for doc, text in enumerate(texts):
+        padded = text + SEARCH_SEPARATOR * 2
+        for i in range(len(text)):
+            if text[i] == SEARCH_SEPARATOR:
+                continue
+            docs = postings.setdefault(gram_key(padded[i:i + 3]), [])
+            if not docs or docs[-1] != doc:
+                docs.append(doc)
+    grams, flat = [], bytearray()
+    for key in sorted(postings):
+        grams.append((key, len(flat)))
+        flat += encode_postings(postings[key])
+    grams.append((GRAM_END, len(flat)))
+    return _counted(grams[:-1], GRAM_RECORD) + GRAM_RECORD.pack(*grams[-1]), bytes(flat)
+
+
+def build_asset(datasets: dict) -> bytes:
+    """Encode the datasets as a MOTMDATA asset."""
+    pool = StringPool()
+
+    info = {}
+    for code, title in datasets["pdb_info"]:
+        if _pdb_code(code) in info:
+            raise ValueError(f"duplicate PDB title entry: {code}")
+        info[_pdb_code(code)] = title
+    pdb_info = [(code, pool.add(info[code])) for code in sorted(info)]
+
+    pgrams, ppost = search_tables([normalize(info[code]) for code in sorted(info)])
+
+    tables = {
+        "pdbinfo": _counted(pdb_info, PDB_INFO_RECORD),
+        "pgrams": pgrams,
+        "ppost": ppost,
+        "strings": bytes(pool.data),
+    }
+
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(tables)
+    directory, body = [], bytearray()
+    for name, data in tables.items():
+        padding = -offset % ALIGNMENT
+        body += b"\0" * padding
+        offset += padding
+        directory.append(DIRECTORY_ENTRY.pack(name.encode("ascii"), offset, len(data)))
+        body += data
+        offset += len(data)
+    return HEADER.pack(MAGIC, FORMAT_VERSION, len(tables), 0) + b"".join(directory) + bytes(body)
+
+
+class MotmDataAsset:
+    """Reader for a MOTMDATA asset (the Python twin of MotmDataAsset.kt)."""
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        magic, version, count, _ = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a MotM data asset")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"asset format version {version}, expected {FORMAT_VERSION}")
+        self.tables = {}
+        for i in range(count):
+            name, offset, length = DIRECTORY_ENTRY.unpack_from(self.data, HEADER.size + i * DIRECTORY_ENTRY.size)
+            self.tables[name.rstrip(b"\0").decode("ascii")] = (offset, length)
+
+    def _table(self, name: str) -> int:
+        return self.tables[name][0]
+
+    def _count(self, name: str) -> int:
+        return struct.unpack_from("<I", self.data, self._table(name))[0]
+
+    def string(self, ref: int):
+        """The pool string at ref (None for NO_STRING)."""
+        if ref == NO_STRING:
+            return None
+        start = self._table("strings") + ref
+        length = struct.unpack_from("<H", self.data, start)[0]
+        return bytes(self.data[start + 2:start + 2 + length]).decode("utf-8")
+
+    def pdb_title(self, code: str):
+        """Binary search pdbinfo for a PDB code; None if it has no entry."""
+        key = code.lower().encode("ascii", "replace")
+        base = self._table("pdbinfo") + 4
+        lo, hi = 0, self._count("pdbinfo")
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, title = PDB_INFO_RECORD.unpack_from(self.data, base + mid * PDB_INFO_RECORD.size)
+            if found == key:
+                return self.string(title)
+            if found < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def pdb_info(self) -> list:
+        """(PDB code, title) pairs sorted by code."""
+        base = self._table("pdbinfo") + 4
+        return [(code.decode("ascii"), self.string(title))
+                for code, title in (PDB_INFO_RECORD.unpack_from(self.data, base + i * PDB_INFO_RECORD.size)
+                                    for i in range(self._count("pdbinfo")))]
+
+    def _gram_index(self, grams: int, count: int, key: int) -> int:
+        """Index of the first trigram record whose key is >= key."""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if GRAM_RECORD.unpack_from(self.data, grams + mid * GRAM_RECORD.size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _postings(self, low: int, high: int) -> list:
+        """
+        Postings of every trigram with a key in [low, high).  The lists of
+        adjacent keys are stored next to each other, so this is one run of
+        lists (with repeats when the range covers more than one trigram).
+        """
+        grams = self._table("pgrams") + 4
+        count = self._count("pgrams")
+        lo = self._gram_index(grams, count, low)
+        hi = self._gram_index(grams, count, high)
+        post = self._table("ppost")
+        docs = []
+        for index in range(lo, hi):
+            first = GRAM_RECORD.unpack_from(self.data, grams + index * GRAM_RECORD.size)[1]
+            end = GRAM_RECORD.unpack_from(self.data, grams + (index + 1) * GRAM_RECORD.size)[1]
+            docs += decode_postings(self.data[post + first:post + end])
+        return docs
+
+    def _title(self, doc: int) -> str:
+        """The PDB title a search document was indexed from."""
+        record = PDB_INFO_RECORD.unpack_from(self.data, self._table("pdbinfo") + 4 + doc * PDB_INFO_RECORD.size)
+        return self.string(record[1])
+
+    def _search(self, term: str) -> list:
+        """Sorted pdbinfo positions of the titles whose normalized text contains term."""
+        query = normalize(term)
+        if not query:
+            return list(range(self._count("pdbinfo")))
+        if len(query) < 3:
+            return sorted(set(self._postings(*gram_range(query))))
+
+        # Trigrams that cover the query without overlapping are enough to
+        # narrow it down; the substring test below does the rest
+        starts = sorted(set(range(0, len(query) - 2, 3)) | {len(query) - 3})
+        lists = []
+        for key in {gram_key(query[i:i + 3]) for i in starts}:
+            docs = self._postings(key, key + 1)
+            if not docs:
+                return []
+            lists.append(docs)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for docs in lists[1:]:
+            candidates.intersection_update(docs)
+        return [doc for doc in sorted(candidates) if query in normalize(self._title(doc))]
+
+    def search_pdb_info(self, term: str) -> list:
+        """PDB codes whose title contains term or that equal it, in code order."""
+        base = self._table("pdbinfo") + 4
+        codes = [PDB_INFO_RECORD.unpack_from(self.data, base + doc * PDB_INFO_RECORD.size)[0].decode("ascii")
+                 for doc in self._search(term)]
+        code = normalize(term)
+        if self.pdb_title(code) is not None and code not in codes:
+            codes = sorted(codes + [code])
+        return codes
+
+
+def search_queries(datasets: dict) -> list:
+    """Queries for --check: the words of every 10th title, their slices, and short and odd ones."""
+    queries = {"", "a", "zq", "dna", "DNA", "hiv-1", "  ", "x-ray", "1hho", "4hhb", "Ribosom"}
+    for _, title in datasets["pdb_info"][::10]:
+        for word in title.split():
+            queries.add(word)
+            queries.add(word[:2])
+            queries.add(word[1:5])
+        queries.add(title[5:14])
+    return sorted(queries)
+
+
+def check_asset(asset: MotmDataAsset, datasets: dict) -> list:
+    """Differences between an asset and the datasets it was built from (empty if none)."""
+    problems = []
+    info = {}
+    for code, title in datasets["pdb_info"]:
+        info.setdefault(code, title)
+    if asset.pdb_info() != sorted(info.items()) or any(asset.pdb_title(code) != title
+                                                       for code, title in info.items()):
+        problems.append("pdbInfoList")
+    # The index must give exactly what a scan of the PDB titles finds
+    pdb_info = sorted(info.items())
+    for query in search_queries(datasets):
+        s = normalize(query)
+        pdb = [code for code, title in pdb_info if s in normalize(title) or code == s]
+        if asset.search_pdb_info(query) != pdb:
+            problems.append(f"searchPdbInfo({query!r})")
+    return problems
+
+
+KOTLIN_TEMPLATE = '''/*
+ *  Copyright 2026 Bammellab / James Andreas
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License
+ */
+
+package com.bammellab.mollib.data
+
+import android.content.res.AssetManager
+import java.io.File
+import java.io.FileInputStream
+import java.nio.ByteBuffer
+import java.nio.ByteOrder
+import java.nio.channels.FileChannel
+import java.nio.charset.StandardCharsets
+import java.util.*
+
+/**
+ * Reader for the MotM data asset (assets/$ASSET_NAME): the PDB titles,
+ * sorted by code, with a trigram search index over them.
+ * The asset is memory mapped and only the records and strings a lookup
+ * touches are decoded.  The application installs one instance at
+ * startup; PdbInfo reads the PDB titles from it.
+ *
+ * Generated by scripts/export_assets.py - do not edit by hand.
+ */
+class MotmDataAsset(private val buffer: ByteBuffer) {
+
+    companion object {
+        const val ASSET_NAME = "$ASSET_NAME"
+        const val FORMAT_VERSION = $FORMAT_VERSION
+        private const val NO_STRING = -1
+
+        @Volatile
+        private var installed: MotmDataAsset? = null
+
+        /**
+         * the instance installed by the application
+         */
+        val current: MotmDataAsset
+            get() = installed ?: error("MotmDataAsset.install has not been called")
+
+        fun install(asset: MotmDataAsset) {
+            installed = asset
+        }
+
+        /**
+         * map the asset straight out of the APK - it is stored uncompressed,
+         * so openFd gives its range of the APK file
+         */
+        fun load(assets: AssetManager): MotmDataAsset {
+            val fd = assets.openFd(ASSET_NAME)
+            return fd.createInputStream().use {
+                MotmDataAsset(it.channel.map(FileChannel.MapMode.READ_ONLY, fd.startOffset, fd.length))
+            }
+        }
+
+        /**
+         * map an asset file, e.g. src/main/assets/$ASSET_NAME in the JVM unit tests
+         */
+        fun load(file: File): MotmDataAsset {
+            return FileInputStream(file).use {
+                MotmDataAsset(it.channel.map(FileChannel.MapMode.READ_ONLY, 0, it.channel.size()))
+            }
+        }
+    }
+
+    private val tables = HashMap<String, Int>()
+
+    init {
+        buffer.order(ByteOrder.LITTLE_ENDIAN)
+        require(ascii(0, 8) == "$MAGIC") { "not a MotM data asset" }
+        val version = buffer.getShort(8).toInt()
+        require(version == FORMAT_VERSION) { "asset format version $$version, expected $$FORMAT_VERSION" }
+        val count = buffer.getShort(10).toInt()
+        for (i in 0 until count) {
+            val entry = $HEADER_SIZE + i * $DIRECTORY_SIZE
+            tables[ascii(entry, 8).trimEnd('\\u0000')] = buffer.getInt(entry + 8)
+        }
+    }
+
+    // absolute reads on a duplicate, so lookups from several threads do not share a position
+    private fun bytesAt(offset: Int, length: Int): ByteArray {
+        val bytes = ByteArray(length)
+        val view = buffer.duplicate()
+        view.position(offset)
+        view.get(bytes)
+        return bytes
+    }
+
+    private fun ascii(offset: Int, length: Int) = String(bytesAt(offset, length), StandardCharsets.US_ASCII)
+
+    private fun table(name: String) = tables[name] ?: error("table $$name missing")
+
+    private fun string(ref: Int): String? {
+        if (ref == NO_STRING) return null
+        val start = table("strings") + ref
+        val length = buffer.getShort(start).toInt() and 0xffff
+        return String(bytesAt(start + 2, length), StandardCharsets.UTF_8)
+    }
+
+    private fun pdbCode(offset: Int) = ascii(offset, 4)
+
+    /**
+     * binary search of the code-sorted pdbinfo table
+     */
+    fun pdbTitle(pdbName: String): String? {
+        val key = pdbName.lowercase(Locale.ROOT)
+        val base = table("pdbinfo")
+        var lo = 0
+        var hi = buffer.getInt(base)
+        while (lo < hi) {
+            val mid = (lo + hi) ushr 1
+            val record = base + 4 + mid * $PDB_INFO_RECORD_SIZE
+            val found = pdbCode(record).compareTo(key)
+            when {
+                found == 0 -> return string(buffer.getInt(record + 4))
+                found < 0 -> lo = mid + 1
+                else -> hi = mid
+            }
+        }
+        return null
+    }
+
+    val pdbInfoCount: Int get() = buffer.getInt(table("pdbinfo"))
+
+    /**
+     * the pdbinfo record at index, 0 until pdbInfoCount, in code order
+     */
+    fun pdbInfoEntry(index: Int): PdbInfo.PdbEntryInfo {
+        val record = table("pdbinfo") + 4 + index * $PDB_INFO_RECORD_SIZE
+        return PdbInfo.PdbEntryInfo(pdbCode(record), string(buffer.getInt(record + 4)) ?: "")
+    }
+
+    /**
+     * PDB codes whose title contains searchTerm or that equal it, in code
+     * order - the entries of PdbInfo.searchPdbInfo
+     */
+    fun searchPdbInfo(searchTerm: String): List<String> {
+        val base = table("pdbinfo") + 4
+        val codes = search(searchTerm).map { pdbCode(base + it * $PDB_INFO_RECORD_SIZE) }
+        val name = searchTerm.lowercase(Locale.ROOT)
+        if (name in codes || pdbTitle(name) == null) return codes
+        return (codes + name).sorted()
+    }
+
+    private fun codePoints(s: String): IntArray {
+        val points = ArrayList<Int>()
+        var i = 0
+        while (i < s.length) {
+            val point = s.codePointAt(i)
+            points.add(point)
+            i += Character.charCount(point)
+        }
+        return points.toIntArray()
+    }
+
+    private fun gramKey(points: IntArray, start: Int, length: Int): Long {
+        var key = 0L
+        for (i in 0 until 3) {
+            key = (key shl $GRAM_BITS) or (if (i < length) points[start + i].toLong() else 0L)
+        }
+        return key
+    }
+
+    private fun gramKeyAt(grams: Int, index: Int) = buffer.getLong(grams + 4 + index * $GRAM_RECORD_SIZE)
+
+    // index of the first trigram whose key is >= key
+    private fun lowerBound(grams: Int, key: Long): Int {
+        var lo = 0
+        var hi = buffer.getInt(grams)
+        while (lo < hi) {
+            val mid = (lo + hi) ushr 1
+            if (gramKeyAt(grams, mid) < key) lo = mid + 1 else hi = mid
+        }
+        return lo
+    }
+
+    private fun postingOffset(grams: Int, index: Int) = buffer.getInt(grams + 4 + index * $GRAM_RECORD_SIZE + 8)
+
+    // postings of every trigram with a key in [low, high): adjacent keys have adjacent lists,
+    // each a run of varint gaps from the previous position (the first from -1)
+    private fun postings(low: Long, high: Long): IntArray {
+        val grams = table("pgrams")
+        val post = table("ppost")
+        val docs = ArrayList<Int>()
+        for (index in lowerBound(grams, low) until lowerBound(grams, high)) {
+            var pos = post + postingOffset(grams, index)
+            val end = post + postingOffset(grams, index + 1)
+            var doc = -1
+            while (pos < end) {
+                var gap = 0
+                var shift = 0
+                do {
+                    val byte = buffer.get(pos++).toInt()
+                    gap = gap or ((byte and 0x7f) shl shift)
+                    shift += 7
+                } while ((byte and 0x80) != 0)
+                doc += gap
+                docs.add(doc)
+            }
+        }
+        return docs.toIntArray()
+    }
+
+    // the PDB title a search document was indexed from
+    private fun title(doc: Int) = string(buffer.getInt(table("pdbinfo") + 4 + doc * $PDB_INFO_RECORD_SIZE + 4))
+
+    private fun intersect(a: IntArray, b: IntArray): IntArray {
+        val out = ArrayList<Int>()
+        var i = 0
+        var j = 0
+        while (i < a.size && j < b.size) {
+            when {
+                a[i] < b[j] -> i++
+                a[i] > b[j] -> j++
+                else -> {
+                    out.add(a[i])
+                    i++
+                    j++
+                }
+            }
+        }
+        return out.toIntArray()
+    }
+
+    /**
+     * sorted pdbinfo positions of the titles that contain searchTerm:
+     * a short term is a range of trigram keys, a longer one the
+     * intersection of its trigrams' posting lists checked with contains
+     */
+    private fun search(searchTerm: String): IntArray {
+        val query = searchTerm.lowercase(Locale.ROOT)
+        if (query.isEmpty()) return IntArray(pdbInfoCount) { it }
+        val points = codePoints(query)
+
+        if (points.size < 3) {
+            val low = gramKey(points, 0, points.size)
+            val found = BitSet()
+            for (doc in postings(low, low + (1L shl $GRAM_BITS * (3 - points.size)))) found.set(doc)
+            val docs = IntArray(found.cardinality())
+            var doc = found.nextSetBit(0)
+            for (k in docs.indices) {
+                docs[k] = doc
+                doc = found.nextSetBit(doc + 1)
+            }
+            return docs
+        }
+
+        // trigrams covering the query without overlap narrow it down, contains does the rest
+        val starts = ((0 until points.size - 2 step 3) + (points.size - 3)).distinct()
+        val lists = starts.map { gramKey(points, it, 3) }.distinct().map { key ->
+            val docs = postings(key, key + 1)
+            if (docs.isEmpty()) return IntArray(0)
+            docs
+        }.sortedBy { it.size }
+        var candidates = lists[0]
+        for (list in lists.drop(1)) candidates = intersect(candidates, list)
+        return candidates.filter { title(it)?.lowercase(Locale.ROOT)?.contains(query) == true }.toIntArray()
+    }
+}
+'''
+
+
+def generate_kotlin(asset_name: str) -> str:
+    """MotmDataAsset.kt with the layout constants of this script filled in."""
+    values = {
+        "ASSET_NAME": asset_name,
+        "FORMAT_VERSION": FORMAT_VERSION,
+        "MAGIC": MAGIC.decode("ascii"),
+        "HEADER_SIZE": HEADER.size,
+        "DIRECTORY_SIZE": DIRECTORY_ENTRY.size,
+        "PDB_INFO_RECORD_SIZE": PDB_INFO_RECORD.size,
+        "GRAM_RECORD_SIZE": GRAM_RECORD.size,
+        "GRAM_BITS": GRAM_BITS,
+    }
+    return Template(KOTLIN_TEMPLATE).substitute(values)
+
+
+def write_file(path: Path, data: bytes):
+    """Write via a temporary file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export the PDB titles as a binary asset")
+    parser.add_argument("--pdb-info", type=Path, default=PDB_INFO_PATH,
+                        help="PDB title list (default: mollib/data/pdb_info.tsv)")
+    parser.add_argument("--output", type=Path, default=ASSET_PATH,
+                        help=f"asset file (default {ASSET_PATH})")
+    parser.add_argument("--kotlin", type=Path, default=KOTLIN_PATH,
+                        help=f"generated Kotlin reader (default {KOTLIN_PATH})")
+    parser.add_argument("--check", action="store_true",
+                        help="write nothing; exit 1 if the asset or the Kotlin reader in the tree is out of date")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    datasets = read_datasets(args.pdb_info)
+    asset = build_asset(datasets)
+    kotlin = generate_kotlin(args.output.name).encode("utf-8")
+
+    reader = MotmDataAsset(asset)
+    print(f"{len(reader.pdb_info())} PDB titles")
+
+    if args.check:
+        problems = check_asset(reader, datasets)
+        if problems:
+            print(f"Error: the asset does not match the source lists: {', '.join(problems)}")
+            sys.exit(1)
+        stale = [path for path, data in ((args.output, asset), (args.kotlin, kotlin))
+                 if not path.exists() or path.read_bytes() != data]
+        if stale:
+            print(f"Error: out of date (run export_assets.py): {', '.join(str(path) for path in stale)}")
+            sys.exit(1)
+        print(f"Check: {args.output.name} ({len(asset)} bytes) and {args.kotlin.name} are up to date")
+        return
+
+    write_file(args.output, asset)
+    write_file(args.kotlin, kotlin)
+    print(f"Wrote {args.output}: {len(asset)} bytes ({args.pdb_info.name}: {args.pdb_info.stat().st_size} bytes)")
+    print(f"Wrote {args.kotlin}")
+
+
+if __name__ == "__main__":
+    main()
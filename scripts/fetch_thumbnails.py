@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Download and resize the MotM thumbnails named in molecule_data.json
+
+scrape_motm_categories.py records each page's og:image URL as
+thumbnail_hint.  This script downloads those images on a pool of fetch
+threads and resizes them in worker processes (fetch_parse_ordered in
+motm_fetch.py) for the Android density buckets of a 100dp thumbnail:
+
+    motm_thumbnail/<name>                      the file the app loads (xxhdpi)
+    motm_thumbnail/<bucket>/<stem>.png|.webp   mdpi ... xxxhdpi
+
+<name> is thumbnail_filename() from scrape_motm_categories.py, the same
+name that corpus_updates.txt and merge_kotlin.py put in
+motmThumbnailImageList.
+
+Downloads go through the shared response cache (see motm_http.py), and a
+manifest of source SHA-256 hashes in the output directory means an image
+whose content has not changed is never resized again.
+
+Usage:
+    python fetch_thumbnails.py [--output DIR] [--workers N] [--jobs N]
+
+Requires: pip install pillow
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    print("Error: Required packages not installed.")
+    print("Run: pip install pillow")
+    sys.exit(1)
+
+from motm_fetch import TokenBucket, fetch_parse_ordered, host_rate_limiter
+from motm_http import (add_cache_arguments, add_client_arguments, configure_cache, configure_client,
+                       http_get)
+from scrape_motm_categories import thumbnail_filename
+
+OUTPUT_DIR = Path(__file__).parent / "motm_thumbnail"
+MANIFEST_NAME = "thumbnail_manifest.json"
+
+# Thumbnail size in dp and the Android density buckets (scale factors)
+THUMBNAIL_DP = 100
+DENSITY_BUCKETS = {
+    "mdpi": 1.0,
+    "hdpi": 1.5,
+    "xhdpi": 2.0,
+    "xxhdpi": 3.0,
+    "xxxhdpi": 4.0,
+}
+# Bucket copied to motm_thumbnail/<name>, the file the app loads by URL
+APP_BUCKET = "xxhdpi"
+WEBP_QUALITY = 85
+
+
+def fetch_image(mol: dict, output_dir: Path, manifest: dict, limiter=None, force: bool = False):
+    """
+    Download a thumbnail hint.
+
+    Returns {"digest", "body"}, with body None if the image content matches
+    the manifest and its outputs exist; returns None if the download failed.
+    """
+    try:
+        response = http_get(mol["thumbnail_hint"], limiter=limiter)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"  ERROR: Failed to fetch thumbnail for {mol['number']}: {e}")
+        return None
+
+    body = response.content
+    digest = hashlib.sha256(body).hexdigest()
+    name = thumbnail_filename(mol)
+    if not force and manifest.get(name, {}).get("sha256") == digest and (output_dir / name).exists():
+        return {"digest": digest, "body": None}
+    return {"digest": digest, "body": body}
+
+
+def resize_image(fetched: dict, mol: dict, output_dir: Path) -> dict:
+    """Write every density bucket of one thumbnail; runs in a worker process."""
+    name = thumbnail_filename(mol)
+    result = {"sha256": fetched["digest"], "source": mol["thumbnail_hint"]}
+    if fetched["body"] is None:
+        return dict(result, unchanged=True)
+
+    try:
+        with Image.open(io.BytesIO(fetched["body"])) as image:
+            image.load()
+            mode = "RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB"
+            image = image.convert(mode)
+    except (OSError, ValueError) as e:
+        return dict(result, error=f"not a readable image: {e}")
+    result["size"] = list(image.size)
+
+    stem = name[:-len(".png")]
+    for bucket, scale in DENSITY_BUCKETS.items():
+        box = round(THUMBNAIL_DP * scale)
+        # Fit inside the box, never enlarge
+        factor = min(1.0, box / max(image.size))
+        size = (max(1, round(image.width * factor)), max(1, round(image.height * factor)))
+        resized = image.resize(size, Image.LANCZOS) if size != image.size else image
+
+        bucket_dir = output_dir / bucket
+        bucket_dir.mkdir(parents=True, exist_ok=True)
+        _save(resized, bucket_dir / f"{stem}.png", format="PNG", optimize=True)
+        _save(resized, bucket_dir / f"{stem}.webp", format="WEBP", quality=WEBP_QUALITY, method=6)
+        if bucket == APP_BUCKET:
+            _save(resized, output_dir / name, format="PNG", optimize=True)
+    return result
+
+
+def _save(image, path: Path, **options):
+    """Save an image via a temporary name so a partial file is never left behind."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    image.save(tmp_path, **options)
+    os.replace(tmp_path, path)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Download and resize MotM thumbnails")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR,
+                        help=f"thumbnail directory (default {OUTPUT_DIR})")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="number of concurrent download threads (default 4)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of resize processes (default: one per CPU)")
+    parser.add_argument("--rate", type=float, default=5.0,
+                        help="starting request rate in requests/second (default 5)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="keep --rate fixed instead of adapting it to server responses")
+    parser.add_argument("--force", action="store_true",
+                        help="resize every image even if its content is unchanged")
+    add_cache_arguments(parser)
+    add_client_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    configure_cache(args)
+    configure_client(args)
+    script_dir = Path(__file__).parent
+
+    molecule_file = script_dir / "molecule_data.json"
+    if not molecule_file.exists():
+        print(f"Error: {molecule_file} not found")
+        print("Run scrape_motm_categories.py first to generate this file")
+        sys.exit(1)
+    with open(molecule_file, 'r', encoding='utf-8') as f:
+        all_molecules = json.load(f)
+
+    molecules = [mol for mol in all_molecules if mol.get("thumbnail_hint")]
+    print(f"Found {len(molecules)} thumbnail hints in {len(all_molecules)} molecules")
+    print()
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    manifest_path = args.output / MANIFEST_NAME
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    first_url = molecules[0]["thumbnail_hint"] if molecules else ""
+    limiter = TokenBucket(args.rate) if args.fixed_rate else host_rate_limiter(first_url, args.rate)
+
+    def fetch(mol):
+        return fetch_image(mol, args.output, manifest, limiter, args.force)
+
+    resize = partial(resize_image, output_dir=args.output)
+    failed = []
+    unchanged = 0
+    for mol, result in fetch_parse_ordered(molecules, fetch, resize, args.workers, args.jobs):
+        name = thumbnail_filename(mol)
+        print(f"Thumbnail {mol['number']}...", end=" ", flush=True)
+        if result is None:
+            print("FAILED")
+            failed.append(mol["number"])
+            continue
+        if "error" in result:
+            print(f"ERROR: {result['error']}")
+            failed.append(mol["number"])
+            continue
+        if result.pop("unchanged", False):
+            unchanged += 1
+            print(f"unchanged - {name}")
+            continue
+        manifest[name] = result
+        print(f"OK - {name} ({result['size'][0]}x{result['size'][1]})")
+
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+
+    print(f"\n{len(molecules) - len(failed) - unchanged} resized, {unchanged} unchanged, {len(failed)} failed")
+    if failed:
+        print(f"Failed: {', '.join(map(str, failed))}")
+    print(f"\nDone! Thumbnails are in {args.output}; the filenames match corpus_updates.txt")
+
+
+if __name__ == "__main__":
+    main()
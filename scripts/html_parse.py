@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+HTML parser backends for the MotM page extractors
+
+BeautifulSoup can build its tree with the pure-Python 'html.parser' or
+with lxml, which is several times faster.  parse_page() picks lxml when
+it is installed ("auto") and can also build a strained tree that holds
+only what extract_molecule_data looks at: anchors, meta tags, h1, title
+and the related-resources / introduction divs.
+
+extract_pdb_codes scans the text of the whole page, so it always needs a
+full tree; only the parser choice applies to it.
+
+    pip install lxml      (optional)
+"""
+
+from bs4 import BeautifulSoup
+
+try:
+    from bs4.filter import ElementFilter
+except ImportError:
+    # beautifulsoup4 < 4.13 has no tag creation hook; strained parses
+    # fall back to a full tree
+    ElementFilter = None
+
+try:
+    import lxml  # noqa: F401
+    HAVE_LXML = True
+except ImportError:
+    HAVE_LXML = False
+
+PARSER_BACKENDS = ["auto", "html.parser", "lxml"]
+
+MOLECULE_TAGS = {"a", "meta", "h1", "title"}
+MOLECULE_DIV_CLASSES = {"related-resources", "introduction"}
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Map a backend name to the BeautifulSoup parser that will be used."""
+    if backend == "auto":
+        return "lxml" if HAVE_LXML else "html.parser"
+    if backend == "lxml" and not HAVE_LXML:
+        raise ValueError("lxml parser requested but lxml is not installed (pip install lxml)")
+    return backend
+
+
+if ElementFilter is not None:
+    class MoleculeTagFilter(ElementFilter):
+        """Only build the tags extract_molecule_data reads, with their contents."""
+
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            if name in MOLECULE_TAGS:
+                return True
+            if name == "div" and attrs:
+                classes = attrs.get("class") or ""
+                if isinstance(classes, str):
+                    classes = classes.split()
+                return not MOLECULE_DIV_CLASSES.isdisjoint(classes)
+            return False
+
+        def allow_string_creation(self, string: str) -> bool:
+            return False
+else:
+    MoleculeTagFilter = None
+
+
+def parse_page(html: str, backend: str = "auto", molecule_tags_only: bool = False) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree for a MotM page.
+
+    With molecule_tags_only the tree only holds the elements used by
+    extract_molecule_data, which skips most of the tree building work.
+    """
+    parser = resolve_backend(backend)
+    if molecule_tags_only and MoleculeTagFilter is not None:
+        return BeautifulSoup(html, parser, parse_only=MoleculeTagFilter())
+    return BeautifulSoup(html, parser)
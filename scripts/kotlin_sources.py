@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Read the MotM data already present in the mollib Kotlin sources
+
+The app data lives in Kotlin list literals under
+mollib/src/main/java/com/bammellab/mollib/data:
+
+- Corpus.kt: numMonths, the number of the latest MotM entry
+- PDBs.kt: pdbList, MotmToPdbMap(motmNumber, "pdb") pairs
+- MotmImageDownload.kt: imageList, "N" month markers each followed by the
+  names of that month's illustrations ("N-Name-variant")
+- MotmByCategory.kt: motmTabLabels and the MotmCategory* arrays of
+  section names, category names and MotM numbers
+
+The PDB entry titles are not compiled into the app: they are kept in
+mollib/data/pdb_info.tsv, one "code<TAB>title" line per entry, and only
+ship inside the data asset built by export_assets.py.
+
+The scrapers use these to work out which MotM numbers and PDB codes are
+new or missing (--incremental).  Entries that are commented out (obsolete
+or CIF-only structures; '#' entry lines in pdb_info.tsv) count as known
+so they are not fetched again.
+"""
+
+import re
+from pathlib import Path
+
+MOLLIB_DIR = Path(__file__).resolve().parent.parent / "mollib"
+MOLLIB_DATA_DIR = MOLLIB_DIR / "src" / "main" / "java" / "com" / "bammellab" / "mollib" / "data"
+PDB_INFO_PATH = MOLLIB_DIR / "data" / "pdb_info.tsv"
+
+NUM_MONTHS_RE = re.compile(r'const val numMonths\s*=\s*(\d+)')
+MOTM_TO_PDB_RE = re.compile(r'MotmToPdbMap\(\s*(\d+)\s*,\s*"([0-9A-Za-z]{4})"\s*\)')
+PDB_INFO_LINE_RE = re.compile(r'(#?)([0-9A-Za-z]{4})\t(.*)')
+IMAGE_LIST_RE = re.compile(r'val imageList = listOf\((.*?)\n\s*\)', re.DOTALL)
+STRING_RE = re.compile(r'"([^"\\]*)"')
+KOTLIN_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "0": "\0"}
+CATEGORY_ARRAY_RE = re.compile(r'val (MotmCategory\w+) = arrayOf\(')
+
+
+def _is_commented(text: str, pos: int) -> bool:
+    """True if the match at pos is behind a // line comment."""
+    line_start = text.rfind("\n", 0, pos) + 1
+    return "//" in text[line_start:pos]
+
+
+def unescape_kotlin_string(s: str) -> str:
+    """The value of a Kotlin string literal body (the reverse of escape_kotlin_string)."""
+    if "\\" not in s:
+        return s
+    out = []
+    i = 0
+    while i < len(s):
+        c = s[i]
+        if c == "\\" and i + 1 < len(s):
+            i += 1
+            c = s[i]
+            if c == "u":
+                out.append(chr(int(s[i + 1:i + 5], 16)))
+                i += 4
+            else:
+                out.append(KOTLIN_ESCAPES.get(c, c))
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out)
+
+
+def read_string_literals(text: str, header: str) -> list:
+    """
+    The string literals inside the list literal that starts with header,
+    e.g. 'val corpus = listOf('.
+
+    Comments are skipped, so commented-out entries do not count; nested
+    calls (PdbEntryInfo("...", "...")) contribute their strings in order.
+    """
+    start = text.find(header)
+    if start < 0:
+        raise ValueError(f"'{header}' not found")
+    i = start + len(header)
+    depth = 1
+    values = []
+    while i < len(text) and depth:
+        c = text[i]
+        if c == '"':
+            end = i + 1
+            while text[end] != '"':
+                end += 2 if text[end] == "\\" else 1
+            values.append(unescape_kotlin_string(text[i + 1:end]))
+            i = end
+        elif text.startswith("//", i):
+            i = text.find("\n", i)
+            if i < 0:
+                break
+        elif text.startswith("/*", i):
+            i = text.find("*/", i) + 1
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        i += 1
+    return values
+
+
+def read_num_months(data_dir: Path = MOLLIB_DATA_DIR) -> int:
+    """Return Corpus.numMonths."""
+    text = (data_dir / "Corpus.kt").read_text(encoding="utf-8")
+    match = NUM_MONTHS_RE.search(text)
+    if not match:
+        raise ValueError("numMonths not found in Corpus.kt")
+    return int(match.group(1))
+
+
+def read_pdb_list(data_dir: Path = MOLLIB_DATA_DIR, include_commented: bool = False) -> list:
+    """Return the (motm_number, pdb_code) pairs of PDBs.pdbList."""
+    text = (data_dir / "PDBs.kt").read_text(encoding="utf-8")
+    return [(int(m.group(1)), m.group(2).lower())
+            for m in MOTM_TO_PDB_RE.finditer(text)
+            if include_commented or not _is_commented(text, m.start())]
+
+
+def read_pdb_info_entries(path: Path = PDB_INFO_PATH) -> list:
+    """Return (pdb_code, title, disabled) for every entry line of pdb_info.tsv, in file order."""
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = PDB_INFO_LINE_RE.fullmatch(line.rstrip("\n"))
+            if match:
+                entries.append((match.group(2).lower(), match.group(3), bool(match.group(1))))
+    return entries
+
+
+def read_pdb_info_codes(path: Path = PDB_INFO_PATH, include_commented: bool = False) -> set:
+    """Return the PDB codes that have an entry in pdb_info.tsv."""
+    return {code for code, _, disabled in read_pdb_info_entries(path) if include_commented or not disabled}
+
+
+def motm_numbers_without_pdbs(data_dir: Path = MOLLIB_DATA_DIR) -> list:
+    """MotM numbers up to numMonths that have no MotmToPdbMap entry at all."""
+    known = {num for num, _ in read_pdb_list(data_dir, include_commented=True)}
+    return [num for num in range(1, read_num_months(data_dir) + 1) if num not in known]
+
+
+def pdb_codes_without_info(pdb_codes, data_dir: Path = MOLLIB_DATA_DIR,
+                           pdb_info_path: Path = PDB_INFO_PATH) -> list:
+    """
+    Sorted PDB codes that have no pdb_info.tsv entry yet.
+
+    Candidates are the given codes plus every active code in PDBs.pdbList,
+    which also picks up older entries that never had their info added.
+    """
+    candidates = {code.lower() for code in pdb_codes}
+    candidates.update(code for _, code in read_pdb_list(data_dir))
+    known = read_pdb_info_codes(pdb_info_path, include_commented=True)
+    return sorted(candidates - known)
+
+
+def read_image_list(data_dir: Path = MOLLIB_DATA_DIR) -> dict:
+    """
+    Return MotmImageDownload.imageList as {motm_number: [image names]}.
+
+    Image names keep the list order, so the first name for a month is the
+    one the screensaver shows.  Commented-out entries are skipped.
+    """
+    text = (data_dir / "MotmImageDownload.kt").read_text(encoding="utf-8")
+    match = IMAGE_LIST_RE.search(text)
+    if not match:
+        raise ValueError("imageList not found in MotmImageDownload.kt")
+
+    images = {}
+    for line in match.group(1).split("\n"):
+        code = line.split("//", 1)[0]
+        for name in STRING_RE.findall(code):
+            number = int(name.split("-", 1)[0])
+            if number and "-" in name:
+                images.setdefault(number, []).append(name)
+    return images
+
+
+def read_pdb_info(path: Path = PDB_INFO_PATH) -> list:
+    """Return the (pdb_code, title) pairs of the active pdb_info.tsv entries, in file order."""
+    return [(code, title) for code, title, disabled in read_pdb_info_entries(path) if not disabled]
+
+
+def read_corpus(data_dir: Path = MOLLIB_DATA_DIR) -> dict:
+    """
+    Return the Corpus.kt lists: {"corpus": titles, "motmTagLines": tag lines,
+    "motmThumbnailImageList": thumbnail names}, each in list order
+    (position 0 is MotM 1).
+    """
+    text = (data_dir / "Corpus.kt").read_text(encoding="utf-8")
+    return {
+        "corpus": read_string_literals(text, "val corpus = listOf("),
+        "motmTagLines": read_string_literals(text, "val motmTagLines = arrayOf("),
+        "motmThumbnailImageList": read_string_literals(text, "val motmThumbnailImageList = listOf("),
+    }
+
+
+def read_categories(data_dir: Path = MOLLIB_DATA_DIR) -> tuple:
+    """
+    Return (motmTabLabels, {array name: entries}) from MotmByCategory.kt.
+
+    Array entries are kept as they are in the source: "Section ..."
+    headers, category names and MotM numbers (as strings).
+    """
+    text = (data_dir / "MotmByCategory.kt").read_text(encoding="utf-8")
+    labels = read_string_literals(text, "val motmTabLabels = listOf(")
+    arrays = {m.group(1): read_string_literals(text, m.group(0)) for m in CATEGORY_ARRAY_RE.finditer(text)}
+    return labels, arrays
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Merge scraped MotM data directly into the mollib Kotlin sources
+
+Instead of pasting the *_updates.txt snippets by hand, this script reads
+the scraper outputs and edits the Kotlin list literals (and the PDB title
+list) in place:
+
+- PDBs.kt: MotmToPdbMap entries from pdb_codes.json
+- mollib/data/pdb_info.tsv: code<TAB>title lines from pdb_info.json
+- PdbSizeArray.kt: PdbEntrySize entries from pdb_size.json (generated
+  data, so changed sizes replace the old entries; the file is created
+  on the first merge that has sizes)
+- Corpus.kt: numMonths, corpus titles, motmTagLines and
+  motmThumbnailImageList from molecule_data.json
+- MotmByCategory.kt: category membership from molecule_data.json
+
+Every existing entry is parsed first (commented-out entries included, so
+obsolete structures are not re-added) and new entries are checked against
+sets of what is already there.  New entries are inserted in sorted
+position and each file is rewritten at most once.  Running the merge
+again with the same inputs changes nothing.
+
+Usage:
+    python merge_kotlin.py [--dry-run] [--data-dir DIR] [--pdb-info FILE]
+
+Review the result with git diff before committing, then run
+export_assets.py to regenerate the binary data asset from the merged lists.
+"""
+
+import argparse
+import json
+import re
+import sys
+from bisect import bisect_right
+from pathlib import Path
+
+from kotlin_sources import MOLLIB_DATA_DIR, MOTM_TO_PDB_RE, NUM_MONTHS_RE, PDB_INFO_LINE_RE, PDB_INFO_PATH
+from scrape_motm_categories import CATEGORY_SECTIONS, SECTION_ARRAY_NAMES, canonical_category, thumbnail_filename
+from scrape_pdb_info import escape_kotlin_string, format_pdb_info_entry, format_pdb_size_entry
+
+MONTH_ABBREVIATIONS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+PDB_SIZE_ENTRY_RE = re.compile(r'PdbEntrySize\(\s*"([0-9A-Za-z]{4})"\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+CORPUS_ENTRY_RE = re.compile(r'/\* //motm/(\d+) \*/')
+
+# PdbSizeArray.kt is created on the first merge that has sizes to write.
+# It gets the license header of PDBs.kt, its generated sibling.
+PDB_SIZE_HEADER_SOURCE = "PDBs.kt"
+PDB_SIZE_TEMPLATE = """\
+package com.bammellab.mollib.data
+
+import java.util.*
+
+/**
+ * Structure sizes for the PDB entries in PdbInfo, so the renderer can
+ * pick the constrained memory path for a large structure before it is
+ * downloaded.
+ *
+ * Generated by scripts/scrape_pdb_info.py --sizes and merged in by
+ * scripts/merge_kotlin.py - do not edit by hand.
+ */
+object PdbSize {
+
+    /**
+     * @param atomCount deposited atom count
+     * @param polymerEntityCount number of distinct polymer entities
+     * @param downloadBytes size of the .pdb.gz at URLs.RCSB_PDB_DOWNLOAD,
+     *      0 if the entry is only available as mmCIF
+     */
+    data class PdbEntrySize(
+        val pdbName: String,
+        val atomCount: Int,
+        val polymerEntityCount: Int,
+        val downloadBytes: Int
+    )
+
+    /**
+     * the size entry for a PDB name, or null if it has not been scraped
+     */
+    fun lookupPdbSize(pdbName: String): PdbEntrySize? {
+        return pdbSizeMap[pdbName.lowercase(Locale.ROOT)]
+    }
+
+    fun obtainPdbSizeList(): List<PdbEntrySize> {
+        return pdbSizeList
+    }
+
+    private val pdbSizeMap by lazy { pdbSizeList.associateBy { it.pdbName } }
+
+    private val pdbSizeList = listOf<PdbEntrySize>(
+    )
+}
+"""
+STRING_ENTRY_RE = re.compile(r'\s*"((?:[^"\\]|\\.)*)"')
+
+
+def motm_month(motm_number: int) -> str:
+    """Publication month of a MotM entry, e.g. 'Mar 2026' (MotM 1 = Jan 2000)."""
+    return f"{MONTH_ABBREVIATIONS[(motm_number - 1) % 12]} {(motm_number - 1) // 12 + 2000}"
+
+
+def split_line_comment(line: str) -> tuple:
+    """Split a Kotlin source line into (code, // comment), ignoring // in strings and /* */."""
+    in_string = False
+    in_block = False
+    i = 0
+    while i < len(line):
+        if in_block:
+            if line.startswith("*/", i):
+                in_block = False
+                i += 1
+        elif in_string:
+            if line[i] == "\\":
+                i += 1
+            elif line[i] == '"':
+                in_string = False
+        elif line[i] == '"':
+            in_string = True
+        elif line.startswith("/*", i):
+            in_block = True
+            i += 1
+        elif line.startswith("//", i):
+            return line[:i], line[i:]
+        i += 1
+    return line, ""
+
+
+def ensure_trailing_comma(line: str) -> str:
+    """Add the separating comma after a list entry that was the last one."""
+    code, comment = split_line_comment(line)
+    stripped = code.rstrip()
+    if not stripped.strip() or stripped.endswith((",", "(")):
+        return line
+    return stripped + "," + code[len(stripped):] + comment
+
+
+def indent_of(line: str) -> str:
+    """Leading whitespace of a line."""
+    return line[:len(line) - len(line.lstrip())]
+
+
+def find_block(lines: list, header: str) -> tuple:
+    """Line range (start, end) of a list literal: the header line and its closing ')' line."""
+    for start, line in enumerate(lines):
+        if header in line:
+            for end in range(start + 1, len(lines)):
+                if lines[end].strip() == ")":
+                    return start, end
+    raise ValueError(f"'{header}' list not found")
+
+
+def apply_insertions(lines: list, insertions: dict) -> list:
+    """
+    Build the new file lines.
+
+    insertions maps a line index to the lines to insert before it.  The
+    nearest list entry before each insertion point gets a trailing comma.
+    """
+    for index in sorted(insertions, reverse=True):
+        before = index - 1
+        while before >= 0 and not split_line_comment(lines[before])[0].strip():
+            before -= 1
+        if before >= 0:
+            lines[before] = ensure_trailing_comma(lines[before])
+        lines[index:index] = insertions[index]
+    return lines
+
+
+def merge_pdb_list(text: str, pairs: list, titles: dict) -> tuple:
+    """Merge (motm_number, pdb_code) pairs into PDBs.kt."""
+    lines = text.split("\n")
+    start, end = find_block(lines, "val pdbList = listOf(")
+
+    keys = []
+    key_lines = []
+    indent = "            "
+    for i in range(start + 1, end):
+        match = MOTM_TO_PDB_RE.search(lines[i])
+        if match:
+            keys.append((int(match.group(1)), match.group(2).lower()))
+            key_lines.append(i)
+            if "//" not in lines[i][:match.start()]:
+                indent = indent_of(lines[i])
+    known = set(keys)
+    known_months = {num for num, _ in keys}
+
+    insertions = {}
+    added = []
+    for num, code in sorted(set((num, code.lower()) for num, code in pairs)):
+        if (num, code) in known:
+            continue
+        pos = bisect_right(keys, (num, code))
+        index = key_lines[pos - 1] + 1 if pos else start + 1
+        new_lines = insertions.setdefault(index, [])
+        if num not in known_months:
+            # First entry of a new month gets a header comment
+            new_lines += ["", f"{indent}// MotM {num} - {titles.get(num, '')} ({motm_month(num)})".rstrip()]
+            known_months.add(num)
+        new_lines.append(f'{indent}MotmToPdbMap({num}, "{code}"),')
+        known.add((num, code))
+        added.append((num, code))
+
+    return "\n".join(apply_insertions(lines, insertions)), added
+
+
+def merge_pdb_info(text: str, all_info: list) -> tuple:
+    """Merge code<TAB>title lines into pdb_info.tsv (fetch errors are skipped)."""
+    lines = text.split("\n")
+
+    keys = []
+    entry_lines = []
+    for index, line in enumerate(lines):
+        match = PDB_INFO_LINE_RE.fullmatch(line)
+        if match:
+            keys.append(match.group(2).lower())
+            entry_lines.append(index)
+    known = set(keys)
+
+    insertions = {}
+    added = []
+    for info in sorted(all_info, key=lambda x: x["pdb_code"].lower()):
+        code = info["pdb_code"].lower()
+        if info.get("error") or code in known:
+            continue
+        pos = bisect_right(keys, code)
+        index = entry_lines[pos - 1] + 1 if pos else entry_lines[0] if entry_lines else len(lines)
+        insertions.setdefault(index, []).append(format_pdb_info_entry(info))
+        known.add(code)
+        added.append(code)
+
+    # Plain lines, so no separators to fix up (unlike apply_insertions)
+    for index in sorted(insertions, reverse=True):
+        lines[index:index] = insertions[index]
+    return "\n".join(lines), added
+
+
+def merge_pdb_sizes(text: str, all_sizes: list) -> tuple:
+    """Merge PdbEntrySize entries into PdbSizeArray.kt, replacing entries whose size changed."""
+    lines = text.split("\n")
+    start, end = find_block(lines, "val pdbSizeList = listOf<PdbEntrySize>(")
+
+    entries = {}
+    for line in lines[start + 1:end]:
+        match = PDB_SIZE_ENTRY_RE.search(line)
+        if match:
+            code, atoms, entities, download = match.groups()
+            entries[code.lower()] = {"pdb_code": code.lower(), "atom_count": int(atoms),
+                                     "polymer_entity_count": int(entities), "download_bytes": int(download)}
+
+    added = []
+    for size in all_sizes:
+        code = size["pdb_code"].lower()
+        if size.get("error"):
+            continue
+        size = {key: size[key] for key in ("atom_count", "polymer_entity_count", "download_bytes")}
+        size["pdb_code"] = code
+        if entries.get(code) != size:
+            entries[code] = size
+            added.append(code)
+    if not added:
+        return text, added
+
+    body = [format_pdb_size_entry(entries[code]) for code in sorted(entries)]
+    body[-1] = body[-1].rstrip(",")
+    return "\n".join(lines[:start + 1] + body + lines[end:]), added
+
+
+def new_pdb_size_file(data_dir: Path) -> str:
+    """A PdbSizeArray.kt with an empty pdbSizeList, headed like the other generated data files."""
+    text = (data_dir / PDB_SIZE_HEADER_SOURCE).read_text(encoding="utf-8")
+    return text[:text.index("package ")] + PDB_SIZE_TEMPLATE
+
+
+def merge_corpus(text: str, all_molecules: list) -> tuple:
+    """Append new MotM entries to the Corpus.kt lists and update numMonths."""
+    lines = text.split("\n")
+    molecules = {mol["number"]: mol for mol in all_molecules}
+
+    # corpus titles: numbered by their /* //motm/N */ comments
+    start, end = find_block(lines, "val corpus = listOf(")
+    numbers = [int(m.group(1)) for m in map(CORPUS_ENTRY_RE.search, lines[start + 1:end]) if m]
+    last = max(numbers, default=0)
+    new_numbers = []
+    while last + 1 + len(new_numbers) in molecules:
+        new_numbers.append(last + 1 + len(new_numbers))
+    if not new_numbers:
+        return text, []
+
+    insertions = {}
+    corpus_lines = []
+    for num in new_numbers:
+        title = escape_kotlin_string(molecules[num]["title"])
+        corpus_lines.append(f'        /* //motm/{num} */ "{title}",  // {motm_month(num).upper()}')
+    insertions[end] = corpus_lines
+
+    # motmTagLines: one string per month in order, no numbers
+    start, end = find_block(lines, "val motmTagLines = arrayOf(")
+    count = sum(1 for line in lines[start + 1:end] if STRING_ENTRY_RE.match(line))
+    tagline_lines = []
+    for num in new_numbers:
+        if num == count + 1:
+            tagline = escape_kotlin_string(molecules[num]["tagline"])
+            tagline_lines.append(f'        "{tagline}", // {motm_month(num)}')
+            count += 1
+    if tagline_lines:
+        insertions[end] = tagline_lines
+
+    # motmThumbnailImageList: "N-....png" names, after the last entry
+    start, end = find_block(lines, "val motmThumbnailImageList = listOf(")
+    thumb_numbers = set()
+    last_entry = start
+    for i in range(start + 1, end):
+        match = STRING_ENTRY_RE.match(lines[i])
+        if match:
+            thumb_numbers.add(int(match.group(1).split("-", 1)[0]))
+            last_entry = i
+    thumb_lines = [f'        "{thumbnail_filename(molecules[num])}",'
+                   for num in new_numbers if num not in thumb_numbers]
+    if thumb_lines:
+        insertions[last_entry + 1] = thumb_lines
+
+    lines = apply_insertions(lines, insertions)
+    text = "\n".join(lines)
+    match = NUM_MONTHS_RE.search(text)
+    if match:
+        text = text[:match.start(1)] + str(new_numbers[-1]) + text[match.end(1):]
+    return text, new_numbers
+
+
+def parse_category_arrays(lines: list) -> dict:
+    """
+    Parse the MotmByCategory arrays.
+
+    Returns {array_name: (start, end, categories)} where categories maps a
+    lowercased category name to [name_line, [(title, number, line), ...]].
+    """
+    arrays = {}
+    for array_name in SECTION_ARRAY_NAMES.values():
+        start, end = find_block(lines, f"val {array_name} = arrayOf(")
+        categories = {}
+        current = None
+        for i in range(start + 1, end):
+            match = STRING_ENTRY_RE.match(lines[i])
+            if not match:
+                continue
+            value = match.group(1)
+            if value.isdigit():
+                if current is not None:
+                    title = split_line_comment(lines[i])[1].lstrip("/ ").strip()
+                    current[1].append((title.lower(), value, i))
+            elif value.startswith("Section "):
+                current = None
+            else:
+                current = categories.setdefault(value.lower(), [i, [], value])
+        arrays[array_name] = (start, end, categories)
+    return arrays
+
+
+def category_entry_line(number: str, title: str) -> str:
+    """A MotmByCategory number entry, e.g. '"146",  // Title'."""
+    return ('        ' + f'"{number}",'.ljust(8) + f'// {title}').rstrip()
+
+
+def merge_categories(text: str, all_molecules: list) -> tuple:
+    """Merge MotM category membership into MotmByCategory.kt."""
+    lines = text.split("\n")
+    arrays = parse_category_arrays(lines)
+
+    # line index -> [(title, entry line)], and (array, category) -> new block entries
+    new_entries = {}
+    new_categories = {}
+    added = []
+    unknown = set()
+    for mol in sorted(all_molecules, key=lambda x: x["number"]):
+        number = str(mol["number"])
+        title = mol["title"]
+        for category in mol["categories"]:
+            section = CATEGORY_SECTIONS.get(category)
+            if not section:
+                unknown.add(category)
+                continue
+            array_name = SECTION_ARRAY_NAMES[section]
+            categories = arrays[array_name][2]
+            # Site names that are aliases of an existing block merge into it
+            category = canonical_category(category)
+            block = categories.get(category.lower())
+
+            if block is None:
+                entries = new_categories.setdefault((array_name, category.lower()), [category, {}])[1]
+                if number not in entries:
+                    entries[number] = title
+                    added.append((category, number))
+                continue
+
+            name_line, entries, name = block
+            if any(entry[1] == number for entry in entries):
+                continue
+            pos = bisect_right([entry[0] for entry in entries], title.lower())
+            index = entries[pos - 1][2] + 1 if pos else name_line + 1
+            new_entries.setdefault(index, []).append((title.lower(), category_entry_line(number, title)))
+            added.append((name, number))
+
+    insertions = {index: [line for _, line in sorted(entries)] for index, entries in new_entries.items()}
+
+    # New categories get their own block in alphabetical position
+    for (array_name, key), (category, entries) in sorted(new_categories.items()):
+        start, end, categories = arrays[array_name]
+        names = sorted(categories)
+        pos = bisect_right(names, key)
+        block = [f'        "{category}",']
+        block += [category_entry_line(number, title)
+                  for number, title in sorted(entries.items(), key=lambda x: x[1].lower())]
+        if pos < len(names):
+            insertions.setdefault(categories[names[pos]][0], []).extend(block + [""])
+        else:
+            last = end - 1
+            while not lines[last].strip():
+                last -= 1
+            insertions.setdefault(last + 1, []).extend([""] + block)
+
+    for category in sorted(unknown):
+        print(f"  Skipped unknown category (needs a CATEGORY_SECTIONS mapping): {category}")
+    return "\n".join(apply_insertions(lines, insertions)), added
+
+
+def load_json(path: Path) -> list:
+    """Load a scraper output file, or an empty list if it does not exist."""
+    if not path.exists():
+        print(f"  {path.name} not found - skipping")
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge scraped MotM data into the mollib Kotlin sources")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change, write nothing")
+    parser.add_argument("--data-dir", type=Path, default=MOLLIB_DATA_DIR,
+                        help="mollib data package directory")
+    parser.add_argument("--pdb-info", type=Path, default=PDB_INFO_PATH,
+                        help="PDB title list (default: mollib/data/pdb_info.tsv)")
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    all_molecules = load_json(script_dir / "molecule_data.json")
+    pdb_codes = load_json(script_dir / "pdb_codes.json")
+    all_info = load_json(script_dir / "pdb_info.json")
+    all_sizes = load_json(script_dir / "pdb_size.json")
+
+    titles = {mol["number"]: mol["title"] for mol in all_molecules}
+    pairs = [(mol["number"], code) for mol in pdb_codes for code in mol.get("pdb_codes", [])]
+
+    merges = [
+        (args.data_dir / "PDBs.kt", lambda text: merge_pdb_list(text, pairs, titles)),
+        (args.pdb_info, lambda text: merge_pdb_info(text, all_info)),
+        (args.data_dir / "PdbSizeArray.kt", lambda text: merge_pdb_sizes(text, all_sizes)),
+        (args.data_dir / "Corpus.kt", lambda text: merge_corpus(text, all_molecules)),
+        (args.data_dir / "MotmByCategory.kt", lambda text: merge_categories(text, all_molecules)),
+    ]
+
+    for path, merge in merges:
+        filename = path.name
+        if filename == "PdbSizeArray.kt" and not path.exists():
+            # Created on the first merge that has sizes, never shipped empty
+            if not any(not size.get("error") for size in all_sizes):
+                print(f"{filename}: no sizes to merge - not created")
+                continue
+            text = ""
+            new_text, added = merge(new_pdb_size_file(args.data_dir))
+        else:
+            if not path.exists():
+                print(f"Error: {path} not found")
+                sys.exit(1)
+            text = path.read_text(encoding="utf-8")
+            new_text, added = merge(text)
+        print(f"{filename}: {len(added)} new entries")
+        if new_text != text and not args.dry_run:
+            path.write_text(new_text, encoding="utf-8")
+
+    if args.dry_run:
+        print("\nDry run - no files written")
+    else:
+        print("\nDone! Review the changes with git diff")
+
+
+if __name__ == "__main__":
+    main()
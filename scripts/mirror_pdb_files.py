@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Mirror the PDB files of every MotM structure
+
+The app downloads each structure from RCSB_PDB_DOWNLOAD when it is
+viewed; the captureimages workflow needs all of them locally.  This
+script fetches <code>.pdb.gz for every entry of PDBs.pdbList (or of
+pdb_codes.json with --from-json) on a pool of download threads and keeps
+them compressed in the mirror directory:
+
+    pdb_mirror/<code>.pdb.gz
+    pdb_mirror/mirror_manifest.json   SHA-256, size, ETag, Last-Modified
+
+Downloads are written to <code>.pdb.gz.part and continued with an HTTP
+Range request if a run is interrupted.  Every finished file is checked
+(length, gzip CRC) before it replaces the old copy.  On the next run an
+entry whose file matches the manifest is only revalidated with a
+conditional request (If-None-Match / If-Modified-Since), so a repeat of
+the whole mirror moves almost no data.
+
+Entries that have no PDB format file (only mmCIF, e.g. large ribosomes)
+are listed as missing; see PdbSizeArray.kt (downloadBytes 0).
+
+Usage:
+    python mirror_pdb_files.py [--output DIR] [--workers N] [--from-json]
+
+Example:
+    python mirror_pdb_files.py --workers 8 --verify
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from pathlib import Path
+
+try:
+    import requests
+except ImportError:
+    print("Error: Required packages not installed.")
+    print("Run: pip install requests")
+    sys.exit(1)
+
+from kotlin_sources import read_pdb_list
+from motm_fetch import TokenBucket, fetch_ordered, host_rate_limiter
+from motm_http import add_client_arguments, configure_client, http_send, retry_delay
+from scrape_pdb_info import RCSB_PDB_DOWNLOAD
+
+MIRROR_DIR = Path(__file__).parent / "pdb_mirror"
+MANIFEST_NAME = "mirror_manifest.json"
+CHUNK_SIZE = 1 << 14
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def check_gzip(path: Path):
+    """Raise ValueError unless path is a complete gzip file (CRC and length checked)."""
+    try:
+        with gzip.open(path, 'rb') as f:
+            while f.read(1 << 20):
+                pass
+    except (OSError, EOFError, zlib.error) as e:
+        raise ValueError(f"corrupt gzip: {e}") from e
+
+
+def download_pdb(code: str, output_dir: Path, entry: dict, limiter=None, retries: int = 3,
+                 download_url: str = RCSB_PDB_DOWNLOAD) -> dict:
+    """
+    Bring <code>.pdb.gz up to date.
+
+    entry is the manifest entry from the last run (or {}).  Returns the
+    new manifest entry with "status" set to "unchanged", "downloaded",
+    "missing" (404) or "failed".
+    """
+    url = f"{download_url}{code}.pdb.gz"
+    target = output_dir / f"{code}.pdb.gz"
+    part = output_dir / f"{code}.pdb.gz.part"
+
+    for attempt in range(retries):
+        # The file is already gzip; ask for it as is
+        headers = {"Accept-Encoding": "identity"}
+        have_current = entry.get("sha256") and target.exists() and target.stat().st_size == entry.get("size")
+        offset = part.stat().st_size if part.exists() else 0
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            # Only continue the partial file if it is still the same version
+            if entry.get("partial_etag"):
+                headers["If-Range"] = entry["partial_etag"]
+        elif have_current:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = http_send("GET", url, timeout=60, limiter=limiter, headers=headers, stream=True)
+            try:
+                if response.status_code == 304 and have_current:
+                    return dict(entry, status="unchanged")
+                if response.status_code == 404:
+                    return {"status": "missing"}
+                if response.status_code == 416:
+                    # The partial file is no longer valid; start over
+                    part.unlink()
+                    continue
+                response.raise_for_status()
+
+                etag = response.headers.get("ETag")
+                if response.status_code == 206:
+                    mode = 'ab'
+                else:
+                    mode = 'wb'
+                    offset = 0
+                # Remember which version the partial file belongs to
+                entry = dict(entry, partial_etag=etag)
+                with open(part, mode) as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+            finally:
+                response.close()
+
+            length = response.headers.get("Content-Length")
+            size = part.stat().st_size
+            if length and length.isdigit() and size != offset + int(length):
+                raise requests.ConnectionError(f"truncated: {size} of {offset + int(length)} bytes")
+            try:
+                check_gzip(part)
+            except ValueError:
+                # Not resumable: the bytes on disk are wrong
+                part.unlink()
+                raise
+            os.replace(part, target)
+            return {"status": "downloaded", "sha256": file_digest(target), "size": size,
+                    "etag": etag, "last_modified": response.headers.get("Last-Modified"), "url": url}
+        except (requests.RequestException, ValueError) as e:
+            if attempt < retries - 1:
+                # The .part file stays, so the retry continues where this one
+                # stopped; a transfer that was making progress resumes at once
+                continue_at = part.stat().st_size if part.exists() else 0
+                print(f"  Retry {attempt + 1} for {code} at byte {continue_at}: {type(e).__name__}")
+                if continue_at <= offset:
+                    time.sleep(retry_delay(attempt, e if isinstance(e, requests.RequestException) else None))
+            else:
+                print(f"  ERROR: Failed to download {code}: {e}")
+    return dict(entry, status="failed")
+
+
+def verify_mirror(output_dir: Path, manifest: dict) -> list:
+    """Codes whose file is missing or does not match its manifest SHA-256."""
+    bad = []
+    for code, entry in sorted(manifest.items()):
+        if not entry.get("sha256"):
+            continue
+        path = output_dir / f"{code}.pdb.gz"
+        if not path.exists() or path.stat().st_size != entry["size"] or file_digest(path) != entry["sha256"]:
+            bad.append(code)
+    return bad
+
+
+def save_manifest(path: Path, manifest: dict):
+    """Write the manifest via a temporary file."""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def mirror_codes(args) -> list:
+    """Sorted PDB codes to mirror."""
+    if args.from_json:
+        path = Path(__file__).parent / "pdb_codes.json"
+        if not path.exists():
+            print(f"Error: {path} not found")
+            print("Run scrape_pdb_codes.py first to generate this file")
+            sys.exit(1)
+        with open(path, 'r', encoding='utf-8') as f:
+            return sorted({code.lower() for mol in json.load(f) for code in mol.get("pdb_codes", [])})
+    return sorted({code for _, code in read_pdb_list()})
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Mirror the .pdb.gz files of the MotM structures")
+    parser.add_argument("--output", type=Path, default=MIRROR_DIR,
+                        help=f"mirror directory (default {MIRROR_DIR})")
+    parser.add_argument("--from-json", action="store_true",
+                        help="mirror the codes in pdb_codes.json instead of PDBs.pdbList")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="number of concurrent download threads (default 8)")
+    parser.add_argument("--rate", type=float, default=5.0,
+                        help="starting request rate in requests/second (default 5)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="keep --rate fixed instead of adapting it to server responses")
+    parser.add_argument("--download-url", default=RCSB_PDB_DOWNLOAD,
+                        help="PDB file download prefix, e.g. a local test server")
+    parser.add_argument("--verify", action="store_true",
+                        help="re-hash every mirrored file against the manifest first")
+    parser.add_argument("--force", action="store_true",
+                        help="download every file again")
+    add_client_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    configure_client(args)
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = args.output / MANIFEST_NAME
+    manifest = {}
+    if manifest_path.exists() and not args.force:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    if args.verify:
+        bad = verify_mirror(args.output, manifest)
+        print(f"Verified {len(manifest)} files: {len(bad)} missing or changed on disk")
+        for code in bad:
+            del manifest[code]
+
+    codes = mirror_codes(args)
+    print(f"Mirroring {len(codes)} PDB entries to {args.output}")
+    print(f"Workers: {args.workers}")
+    print()
+
+    limiter = TokenBucket(args.rate) if args.fixed_rate else host_rate_limiter(args.download_url, args.rate)
+
+    def fetch(code):
+        return download_pdb(code, args.output, manifest.get(code, {}), limiter,
+                            download_url=args.download_url)
+
+    counts = {"unchanged": 0, "downloaded": 0, "missing": 0, "failed": 0}
+    missing = []
+    failed = []
+    downloaded_bytes = 0
+    for i, (code, result) in enumerate(fetch_ordered(codes, fetch, args.workers)):
+        status = result.pop("status")
+        counts[status] += 1
+        if status == "missing":
+            missing.append(code)
+            manifest.pop(code, None)
+        elif status == "failed":
+            failed.append(code)
+            # Keep the partial_etag so the next run can continue the download
+            if code in manifest or result.get("partial_etag"):
+                manifest[code] = result
+        else:
+            manifest[code] = result
+        if status == "downloaded":
+            downloaded_bytes += result["size"]
+            print(f"[{i + 1}/{len(codes)}] {code}: {result['size']} bytes")
+            save_manifest(manifest_path, manifest)
+
+    save_manifest(manifest_path, manifest)
+    print(f"\n{counts['downloaded']} downloaded ({downloaded_bytes / 1e6:.1f} MB), "
+          f"{counts['unchanged']} unchanged, {counts['missing']} without a PDB file, {counts['failed']} failed")
+    if missing:
+        print(f"No .pdb.gz (mmCIF only?): {', '.join(missing)}")
+    if failed:
+        print(f"Failed: {', '.join(failed)} - run again to continue")
+        sys.exit(1)
+    print(f"\nDone! The mirror is in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Concurrent fetch helpers shared by the MotM scrapers
+
+- TokenBucket: thread-safe limiter that keeps a global request rate
+  no matter how many worker threads are fetching
+- AdaptiveRateLimiter: a TokenBucket whose rate follows the server (AIMD):
+  it creeps up while responses are fast and halves on 429/503, pausing
+  every worker for the Retry-After time (or a jittered backoff)
+- HostRateLimiter: one adaptive limiter per host, so pdb101.rcsb.org and
+  data.rcsb.org each get their own budget
+- fetch_ordered: runs a fetch function on a thread pool and yields the
+  results in the same order as the input (molecule order)
+- fetch_parse_ordered: the same, with parsing moved to a pool of worker
+  processes so BeautifulSoup tree building is not held to one core by the
+  GIL; fetch threads and parse processes form a bounded pipeline
+
+The scrapers pass a limiter into their fetch functions so that every
+HTTP attempt, including retries, draws from the same budget.  http_get()
+reports the status code, latency and Retry-After of every response back
+to the limiter.
+"""
+
+import email.utils
+import queue
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+# Default global request rate (requests per second) for pdb101.rcsb.org
+DEFAULT_RATE = 1.0
+
+# Starting request rate per host; AdaptiveRateLimiter moves from here
+HOST_RATES = {
+    "pdb101.rcsb.org": DEFAULT_RATE,
+    "data.rcsb.org": 5.0,
+    "cdn.rcsb.org": 5.0,
+    "files.rcsb.org": 5.0,
+}
+
+# Status codes that mean "slow down"
+THROTTLE_STATUS = (429, 503)
+
+MAX_BACKOFF = 60.0
+
+_DONE = object()
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by all worker threads."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+    def for_url(self, url: str):
+        """The limiter to use for a URL (a plain bucket covers every host)."""
+        return self
+
+    def feedback(self, status_code: int, latency: float, retry_after: float = None):
+        """Response report from http_get; a fixed-rate bucket ignores it."""
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket with an AIMD-controlled rate.
+
+    - a fast successful response adds `increase` requests/second, up to
+      max_rate
+    - a 429/503 halves the rate and pauses every caller for the
+      Retry-After time, or a jittered exponential backoff if there is none
+    - other server errors, connection failures and responses slower than
+      slow_factor x the usual latency cut the rate by a quarter
+
+    The rate never drops below min_rate.  With rate <= 0 (unlimited) only
+    the Retry-After pauses apply.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = None,
+                 max_rate: float = None, increase: float = None, slow_factor: float = 3.0):
+        super().__init__(rate, burst)
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.increase = increase if increase is not None else rate / 10
+        self.slow_factor = slow_factor
+        self.typical_latency = None
+        self.throttled = 0
+        self.pause_until = 0.0
+
+    def acquire(self):
+        """Wait out any server-requested pause, then take a token."""
+        while True:
+            with self.lock:
+                wait_time = self.pause_until - time.monotonic()
+            if wait_time <= 0:
+                break
+            time.sleep(wait_time)
+        super().acquire()
+
+    def feedback(self, status_code: int, latency: float, retry_after: float = None):
+        """Adjust the rate from one response (status_code None = no response)."""
+        with self.lock:
+            if status_code in THROTTLE_STATUS:
+                self.throttled += 1
+                delay = retry_after if retry_after is not None else backoff_delay(self.throttled - 1)
+                self.pause_until = max(self.pause_until, time.monotonic() + delay)
+                self._set_rate(self.rate * 0.5)
+                return
+            self.throttled = 0
+
+            slow = (self.typical_latency is not None
+                    and latency > self.slow_factor * self.typical_latency)
+            if status_code is None or status_code >= 500 or slow:
+                self._set_rate(self.rate * 0.75)
+            else:
+                self._set_rate(self.rate + self.increase)
+
+            if status_code is not None and status_code < 500:
+                # Exponentially weighted average of normal response times
+                if self.typical_latency is None:
+                    self.typical_latency = latency
+                elif not slow:
+                    self.typical_latency += 0.2 * (latency - self.typical_latency)
+
+    def _set_rate(self, rate: float):
+        if self.rate > 0:
+            self.rate = min(self.max_rate, max(self.min_rate, rate))
+
+
+class HostRateLimiter:
+    """One AdaptiveRateLimiter per host, each starting from its own rate."""
+
+    def __init__(self, rates: dict = None, default_rate: float = DEFAULT_RATE):
+        self.rates = dict(HOST_RATES)
+        self.rates.update(rates or {})
+        self.default_rate = default_rate
+        self.limiters = {}
+        self.lock = threading.Lock()
+
+    def for_url(self, url: str) -> AdaptiveRateLimiter:
+        """The limiter for the host of a URL, created on first use."""
+        host = urlparse(url).hostname or ""
+        with self.lock:
+            if host not in self.limiters:
+                self.limiters[host] = AdaptiveRateLimiter(self.rates.get(host, self.default_rate))
+            return self.limiters[host]
+
+
+def host_rate_limiter(url: str, rate: float) -> HostRateLimiter:
+    """Per-host limiter where the host of url (the one a script talks to) starts at rate."""
+    return HostRateLimiter({urlparse(url).hostname or "": rate}, default_rate=rate)
+
+
+def backoff_delay(attempt: int, base: float = 1.0) -> float:
+    """Exponential backoff with jitter: base * 2**attempt, scaled by 0.5-1.5."""
+    return min(MAX_BACKOFF, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def parse_retry_after(value: str) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def fetch_ordered(items, fetch, workers: int = 1):
+    """
+    Call fetch(item) for every item using a pool of worker threads.
+
+    Yields (item, result) tuples in input order.  Only a small window of
+    requests is kept in flight so results are handed on as soon as the
+    next item in order has completed.
+    """
+    items = iter(items)
+
+    if workers <= 1:
+        for item in items:
+            yield item, fetch(item)
+        return
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for item in items:
+            pending.append((item, pool.submit(fetch, item)))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            item, future = pending.popleft()
+            result = future.result()
+            next_item = next(items, _DONE)
+            if next_item is not _DONE:
+                pending.append((next_item, pool.submit(fetch, next_item)))
+            yield item, result
+
+
+def fetch_parse_ordered(items, fetch, parse, workers: int = 1, parse_workers: int = 1,
+                        depth: int = None):
+    """
+    Fetch items on worker threads and parse them in worker processes.
+
+    fetch(item) returns the raw page (or None on failure) and runs in one
+    of `workers` threads.  parse(raw, item) runs in one of `parse_workers`
+    processes, so it must be picklable (a module-level function or a
+    functools.partial of one) and should return a small result.
+
+    Yields (item, result) tuples in input order; result is None when the
+    fetch failed.  At most `depth` items are anywhere in the pipeline at
+    once (being fetched, queued, parsed or waiting for their turn), so
+    memory stays flat however long the range is.
+    """
+    depth = depth or 2 * (workers + parse_workers)
+    slots = threading.Semaphore(depth)
+    fetched = queue.Queue(maxsize=depth + workers)
+    source = enumerate(items)
+    source_lock = threading.Lock()
+    stop = threading.Event()
+
+    def produce():
+        while not stop.is_set():
+            if not slots.acquire(timeout=0.1):
+                continue
+            with source_lock:
+                entry = next(source, None)
+            if entry is None:
+                slots.release()
+                break
+            index, item = entry
+            try:
+                fetched.put((index, item, fetch(item), None))
+            except Exception as e:
+                fetched.put((index, item, None, e))
+        fetched.put(_DONE)
+
+    producers = [threading.Thread(target=produce, daemon=True) for _ in range(max(1, workers))]
+    for thread in producers:
+        thread.start()
+
+    pool = ProcessPoolExecutor(max_workers=parse_workers)
+    pending = {}
+    next_index = 0
+    running = len(producers)
+    try:
+        while running or pending:
+            # Hand on everything fetched so far to the parse pool
+            try:
+                entry = fetched.get(timeout=0 if next_index in pending else 0.05)
+            except queue.Empty:
+                entry = None
+            if entry is _DONE:
+                running -= 1
+            elif entry is not None:
+                index, item, raw, error = entry
+                if error is not None:
+                    pending[index] = (item, error)
+                elif raw is None:
+                    pending[index] = (item, None)
+                else:
+                    pending[index] = (item, pool.submit(parse, raw, item))
+
+            if next_index not in pending:
+                continue
+            item, result = pending[next_index]
+            if isinstance(result, Exception):
+                raise result
+            if result is not None:
+                if not result.done():
+                    wait([result], timeout=0.05, return_when=FIRST_COMPLETED)
+                    continue
+                result = result.result()
+            del pending[next_index]
+            next_index += 1
+            slots.release()
+            yield item, result
+    finally:
+        stop.set()
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP layer for the MotM scrapers
+
+All page and API fetches go through http_get(), which keeps an on-disk
+response cache shared by scrape_motm_categories.py, scrape_pdb_codes.py
+and scrape_pdb_info.py:
+
+- bodies are stored gzip-compressed and content-addressed by SHA-256,
+  so identical responses are only stored once
+- per-URL metadata keeps the ETag / Last-Modified validators, and a
+  cached URL is revalidated with a conditional GET (304 = no body sent)
+- with --trust-cache a cached URL is served with no network at all
+  (MotM pages do not change after publication)
+- entries are evicted by age and least-recent use when the cache grows
+  past its size limit
+
+Cache location: scripts/.http_cache (override with --cache-dir)
+
+Requests that do go out share one pooled HttpClient: a requests.Session
+with a keep-alive connection pool per host (so the TCP + TLS handshake is
+paid once per connection, not once per request) that asks for gzip, and
+brotli when it is installed.  With --http2 the client uses httpx instead,
+multiplexing requests over one HTTP/2 connection per host:
+
+    pip install httpx[http2] brotli      (optional)
+
+Every script that takes the client options can also record or replay:
+--record FILE appends each response it gets to a cassette, one zip
+archive (see Cassette), and --replay FILE serves all requests from a
+cassette with no network at all, after --replay-latency seconds each.
+Replays bypass the response cache.  Record a fixture corpus once with
+    python scrape_motm_pages.py 1 315 --no-cache --record motm_cassette.zip
+and replay it offline, e.g. for bench_scrapers.py archive.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import brotli  # noqa: F401
+    HAVE_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAVE_BROTLI = True
+    except ImportError:
+        HAVE_BROTLI = False
+
+from motm_fetch import backoff_delay, parse_retry_after
+
+MOTM_URL_PREFIX = "https://pdb101.rcsb.org/motm/"
+
+CACHE_DIR = Path(__file__).parent / ".http_cache"
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_MAX_AGE_DAYS = 365
+
+# Keep-alive connections per host; enough for the --workers threads
+POOL_SIZE = 16
+ACCEPT_ENCODING = "gzip, deflate, br" if HAVE_BROTLI else "gzip, deflate"
+
+
+class HttpClient:
+    """
+    Pooled keep-alive HTTP client shared by all fetches.
+
+    Uses a requests.Session with one connection pool per host, or with
+    http2=True an httpx.Client speaking HTTP/2.  get() always returns a
+    requests.Response and raises requests exceptions, so callers do not
+    care which backend is in use.  Safe to share between threads.
+    """
+
+    def __init__(self, http2: bool = False, pool_size: int = POOL_SIZE, verify=True):
+        self.http2 = http2
+        self.verify = verify
+        if http2:
+            if httpx is None:
+                raise ValueError("HTTP/2 requested but httpx is not installed (pip install httpx[http2])")
+            limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            self.client = httpx.Client(http2=True, limits=limits, verify=verify,
+                                       headers={"Accept-Encoding": ACCEPT_ENCODING})
+        else:
+            self.session = requests.Session()
+            self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def get(self, url: str, timeout: float = 30, headers: dict = None) -> requests.Response:
+        """GET a URL over a pooled connection."""
+        return self.request("GET", url, timeout, headers)
+
+    def head(self, url: str, timeout: float = 30, headers: dict = None) -> requests.Response:
+        """HEAD a URL over a pooled connection (redirects are followed)."""
+        return self.request("HEAD", url, timeout, headers)
+
+    def request(self, method: str, url: str, timeout: float = 30, headers: dict = None,
+                stream: bool = False) -> requests.Response:
+        """
+        Send a request over a pooled connection.
+
+        With stream the body is read as it is iterated (requests backend
+        only; the httpx backend always reads it up front).  Close a
+        streamed response when done with it.
+        """
+        if not self.http2:
+            # verify is passed per request: a Session-level setting loses to REQUESTS_CA_BUNDLE
+            return self.session.request(method, url, timeout=timeout, headers=headers, verify=self.verify,
+                                        allow_redirects=True, stream=stream)
+
+        try:
+            reply = self.client.request(method, url, timeout=timeout, headers=headers, follow_redirects=True)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        # Hand the httpx reply on as a requests.Response
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.url = str(reply.url)
+        response.headers.update(reply.headers)
+        response._content = reply.content
+        response.encoding = reply.encoding
+        response.reason = reply.reason_phrase
+        return response
+
+    def close(self):
+        if self.http2:
+            self.client.close()
+        else:
+            self.session.close()
+
+
+class ResponseCache:
+    """On-disk, content-addressed HTTP response cache."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, trust: bool = False,
+                 max_bytes: int = CACHE_MAX_BYTES,
+                 max_age_days: float = CACHE_MAX_AGE_DAYS):
+        self.cache_dir = Path(cache_dir)
+        self.meta_dir = self.cache_dir / "meta"
+        self.body_dir = self.cache_dir / "bodies"
+        self.trust = trust
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.meta_dir.mkdir(parents=True, exist_ok=True)
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.meta_dir / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _body_path(self, digest: str) -> Path:
+        return self.body_dir / digest[:2] / (digest + ".gz")
+
+    def lookup(self, url: str) -> dict:
+        """Return the metadata for a cached URL, or None."""
+        meta_path = self._meta_path(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not self._body_path(meta["digest"]).exists():
+            return None
+        # mtime of the metadata file records last use for LRU eviction
+        os.utime(meta_path)
+        return meta
+
+    def load_body(self, meta: dict) -> bytes:
+        """Read and decompress the cached body for a metadata entry."""
+        with gzip.open(self._body_path(meta["digest"]), 'rb') as f:
+            return f.read()
+
+    def store(self, url: str, response: requests.Response):
+        """Store a 200 response body and its validators."""
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not body_path.exists():
+            body_path.parent.mkdir(exist_ok=True)
+            _atomic_write(body_path, gzip.compress(body))
+
+        meta = {
+            "url": url,
+            "digest": digest,
+            "content_type": response.headers.get("Content-Type", ""),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched": time.time(),
+        }
+        _atomic_write(self._meta_path(url), json.dumps(meta).encode("utf-8"))
+
+    def evict(self):
+        """Drop entries past the age limit, then least recently used ones over the size limit."""
+        now = time.time()
+        entries = []
+        for meta_path in self.meta_dir.glob("*.json"):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                used = meta_path.stat().st_mtime
+            except (OSError, ValueError):
+                meta_path.unlink(missing_ok=True)
+                continue
+            if now - meta.get("fetched", 0) > self.max_age:
+                meta_path.unlink(missing_ok=True)
+                continue
+            entries.append((used, meta_path, meta["digest"]))
+
+        body_sizes = {}
+        for body_path in self.body_dir.glob("*/*.gz"):
+            body_sizes[body_path.name[:-3]] = body_path.stat().st_size
+
+        # Newest first; keep entries until the byte budget is used up
+        entries.sort(reverse=True)
+        kept = set()
+        total = 0
+        for used, meta_path, digest in entries:
+            size = 0 if digest in kept else body_sizes.get(digest, 0)
+            if total + size > self.max_bytes:
+                meta_path.unlink(missing_ok=True)
+                continue
+            total += size
+            kept.add(digest)
+
+        for digest in body_sizes:
+            if digest not in kept:
+                self._body_path(digest).unlink(missing_ok=True)
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a file via a temporary name so readers never see partial data."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _cached_response(url: str, meta: dict, body: bytes) -> requests.Response:
+    """Build a requests.Response from a cache entry."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    if meta.get("content_type"):
+        response.headers["Content-Type"] = meta["content_type"]
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+
+class Cassette:
+    """
+    Recorded HTTP responses in one compressed archive, for offline replay.
+
+    The archive is a zip file with index.json, {"METHOD url": {"status",
+    "headers", "body"}}, and each distinct body stored once (deflated) as
+    bodies/<sha256>.  Bodies are read from the archive when replayed.
+    Safe to share between threads.
+    """
+
+    # Not valid for a body that is stored decoded and replayed in full
+    SKIP_HEADERS = {"content-encoding", "transfer-encoding", "connection", "keep-alive"}
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = {}
+        self.new_bodies = {}
+        self.lock = threading.Lock()
+        self.archive = None
+        if self.path.exists():
+            self.archive = zipfile.ZipFile(self.path)
+            self.entries = json.loads(self.archive.read("index.json"))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def urls(self, method: str = "GET") -> list:
+        """The recorded URLs of one method."""
+        prefix = method + " "
+        return [key[len(prefix):] for key in self.entries if key.startswith(prefix)]
+
+    def add(self, method: str, url: str, response: requests.Response):
+        """Record a response (the body is read in full)."""
+        body = response.content if method != "HEAD" else None
+        digest = hashlib.sha256(body).hexdigest() if body is not None else None
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in self.SKIP_HEADERS}
+        with self.lock:
+            self.entries[f"{method} {url}"] = {"status": response.status_code, "headers": headers, "body": digest}
+            if digest:
+                self.new_bodies[digest] = body
+
+    def _body(self, digest: str) -> bytes:
+        with self.lock:
+            if digest in self.new_bodies:
+                return self.new_bodies[digest]
+            return self.archive.read(f"bodies/{digest}")
+
+    def response(self, method: str, url: str) -> requests.Response:
+        """The recorded response, or None.  A HEAD request can be answered from a recorded GET."""
+        entry = self.entries.get(f"{method} {url}")
+        if entry is None and method == "HEAD":
+            entry = self.entries.get(f"GET {url}")
+        if entry is None:
+            return None
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = url
+        response.headers.update(entry["headers"])
+        if method == "HEAD":
+            response._content = b""
+        else:
+            response._content = self._body(entry["body"]) if entry["body"] else b""
+            response.headers["Content-Length"] = str(len(response._content))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def save(self):
+        """Write the archive with every entry, old and new, via a temporary file."""
+        with self.lock:
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            digests = {entry["body"] for entry in self.entries.values() if entry["body"]}
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as out:
+                out.writestr("index.json", json.dumps(self.entries, indent=0, sort_keys=True))
+                for digest in sorted(digests):
+                    body = self.new_bodies.get(digest)
+                    if body is None:
+                        body = self.archive.read(f"bodies/{digest}")
+                    out.writestr(f"bodies/{digest}", body)
+            if self.archive:
+                self.archive.close()
+            os.replace(tmp_path, self.path)
+            self.archive = zipfile.ZipFile(self.path)
+            self.new_bodies = {}
+
+
+class ReplayClient:
+    """
+    Stands in for HttpClient: answers every request from a Cassette after
+    `latency` seconds, never touching the network.  A request that was
+    not recorded gets a 404 and is counted in misses.
+    """
+
+    def __init__(self, cassette: Cassette, latency: float = 0.0):
+        self.cassette = cassette
+        self.latency = latency
+        self.misses = 0
+        self.http2 = False
+
+    def get(self, url: str, timeout: float = 30, headers: dict = None) -> requests.Response:
+        return self.request("GET", url, timeout, headers)
+
+    def head(self, url: str, timeout: float = 30, headers: dict = None) -> requests.Response:
+        return self.request("HEAD", url, timeout, headers)
+
+    def request(self, method: str, url: str, timeout: float = 30, headers: dict = None,
+                stream: bool = False) -> requests.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        response = self.cassette.response(method, url)
+        if response is None:
+            self.misses += 1
+            print(f"  Not in cassette: {method} {url}")
+            response = requests.Response()
+            response.status_code = 404
+            response.url = url
+            response._content = b""
+        return response
+
+    def close(self):
+        if self.misses:
+            print(f"{self.misses} requests were not in the cassette {self.cassette.path}")
+
+
+_cache = None
+_client = None
+_recorder = None
+
+
+def add_cache_arguments(parser):
+    """Add the shared response cache options to an argparse parser."""
+    parser.add_argument("--no-cache", action="store_true",
+                        help="bypass the on-disk response cache")
+    parser.add_argument("--trust-cache", action="store_true",
+                        help="serve cached responses without revalidating them")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR,
+                        help=f"response cache directory (default {CACHE_DIR})")
+
+
+def add_client_arguments(parser):
+    """Add the shared HTTP client options to an argparse parser."""
+    parser.add_argument("--http2", action="store_true",
+                        help="multiplex requests over HTTP/2 (needs: pip install httpx[http2])")
+    parser.add_argument("--record", type=Path, metavar="FILE",
+                        help="add every response to this cassette (zip archive) for --replay")
+    parser.add_argument("--replay", type=Path, metavar="FILE",
+                        help="serve all requests from this cassette instead of the network")
+    parser.add_argument("--replay-latency", type=float, default=0.0, metavar="S",
+                        help="seconds to wait before each replayed response (default 0)")
+
+
+def configure_client(args):
+    """Set up the shared HTTP client from parsed command line arguments."""
+    global _client, _recorder
+    if _client:
+        _client.close()
+    if getattr(args, "replay", None):
+        if not args.replay.exists():
+            raise ValueError(f"cassette {args.replay} not found")
+        _client = ReplayClient(Cassette(args.replay), args.replay_latency)
+        atexit.register(_client.close)
+    else:
+        _client = HttpClient(http2=args.http2)
+    if getattr(args, "record", None):
+        _recorder = Cassette(args.record)
+        atexit.register(_recorder.save)
+
+
+def get_client() -> HttpClient:
+    """The shared HTTP client, created with the defaults on first use."""
+    global _client
+    if _client is None:
+        _client = HttpClient()
+    return _client
+
+
+def configure_cache(args):
+    """Set up the shared response cache from parsed command line arguments."""
+    global _cache
+    if args.no_cache or getattr(args, "replay", None):
+        _cache = None
+    else:
+        _cache = ResponseCache(args.cache_dir, trust=args.trust_cache)
+
+
+def http_get(url: str, timeout: int = 30, limiter=None) -> requests.Response:
+    """
+    GET a URL through the shared response cache.
+
+    The limiter (a TokenBucket or HostRateLimiter) is only consulted when
+    a request actually goes out over the network, and is told the status,
+    latency and Retry-After of the response.
+    """
+    meta = _cache.lookup(url) if _cache else None
+    if meta and _cache.trust:
+        response = _cached_response(url, meta, _cache.load_body(meta))
+        if _recorder is not None:
+            _recorder.add("GET", url, response)
+        return response
+
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    if limiter:
+        limiter = limiter.for_url(url)
+        limiter.acquire()
+    start = time.monotonic()
+    try:
+        response = get_client().get(url, timeout=timeout, headers=headers)
+    except requests.RequestException:
+        if limiter:
+            limiter.feedback(None, time.monotonic() - start)
+        raise
+    if limiter:
+        limiter.feedback(response.status_code, time.monotonic() - start,
+                         parse_retry_after(response.headers.get("Retry-After")))
+
+    if meta and response.status_code == 304:
+        response = _cached_response(url, meta, _cache.load_body(meta))
+    else:
+        if _cache and response.status_code == 200:
+            _cache.store(url, response)
+        response.from_cache = False
+    if _recorder is not None:
+        _recorder.add("GET", url, response)
+    return response
+
+
+def http_send(method: str, url: str, timeout: int = 30, limiter=None, headers: dict = None,
+              stream: bool = False) -> requests.Response:
+    """Send a request past the response cache, e.g. for large downloads, with rate limiting."""
+    if limiter:
+        limiter = limiter.for_url(url)
+        limiter.acquire()
+    start = time.monotonic()
+    try:
+        response = get_client().request(method, url, timeout=timeout, headers=headers, stream=stream)
+    except requests.RequestException:
+        if limiter:
+            limiter.feedback(None, time.monotonic() - start)
+        raise
+    if limiter:
+        limiter.feedback(response.status_code, time.monotonic() - start,
+                         parse_retry_after(response.headers.get("Retry-After")))
+    if _recorder is not None:
+        _recorder.add(method, url, response)
+    return response
+
+
+def http_head(url: str, timeout: int = 30, limiter=None) -> requests.Response:
+    """HEAD a URL, e.g. for its Content-Length; never cached."""
+    return http_send("HEAD", url, timeout, limiter)
+
+
+def retry_delay(attempt: int, error: requests.RequestException = None) -> float:
+    """Seconds to wait before retrying: the server's Retry-After if it sent one, else jittered backoff."""
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+    return backoff_delay(attempt)
+
+
+def fetch_molecule_page(molecule_num: int, retries: int = 3, limiter=None,
+                        base_url: str = MOTM_URL_PREFIX) -> str:
+    """Fetch HTML for a molecule page with retry logic."""
+    url = f"{base_url}{molecule_num}"
+
+    for attempt in range(retries):
+        try:
+            response = http_get(url, limiter=limiter)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            if getattr(e.response, "status_code", None) == 404:
+                # Not published (yet); retrying will not change that
+                print(f"  ERROR: Molecule {molecule_num} not found")
+                return None
+            if attempt < retries - 1:
+                wait_time = retry_delay(attempt, e)
+                print(f"  Retry {attempt + 1} for molecule {molecule_num} (waiting {wait_time:.1f}s)...")
+                time.sleep(wait_time)
+            else:
+                print(f"  ERROR: Failed to fetch molecule {molecule_num}: {e}")
+                return None
+    return None
+
+
+def motm_page_exists(molecule_num: int, retries: int = 3, limiter=None,
+                     base_url: str = MOTM_URL_PREFIX) -> bool:
+    """
+    Whether MotM page molecule_num is published, from one HEAD request
+    (no page body is sent).  A page in the response cache exists without
+    any request; a server that refuses HEAD is asked with GET instead.
+    Network errors, 429 and 5xx are retried, then raised: a guess either
+    way would make find_latest_motm return the wrong entry.
+    """
+    url = f"{base_url}{molecule_num}"
+    if _cache and _cache.lookup(url):
+        return True
+
+    for attempt in range(retries):
+        try:
+            response = http_head(url, limiter=limiter)
+            if response.status_code in (405, 501):
+                response = http_get(url, limiter=limiter)
+            if response.status_code == 200:
+                return True
+            if 400 <= response.status_code < 500 and response.status_code != 429:
+                return False
+            raise requests.HTTPError(f"{response.status_code} for {url}", response=response)
+        except requests.RequestException as e:
+            if attempt == retries - 1:
+                raise
+            time.sleep(retry_delay(attempt, e))
+    return False
+
+
+def find_latest_motm(last_known: int, limiter=None, base_url: str = MOTM_URL_PREFIX) -> int:
+    """
+    Newest published MotM number, given that last_known is published and
+    the numbers have no gaps.
+
+    Probes last_known + 1, + 2, + 4, ... until a page is missing, then
+    binary searches between the last page found and the missing one:
+    about 2 log2(n) HEAD requests for n new entries, and a single one when
+    there are none.
+    """
+    found = last_known
+    missing = None
+    probes = 0
+    step = 1
+    while missing is None:
+        probes += 1
+        if motm_page_exists(found + step, limiter=limiter, base_url=base_url):
+            found += step
+            step *= 2
+        else:
+            missing = found + step
+    while missing - found > 1:
+        mid = (found + missing) // 2
+        probes += 1
+        if motm_page_exists(mid, limiter=limiter, base_url=base_url):
+            found = mid
+        else:
+            missing = mid
+    print(f"Newest MotM entry online: {found} ({probes} probes)")
+    return found
+
+
+def auto_motm_numbers(num_months: int, start_num: int = None, limiter=None,
+                      base_url: str = MOTM_URL_PREFIX) -> range:
+    """
+    MotM numbers for the --auto mode: start_num (default num_months + 1,
+    the first entry after Corpus.numMonths) up to the newest entry online.
+    """
+    if start_num is None:
+        start_num = num_months + 1
+    return range(start_num, find_latest_motm(num_months, limiter, base_url) + 1)
+
+
+def incremental_motm_numbers(num_months: int, missing=(), end_num: int = None,
+                             limiter=None, base_url: str = MOTM_URL_PREFIX) -> list:
+    """
+    MotM numbers to fetch in incremental mode: the given missing numbers
+    plus every entry published after num_months, up to end_num or, if no
+    end_num is given, the newest entry found online.
+    """
+    if end_num is None:
+        end_num = find_latest_motm(num_months, limiter, base_url)
+    return sorted(set(missing) | set(range(num_months + 1, end_num + 1)))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Resumable progress journal for the MotM scrapers
+
+Each scraper appends one JSON line per finished item ({"key": ..., "value":
+...}) to a journal file and flushes it straight away, so a crash or a
+rate-limit ban part way through a long backfill loses at most the item in
+flight.  Re-running with --resume replays the journal, skips every item it
+already holds, and the final JSON outputs are built by streaming the
+journal back in the order of the requested items.
+
+Without --resume the journal is started afresh.  A torn last line (the
+process died mid-write) is ignored on replay.
+
+Journal location: scripts/.journal/<script>.jsonl (override with --journal)
+"""
+
+import json
+from pathlib import Path
+
+JOURNAL_DIR = Path(__file__).parent / ".journal"
+
+
+class ProgressJournal:
+    """Append-only JSONL journal of finished work items."""
+
+    def __init__(self, path: Path, resume: bool = False, is_complete=None):
+        """
+        Open the journal at path.
+
+        With resume the existing entries are replayed; is_complete(value)
+        decides which of them count as done (default: all of them), so
+        e.g. failed fetches can be retried.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.done = set()
+
+        if resume and self.path.exists():
+            for key, value in self.replay():
+                if is_complete is None or is_complete(value):
+                    self.done.add(key)
+                else:
+                    self.done.discard(key)
+            torn = False
+            with open(self.path, 'rb') as f:
+                if f.seek(0, 2):
+                    f.seek(-1, 2)
+                    torn = f.read(1) != b"\n"
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # Start on a fresh line if the last write was cut off
+            if torn:
+                self._file.write("\n")
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+    def __contains__(self, key) -> bool:
+        return key in self.done
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def record(self, key, value):
+        """Append a finished item and flush it to disk."""
+        self._file.write(json.dumps({"key": key, "value": value}, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.done.add(key)
+
+    def replay(self):
+        """Yield (key, value) for every intact journal line, oldest first."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                yield entry["key"], entry["value"]
+
+    def results(self, keys) -> dict:
+        """Stream the journal and return {key: latest value} for the given keys."""
+        self._file.flush()
+        wanted = set(keys)
+        return {key: value for key, value in self.replay() if key in wanted}
+
+
+def add_journal_arguments(parser):
+    """Add the --resume / --journal options to an argparse parser."""
+    parser.add_argument("--resume", action="store_true",
+                        help="skip items already recorded in the progress journal of an earlier run")
+    parser.add_argument("--journal", type=Path,
+                        help=f"progress journal file (default {JOURNAL_DIR}/<script>.jsonl)")
+
+
+def open_journal(args, name: str, is_complete=None) -> ProgressJournal:
+    """Open the progress journal for a script from parsed command line arguments."""
+    path = args.journal or JOURNAL_DIR / f"{name}.jsonl"
+    journal = ProgressJournal(path, resume=args.resume, is_complete=is_complete)
+    if args.resume:
+        print(f"Resuming from {path}: {len(journal.done)} items already done")
+    return journal
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Run the monthly MotM update as one make-style pipeline
+
+The monthly update (see CLAUDE-monthly-update.md) runs the scrapers one
+after the other by hand, and each of them redoes all of its work even
+when its inputs have not changed.  This script runs them as stages with
+declared inputs and outputs:
+
+    pages       scrape_motm_pages.py --auto            the MotM site ->
+                molecule_data.json, pdb_codes.json, *_updates.txt
+    info        scrape_pdb_info.py --incremental --sizes
+                pdb_codes.json -> pdb_info.json, pdb_size.json
+    thumbnails  fetch_thumbnails.py      molecule_data.json -> motm_thumbnail/
+    merge       merge_kotlin.py          JSON files -> mollib Kotlin sources
+    assets      export_assets.py         pdb_info.tsv -> motm_data.bin
+    mirror      mirror_pdb_files.py      PDBs.kt -> pdb_mirror/
+    structures  compile_structures.py    pdb_mirror/ -> pdb_structures/
+
+A stage depends on the stages that write its inputs.  Its fingerprint is
+the SHA-256 of its command, its script, the helper modules the script
+imports from this directory (found by following its imports, so
+motm_http.py or kotlin_sources.py count for every stage that uses them)
+and every input file; a stage
+whose fingerprint and outputs are the same as after its last successful
+run is skipped.  File hashes are cached by size and mtime in the state
+file, so a run in which nothing changed hashes nothing and finishes in a
+fraction of a second.
+
+Stages whose dependencies are done run concurrently (info and
+thumbnails, assets and mirror), each in its own process: this script
+only uses the standard library, and bs4, numpy or Pillow are only
+imported by the stages that need them.
+
+Only the pages stage reads the MotM site, which can change without any
+local file changing.  It runs with --online (probing for new entries,
+see find_latest_motm in motm_http.py) and is taken as up to date
+otherwise.  mirror and structures only run when asked for.
+
+State: scripts/pipeline_state.json
+
+Usage:
+    python motm_pipeline.py [stage ...] [--online] [--force] [--dry-run] [--jobs N]
+
+Example:
+    python motm_pipeline.py --online      (the monthly update)
+    python motm_pipeline.py assets        (regenerate the asset from pdb_info.tsv)
+    python motm_pipeline.py structures    (also mirror and compile the PDB files)
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from kotlin_sources import MOLLIB_DATA_DIR, PDB_INFO_PATH
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPT_DIR.parent
+STATE_PATH = SCRIPT_DIR / "pipeline_state.json"
+ASSET_PATH = MOLLIB_DATA_DIR.parents[4] / "assets" / "motm_data.bin"
+BOND_INFO_PATH = REPO_DIR / "pdbparser" / "src" / "main" / "java" / "com" / "kotmol" / "pdbParser" / "BondInfo.kt"
+STATE_VERSION = 1
+
+
+def local_modules(script: Path) -> list:
+    """The script and every module of this directory it imports, directly or through another one."""
+    found = {}
+    pending = [script]
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found[path] = None
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module = SCRIPT_DIR / (name.split(".")[0] + ".py")
+                if module.exists():
+                    pending.append(module)
+    return sorted(found)
+
+
+class Stage:
+    """One pipeline step: a script run with fixed arguments, the files it reads and the files it writes."""
+
+    def __init__(self, name: str, command: list, inputs: list, outputs: list,
+                 online: bool = False, default: bool = True):
+        self.name = name
+        self.command = command
+        self.inputs = local_modules(SCRIPT_DIR / command[0]) + inputs
+        self.outputs = outputs
+        self.online = online
+        self.default = default
+        self.depends = set()
+
+
+def data_file(name: str) -> Path:
+    return MOLLIB_DATA_DIR / name
+
+
+STAGES = [
+    Stage("pages", ["scrape_motm_pages.py", "--auto"],
+          [],
+          [SCRIPT_DIR / name for name in ("molecule_data.json", "category_updates.txt", "corpus_updates.txt",
+                                          "pdb_codes.json", "pdb_updates.txt")],
+          online=True),
+    Stage("info", ["scrape_pdb_info.py", "--incremental", "--batch-size", "100", "--sizes"],
+          [SCRIPT_DIR / "pdb_codes.json"],
+          [SCRIPT_DIR / name for name in ("pdb_info.json", "pdb_info_updates.txt",
+                                          "pdb_size.json", "pdb_size_updates.txt")]),
+    Stage("thumbnails", ["fetch_thumbnails.py"],
+          [SCRIPT_DIR / "molecule_data.json"],
+          [SCRIPT_DIR / "motm_thumbnail" / "thumbnail_manifest.json"]),
+    Stage("merge", ["merge_kotlin.py"],
+          [SCRIPT_DIR / name for name in ("molecule_data.json", "pdb_codes.json", "pdb_info.json", "pdb_size.json")],
+          [PDB_INFO_PATH] + [data_file(name) for name in ("PDBs.kt", "PdbSizeArray.kt", "Corpus.kt",
+                                                          "MotmByCategory.kt")]),
+    Stage("assets", ["export_assets.py"],
+          [PDB_INFO_PATH],
+          [ASSET_PATH, data_file("MotmDataAsset.kt")]),
+    Stage("mirror", ["mirror_pdb_files.py"],
+          [data_file("PDBs.kt")],
+          [SCRIPT_DIR / "pdb_mirror" / "mirror_manifest.json"],
+          default=False),
+    Stage("structures", ["compile_structures.py"],
+          [SCRIPT_DIR / "pdb_mirror" / "mirror_manifest.json", BOND_INFO_PATH],
+          [SCRIPT_DIR / "pdb_structures" / "structures_manifest.json"],
+          default=False),
+]
+
+
+def build_graph(stages: list) -> dict:
+    """
+    {name: stage} with each stage's depends set to the stages that write
+    one of its inputs.  Raises ValueError for a file with two writers or a cycle.
+    """
+    writers = {}
+    for stage in stages:
+        for path in stage.outputs:
+            if path in writers:
+                raise ValueError(f"{relative(path)} is written by both {writers[path]} and {stage.name}")
+            writers[path] = stage.name
+    graph = {stage.name: stage for stage in stages}
+    for stage in stages:
+        stage.depends = {writers[path] for path in stage.inputs if path in writers} - {stage.name}
+
+    visiting, visited = set(), set()
+
+    def visit(name):
+        if name in visiting:
+            raise ValueError(f"dependency cycle through stage {name}")
+        if name not in visited:
+            visiting.add(name)
+            for upstream in graph[name].depends:
+                visit(upstream)
+            visiting.discard(name)
+            visited.add(name)
+
+    for name in graph:
+        visit(name)
+    return graph
+
+
+def relative(path: Path) -> str:
+    """Path relative to the repository, used as the key in the state file."""
+    try:
+        return path.relative_to(REPO_DIR).as_posix()
+    except ValueError:
+        return str(path)
+
+
+class FileHasher:
+    """SHA-256 of files, cached by (size, mtime) across runs.  Safe to share between threads."""
+
+    def __init__(self, cache: dict):
+        self.cache = cache
+        self.lock = threading.Lock()
+
+    def digest(self, path: Path) -> str:
+        """Hex SHA-256 of a file, or None if it does not exist."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = relative(path)
+        with self.lock:
+            cached = self.cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        with self.lock:
+            self.cache[key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+
+def fingerprint(stage: Stage, hasher: FileHasher) -> str:
+    """SHA-256 over the stage's command and the content of every input (missing inputs included)."""
+    digest = hashlib.sha256(json.dumps(stage.command).encode("utf-8"))
+    for path in stage.inputs:
+        digest.update(f"\n{relative(path)} {hasher.digest(path) or '-'}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def output_digests(stage: Stage, hasher: FileHasher) -> dict:
+    return {relative(path): hasher.digest(path) for path in stage.outputs}
+
+
+def load_state(path: Path = STATE_PATH) -> dict:
+    """The state of the last runs, or a fresh one if there is none (or it is from another version)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    if state.get("version") != STATE_VERSION:
+        state = {"version": STATE_VERSION, "stages": {}, "files": {}}
+    return state
+
+
+def save_state(state: dict, path: Path = STATE_PATH):
+    """Write the state via a temporary file."""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+_print_lock = threading.Lock()
+
+
+def log(name: str, message: str):
+    with _print_lock:
+        print(f"[{name}] {message}", flush=True)
+
+
+def run_stage(stage: Stage) -> int:
+    """Run a stage's script in its own process, prefixing its output with the stage name."""
+    process = subprocess.Popen([sys.executable, "-u", *stage.command], cwd=SCRIPT_DIR,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, encoding="utf-8", errors="replace")
+    for line in process.stdout:
+        log(stage.name, line.rstrip("\n"))
+    return process.wait()
+
+
+def select_stages(graph: dict, targets: list) -> list:
+    """The target stages (default: every default stage) plus everything upstream of them."""
+    selected = set()
+    pending = list(targets or [name for name, stage in graph.items() if stage.default])
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(graph[name].depends)
+    return [name for name in graph if name in selected]
+
+
+def run_pipeline(graph: dict, names: list, state: dict, args) -> dict:
+    """
+    Run the selected stages in dependency order, up to args.jobs at a
+    time.  Returns {name: status} with status "up to date", "ran",
+    "offline", "failed", "skipped" (an upstream stage failed) or, for a
+    dry run, "would run".
+    """
+    hasher = FileHasher(state["files"])
+    status = {}
+    pending = list(names)
+    running = {}
+
+    def decide(stage: Stage) -> tuple:
+        if stage.online and not args.online:
+            return "offline", None
+        fp = fingerprint(stage, hasher)
+        last = state["stages"].get(stage.name)
+        if (not args.force and not stage.online and last and last["fingerprint"] == fp
+                and last["outputs"] == output_digests(stage, hasher)):
+            return "up to date", fp
+        return "run", fp
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        while pending or running:
+            for name in list(pending):
+                stage = graph[name]
+                upstream = [status.get(dep) for dep in stage.depends]
+                if any(s is None for s in upstream):
+                    continue
+                pending.remove(name)
+                if any(s in ("failed", "skipped") for s in upstream):
+                    status[name] = "skipped"
+                elif args.dry_run and "would run" in upstream:
+                    # Its inputs are not written yet, so there is nothing to compare
+                    status[name] = "would run"
+                else:
+                    decision, fp = decide(stage)
+                    if decision == "run" and not args.dry_run:
+                        log(name, "running " + " ".join(stage.command))
+                        running[pool.submit(run_stage, stage)] = (name, fp, time.perf_counter())
+                        continue
+                    status[name] = "would run" if decision == "run" else decision
+                log(name, status[name])
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name, fp, start = running.pop(future)
+                code = future.result()
+                elapsed = time.perf_counter() - start
+                if code == 0:
+                    state["stages"][name] = {"fingerprint": fp, "outputs": output_digests(graph[name], hasher)}
+                    status[name] = "ran"
+                    log(name, f"done in {elapsed:.1f}s")
+                else:
+                    state["stages"].pop(name, None)
+                    status[name] = "failed"
+                    log(name, f"FAILED with exit code {code} after {elapsed:.1f}s")
+                if not args.dry_run:
+                    save_state(state)
+    return status
+
+
+def parse_args(graph: dict):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the MotM update stages whose inputs changed")
+    parser.add_argument("stages", nargs="*", metavar="stage",
+                        help=f"stages to bring up to date, with their upstream stages: {', '.join(graph)} "
+                             f"(default: all but mirror and structures)")
+    parser.add_argument("--online", action="store_true",
+                        help="scrape the MotM site for new entries (the pages stage)")
+    parser.add_argument("--force", action="store_true",
+                        help="run the selected stages even if they are up to date")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report which stages would run, run nothing")
+    parser.add_argument("--jobs", type=int, default=4,
+                        help="number of stages to run at the same time (default 4)")
+    args = parser.parse_args()
+    unknown = [name for name in args.stages if name not in graph]
+    if unknown:
+        parser.error(f"unknown stage: {', '.join(unknown)}")
+    return args
+
+
+def main():
+    start = time.perf_counter()
+    graph = build_graph(STAGES)
+    args = parse_args(graph)
+    state = load_state()
+
+    names = select_stages(graph, args.stages)
+    status = run_pipeline(graph, names, state, args)
+    if not args.dry_run:
+        save_state(state)
+
+    ran = [name for name in names if status[name] == "ran"]
+    failed = [name for name in names if status[name] in ("failed", "skipped")]
+    print(f"\n{len(ran)} of {len(names)} stages ran in {time.perf_counter() - start:.2f}s"
+          + (f", {len(failed)} failed or skipped: {', '.join(failed)}" if failed else ""))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
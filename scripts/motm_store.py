@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+SQLite store for the scraped MotM metadata
+
+The scrapers upsert what they find into one indexed SQLite database
+instead of only rewriting whole JSON files:
+
+- molecules: MotM number, title, tagline, thumbnail hint
+- categories: (number, category) pairs
+- motm_pdb: MotM -> PDB links, indexed on pdb_code
+- pdb_code_pages: which MotM pages have been scanned for PDB codes, and
+  in which run
+- pdb_info: PDB entry titles (and fetch errors) from RCSB
+- pdb_size: atom / polymer entity counts and download sizes
+  (scrape_pdb_info.py --sizes)
+
+molecule_data.json, pdb_codes.json, pdb_info.json and pdb_size.json, and the
+Kotlin update snippets built from them, are exported views of this store.
+Queries like "which MotM months reference PDB X" are one indexed lookup:
+
+    python motm_store.py pdb 4hhb
+    python motm_store.py motm 315
+    python motm_store.py import       (load the existing JSON files)
+    python motm_store.py export       (write the JSON files for the whole store)
+
+Database location: scripts/motm_data.sqlite
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+STORE_PATH = Path(__file__).parent / "motm_data.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS molecules (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    tagline TEXT NOT NULL,
+    thumbnail_hint TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS categories (
+    number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (number, category)
+);
+CREATE INDEX IF NOT EXISTS categories_category ON categories (category);
+CREATE TABLE IF NOT EXISTS motm_pdb (
+    number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    pdb_code TEXT NOT NULL,
+    PRIMARY KEY (number, pdb_code)
+);
+CREATE INDEX IF NOT EXISTS motm_pdb_code ON motm_pdb (pdb_code);
+CREATE TABLE IF NOT EXISTS pdb_code_pages (
+    number INTEGER PRIMARY KEY,
+    run INTEGER NOT NULL,
+    scraped REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pdb_code_pages_run ON pdb_code_pages (run);
+CREATE TABLE IF NOT EXISTS pdb_info (
+    pdb_code TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    error TEXT,
+    fetched REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pdb_size (
+    pdb_code TEXT PRIMARY KEY,
+    atom_count INTEGER,
+    polymer_entity_count INTEGER,
+    download_bytes INTEGER,
+    error TEXT,
+    fetched REAL NOT NULL
+);
+"""
+
+
+def _in_clause(values) -> str:
+    return ",".join("?" * len(values))
+
+
+class MotmStore:
+    """The scraper metadata database; use as a context manager."""
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    # -- upserts: one transaction per batch --
+
+    def upsert_molecules(self, molecules: list):
+        """Insert or update molecule_data entries and replace their categories."""
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO molecules (number, title, tagline, thumbnail_hint, updated) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (number) DO UPDATE SET "
+                "title = excluded.title, tagline = excluded.tagline, "
+                "thumbnail_hint = excluded.thumbnail_hint, updated = excluded.updated",
+                [(mol["number"], mol["title"], mol["tagline"], mol.get("thumbnail_hint", ""), now)
+                 for mol in molecules])
+            self.db.executemany("DELETE FROM categories WHERE number = ?",
+                                [(mol["number"],) for mol in molecules])
+            self.db.executemany(
+                "INSERT INTO categories (number, position, category) VALUES (?, ?, ?)",
+                [(mol["number"], i, category)
+                 for mol in molecules for i, category in enumerate(dict.fromkeys(mol["categories"]))])
+
+    def upsert_pdb_codes(self, entries: list) -> int:
+        """Replace the PDB codes of the given pages ({"number", "pdb_codes"}); return the run id."""
+        now = time.time()
+        with self.db:
+            run = self.db.execute("SELECT COALESCE(MAX(run), 0) + 1 FROM pdb_code_pages").fetchone()[0]
+            self.db.executemany("DELETE FROM motm_pdb WHERE number = ?",
+                                [(entry["number"],) for entry in entries])
+            self.db.executemany(
+                "INSERT INTO motm_pdb (number, position, pdb_code) VALUES (?, ?, ?)",
+                [(entry["number"], i, code.lower())
+                 for entry in entries for i, code in enumerate(dict.fromkeys(entry["pdb_codes"]))])
+            self.db.executemany(
+                "INSERT INTO pdb_code_pages (number, run, scraped) VALUES (?, ?, ?) "
+                "ON CONFLICT (number) DO UPDATE SET run = excluded.run, scraped = excluded.scraped",
+                [(entry["number"], run, now) for entry in entries])
+        return run
+
+    def upsert_pdb_info(self, infos: list):
+        """Insert or update pdb_info entries."""
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO pdb_info (pdb_code, title, error, fetched) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (pdb_code) DO UPDATE SET title = excluded.title, "
+                "error = excluded.error, fetched = excluded.fetched",
+                [(info["pdb_code"], info["title"], info["error"], now) for info in infos])
+
+    def upsert_pdb_sizes(self, sizes: list):
+        """Insert or update pdb_size entries."""
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO pdb_size (pdb_code, atom_count, polymer_entity_count, download_bytes, error, fetched) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (pdb_code) DO UPDATE SET "
+                "atom_count = excluded.atom_count, polymer_entity_count = excluded.polymer_entity_count, "
+                "download_bytes = excluded.download_bytes, error = excluded.error, fetched = excluded.fetched",
+                [(size["pdb_code"], size["atom_count"], size["polymer_entity_count"], size["download_bytes"],
+                  size["error"], now) for size in sizes])
+
+    # -- views in the JSON file shapes --
+
+    def molecules(self, numbers=None) -> list:
+        """molecule_data.json entries, for the given numbers (default all) in number order."""
+        if numbers is None:
+            rows = self.db.execute("SELECT * FROM molecules ORDER BY number").fetchall()
+            cat_rows = self.db.execute("SELECT number, category FROM categories "
+                                       "ORDER BY number, position").fetchall()
+        else:
+            numbers = list(numbers)
+            rows = []
+            cat_rows = []
+            for start in range(0, len(numbers), 500):
+                chunk = numbers[start:start + 500]
+                rows += self.db.execute(f"SELECT * FROM molecules WHERE number IN ({_in_clause(chunk)})",
+                                        chunk).fetchall()
+                cat_rows += self.db.execute(f"SELECT number, category FROM categories "
+                                            f"WHERE number IN ({_in_clause(chunk)}) ORDER BY position",
+                                            chunk).fetchall()
+        categories = {}
+        for row in cat_rows:
+            categories.setdefault(row["number"], []).append(row["category"])
+        return [{"number": row["number"], "title": row["title"], "tagline": row["tagline"],
+                 "categories": categories.get(row["number"], []), "thumbnail_hint": row["thumbnail_hint"]}
+                for row in sorted(rows, key=lambda r: r["number"])]
+
+    def pdb_code_entries(self, numbers=None) -> list:
+        """pdb_codes.json entries for the given scanned pages (default all) in number order."""
+        if numbers is None:
+            numbers = [row[0] for row in self.db.execute("SELECT number FROM pdb_code_pages ORDER BY number")]
+        codes = {}
+        for number, code in self.db.execute("SELECT number, pdb_code FROM motm_pdb ORDER BY number, position"):
+            codes.setdefault(number, []).append(code)
+        return [{"number": number, "pdb_codes": codes.get(number, [])} for number in sorted(numbers)]
+
+    def pdb_codes(self, latest_run: bool = False) -> list:
+        """Sorted distinct PDB codes of all scanned pages, or only those scanned in the latest run."""
+        if latest_run:
+            rows = self.db.execute(
+                "SELECT DISTINCT m.pdb_code FROM motm_pdb m JOIN pdb_code_pages p USING (number) "
+                "WHERE p.run = (SELECT MAX(run) FROM pdb_code_pages) ORDER BY m.pdb_code")
+        else:
+            rows = self.db.execute("SELECT DISTINCT pdb_code FROM motm_pdb ORDER BY pdb_code")
+        return [row[0] for row in rows]
+
+    def pdb_infos(self, codes=None) -> list:
+        """pdb_info.json entries for the given codes (in that order), default all by code."""
+        return self._pdb_rows("SELECT pdb_code, title, error FROM pdb_info", codes)
+
+    def pdb_sizes(self, codes=None) -> list:
+        """pdb_size.json entries for the given codes (in that order), default all by code."""
+        return self._pdb_rows("SELECT pdb_code, atom_count, polymer_entity_count, download_bytes, error "
+                              "FROM pdb_size", codes)
+
+    def _pdb_rows(self, select: str, codes=None) -> list:
+        if codes is None:
+            return [dict(row) for row in self.db.execute(f"{select} ORDER BY pdb_code")]
+        found = {}
+        codes = list(codes)
+        for start in range(0, len(codes), 500):
+            chunk = codes[start:start + 500]
+            for row in self.db.execute(f"{select} WHERE pdb_code IN ({_in_clause(chunk)})", chunk):
+                found[row["pdb_code"]] = dict(row)
+        return [found[code] for code in codes if code in found]
+
+    # -- queries --
+
+    def motm_numbers_for_pdb(self, pdb_code: str) -> list:
+        """MotM numbers whose pages reference a PDB code."""
+        return [row[0] for row in self.db.execute(
+            "SELECT number FROM motm_pdb WHERE pdb_code = ? ORDER BY number", (pdb_code.lower(),))]
+
+    def motm_numbers_for_category(self, category: str) -> list:
+        """MotM numbers in a category (case-insensitive)."""
+        return [row[0] for row in self.db.execute(
+            "SELECT number FROM categories WHERE category = ? COLLATE NOCASE ORDER BY number", (category,))]
+
+
+def add_store_arguments(parser):
+    """Add the --db option to an argparse parser."""
+    parser.add_argument("--db", type=Path, default=STORE_PATH,
+                        help=f"metadata store (default {STORE_PATH})")
+
+
+def write_json(path: Path, data):
+    """Write one of the JSON views."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def import_json(store: MotmStore, script_dir: Path):
+    """Load the existing JSON files into the store."""
+    for name, upsert in (("molecule_data.json", store.upsert_molecules),
+                         ("pdb_codes.json", store.upsert_pdb_codes),
+                         ("pdb_info.json", store.upsert_pdb_info),
+                         ("pdb_size.json", store.upsert_pdb_sizes)):
+        path = script_dir / name
+        if not path.exists():
+            print(f"  {name} not found - skipping")
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        upsert(data)
+        print(f"  {name}: {len(data)} entries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query and maintain the MotM metadata store")
+    add_store_arguments(parser)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("import", help="load the existing JSON files into the store")
+    subparsers.add_parser("export", help="write the JSON files for everything in the store")
+    p = subparsers.add_parser("pdb", help="MotM months that reference a PDB code")
+    p.add_argument("pdb_code")
+    p = subparsers.add_parser("motm", help="PDB codes and categories of a MotM entry")
+    p.add_argument("number", type=int)
+    p = subparsers.add_parser("category", help="MotM months in a category")
+    p.add_argument("category")
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    with MotmStore(args.db) as store:
+        if args.command == "import":
+            print(f"Importing into {args.db}")
+            import_json(store, script_dir)
+        elif args.command == "export":
+            write_json(script_dir / "molecule_data.json", store.molecules())
+            write_json(script_dir / "pdb_codes.json", store.pdb_code_entries())
+            write_json(script_dir / "pdb_info.json", store.pdb_infos())
+            write_json(script_dir / "pdb_size.json", store.pdb_sizes())
+            print(f"Exported molecule_data.json, pdb_codes.json, pdb_info.json and pdb_size.json to {script_dir}")
+        elif args.command == "pdb":
+            numbers = store.motm_numbers_for_pdb(args.pdb_code)
+            titles = {mol["number"]: mol["title"] for mol in store.molecules(numbers)}
+            if not numbers:
+                print(f"{args.pdb_code} is not referenced by any scraped MotM page")
+                sys.exit(1)
+            for number in numbers:
+                print(f"MotM {number}: {titles.get(number, '')}")
+        elif args.command == "motm":
+            molecules = store.molecules([args.number])
+            codes = store.pdb_code_entries([args.number])[0]["pdb_codes"]
+            if molecules:
+                print(f"MotM {args.number}: {molecules[0]['title']}")
+                print(f"Categories: {', '.join(molecules[0]['categories'])}")
+            infos = {info["pdb_code"]: info["title"] for info in store.pdb_infos(codes)}
+            sizes = {size["pdb_code"]: size for size in store.pdb_sizes(codes) if not size["error"]}
+            for code in codes:
+                size = f"  [{sizes[code]['atom_count']} atoms]" if code in sizes else ""
+                print(f"  {code}  {infos.get(code, '')}{size}")
+        elif args.command == "category":
+            for number in store.motm_numbers_for_category(args.category):
+                print(number)
+
+
+if __name__ == "__main__":
+    main()
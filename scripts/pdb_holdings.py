@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Local index of the PDB entry IDs held by the RCSB
+
+The text regex in scrape_pdb_codes.py matches anything shaped like a PDB
+code ("4hhb", but also "3d5s" or "2nd1"), and scrape_pdb_info.py used to
+spend a request and a 404 on each false positive.  This module downloads
+the RCSB holdings lists once:
+
+- current entries: https://data.rcsb.org/rest/v1/holdings/current/entry_ids
+- obsolete entries and their successors:
+  https://files.wwpdb.org/pub/pdb/data/status/obsolete.dat
+
+and stores them as sorted fixed-width records that are memory-mapped and
+binary searched, so checking a code is an O(log n) lookup in ~1 MB of
+page cache instead of a network call:
+
+    pdb_holdings/current.ids    4 bytes per entry ID
+    pdb_holdings/obsolete.ids   8 bytes per (obsolete ID, successor ID),
+                                successor "    " if there is none
+
+Usage:
+    python pdb_holdings.py update          (download the holdings lists)
+    python pdb_holdings.py check 4hhb 1abc (look codes up)
+
+The scrapers use the index when it exists (turn it off with --no-holdings).
+"""
+
+import argparse
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+
+from motm_http import add_client_arguments, configure_client, http_get
+
+HOLDINGS_DIR = Path(__file__).parent / "pdb_holdings"
+CURRENT_IDS_URL = "https://data.rcsb.org/rest/v1/holdings/current/entry_ids"
+OBSOLETE_LIST_URL = "https://files.wwpdb.org/pub/pdb/data/status/obsolete.dat"
+
+CURRENT_FILE = "current.ids"
+OBSOLETE_FILE = "obsolete.ids"
+ID_WIDTH = 4
+NO_SUCCESSOR = b"    "
+
+
+class SortedRecords:
+    """Memory-mapped file of sorted fixed-width records, searched by key prefix."""
+
+    def __init__(self, path: Path, width: int):
+        self.path = Path(path)
+        self.width = width
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses empty files
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.count = size // width
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def record(self, index: int) -> bytes:
+        return self._data[index * self.width:(index + 1) * self.width]
+
+    def lower_bound(self, key: bytes) -> int:
+        """Index of the first record whose key prefix is >= key."""
+        lo, hi = 0, self.count
+        key_len = len(key)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mid * self.width
+            if self._data[start:start + key_len] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def matching(self, key: bytes) -> list:
+        """Every record whose key prefix equals key."""
+        found = []
+        index = self.lower_bound(key)
+        while index < self.count:
+            record = self.record(index)
+            if record[:len(key)] != key:
+                break
+            found.append(record)
+            index += 1
+        return found
+
+
+class PdbHoldings:
+    """Current and obsolete PDB entry IDs from a holdings directory."""
+
+    def __init__(self, directory: Path = HOLDINGS_DIR):
+        self.directory = Path(directory)
+        self.current = SortedRecords(self.directory / CURRENT_FILE, ID_WIDTH)
+        self.obsolete = SortedRecords(self.directory / OBSOLETE_FILE, 2 * ID_WIDTH)
+
+    # The mmaps cannot be pickled; worker processes reopen the files
+    def __getstate__(self):
+        return {"directory": self.directory}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"])
+
+    def close(self):
+        self.current.close()
+        self.obsolete.close()
+
+    @staticmethod
+    def _key(code: str) -> bytes:
+        return code.lower().encode("ascii", "replace")
+
+    def is_current(self, code: str) -> bool:
+        """True if code is a released, not obsoleted, PDB entry."""
+        key = self._key(code)
+        return len(key) == ID_WIDTH and bool(self.current.matching(key))
+
+    def is_obsolete(self, code: str) -> bool:
+        key = self._key(code)
+        return len(key) == ID_WIDTH and bool(self.obsolete.matching(key))
+
+    def successors(self, code: str) -> list:
+        """Successor IDs of an obsolete entry (empty if it has none or is not obsolete)."""
+        key = self._key(code)
+        if len(key) != ID_WIDTH:
+            return []
+        return [record[ID_WIDTH:].decode("ascii") for record in self.obsolete.matching(key)
+                if record[ID_WIDTH:] != NO_SUCCESSOR]
+
+    def resolve(self, code: str, depth: int = 10) -> list:
+        """
+        Current IDs for a code: [code] if it is current, the current
+        successors if it was obsoleted (following chains of obsoletions),
+        or [] if the RCSB holds no such entry.
+        """
+        code = code.lower()
+        if self.is_current(code):
+            return [code]
+        if depth == 0:
+            return []
+        resolved = []
+        for successor in self.successors(code):
+            for current in self.resolve(successor, depth - 1):
+                if current not in resolved:
+                    resolved.append(current)
+        return resolved
+
+
+def load_holdings(args):
+    """The PdbHoldings selected by --holdings / --no-holdings, or None."""
+    if args.no_holdings:
+        return None
+    if not (args.holdings / CURRENT_FILE).exists():
+        print(f"Note: no PDB holdings index in {args.holdings} - PDB codes are not validated")
+        print("      (run pdb_holdings.py update to download it)")
+        return None
+    holdings = PdbHoldings(args.holdings)
+    print(f"PDB holdings index: {len(holdings.current)} current, {len(holdings.obsolete)} obsolete entries")
+    return holdings
+
+
+def add_holdings_arguments(parser):
+    """Add the --holdings / --no-holdings options to an argparse parser."""
+    parser.add_argument("--holdings", type=Path, default=HOLDINGS_DIR,
+                        help=f"PDB holdings index directory (default {HOLDINGS_DIR})")
+    parser.add_argument("--no-holdings", action="store_true",
+                        help="do not validate PDB codes against the holdings index")
+
+
+def parse_obsolete_list(text: str) -> list:
+    """(obsolete ID, successor ID or None) pairs from obsolete.dat."""
+    pairs = []
+    for line in text.splitlines():
+        # OBSLTE    30-SEP-02 116L     216L
+        fields = line.split()
+        if len(fields) < 3 or fields[0] != "OBSLTE" or len(fields[2]) != ID_WIDTH:
+            continue
+        successors = [code.lower() for code in fields[3:] if len(code) == ID_WIDTH]
+        for successor in successors or [None]:
+            pairs.append((fields[2].lower(), successor))
+    return pairs
+
+
+def _write_records(path: Path, records: list):
+    """Write sorted records via a temporary name so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(b"".join(records))
+    os.replace(tmp_path, path)
+
+
+def write_holdings(directory: Path, current_ids, obsolete_pairs):
+    """Write the sorted current and obsolete record files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    current = sorted({code.lower().encode("ascii") for code in current_ids if len(code) == ID_WIDTH})
+    obsolete = sorted({old.encode("ascii") + (new.encode("ascii") if new else NO_SUCCESSOR)
+                       for old, new in obsolete_pairs})
+    _write_records(directory / CURRENT_FILE, current)
+    _write_records(directory / OBSOLETE_FILE, obsolete)
+    return len(current), len(obsolete)
+
+
+def update_holdings(directory: Path, current_url: str = CURRENT_IDS_URL,
+                    obsolete_url: str = OBSOLETE_LIST_URL):
+    """Download both holdings lists and rebuild the index."""
+    response = http_get(current_url, timeout=120)
+    response.raise_for_status()
+    current_ids = json.loads(response.content)
+
+    response = http_get(obsolete_url, timeout=120)
+    response.raise_for_status()
+    obsolete_pairs = parse_obsolete_list(response.text)
+
+    return write_holdings(directory, current_ids, obsolete_pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain and query the local PDB holdings index")
+    parser.add_argument("--holdings", type=Path, default=HOLDINGS_DIR,
+                        help=f"index directory (default {HOLDINGS_DIR})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    p = subparsers.add_parser("update", help="download the RCSB holdings lists")
+    p.add_argument("--current-url", default=CURRENT_IDS_URL, help="current entry ID list (JSON)")
+    p.add_argument("--obsolete-url", default=OBSOLETE_LIST_URL, help="obsolete.dat")
+    add_client_arguments(p)
+    p = subparsers.add_parser("check", help="look PDB codes up in the index")
+    p.add_argument("codes", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "update":
+        configure_client(args)
+        print(f"Downloading {args.current_url}")
+        print(f"Downloading {args.obsolete_url}")
+        try:
+            current, obsolete = update_holdings(args.holdings, args.current_url, args.obsolete_url)
+        except Exception as e:
+            print(f"Error: could not download the holdings lists: {e}")
+            sys.exit(1)
+        print(f"Saved {current} current and {obsolete} obsolete entries to {args.holdings}")
+        return
+
+    if not (args.holdings / CURRENT_FILE).exists():
+        print(f"Error: no holdings index in {args.holdings}; run pdb_holdings.py update first")
+        sys.exit(1)
+    holdings = PdbHoldings(args.holdings)
+    for code in args.codes:
+        if holdings.is_current(code):
+            print(f"{code}: current")
+        elif holdings.is_obsolete(code):
+            resolved = holdings.resolve(code)
+            print(f"{code}: obsolete, replaced by {', '.join(resolved) if resolved else 'nothing'}")
+        else:
+            print(f"{code}: not a PDB entry")
+    holdings.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,26 +8,67 @@ This script fetches molecule pages and extracts:
 - Categories from "Related PDB-101 Resources" section
 
 Output files:
-- molecule_data.json: Raw scraped data
+- molecules and categories tables in motm_data.sqlite (see motm_store.py)
+- molecule_data.json: Raw scraped data, exported from the store
 - category_updates.txt: Formatted updates for MotmByCategory.kt
 - corpus_updates.txt: Formatted updates for Corpus.kt
 
 Usage:
     pip install requests beautifulsoup4
-    python scrape_motm_categories.py [start_num] [end_num]
+    pip install lxml      (optional, faster parsing - see html_parse.py)
+    python scrape_motm_categories.py [start_num] [end_num] [--workers N] [--rate R]
 
 Example:
     python scrape_motm_categories.py 258 313
+    python scrape_motm_categories.py 1 315 --workers 4 --rate 3
+
+Pages are fetched by --workers threads (default 1) while a token bucket
+holds the global request rate to --rate requests per second (default 1).
+Use --base-url to point the scraper at a local stand-in server.
+
+Responses are kept in the shared on-disk cache (see motm_http.py);
+--trust-cache re-runs a range without touching the network.
+
+With --incremental only the MotM entries missing from the Kotlin sources
+in mollib are fetched (see kotlin_sources.py); new entries after
+Corpus.numMonths are found by probing the site:
+    python scrape_motm_categories.py --incremental
+
+With --auto the range runs from Corpus.numMonths + 1 (or the one number
+given) to the newest MotM online, found with a few HEAD requests
+(exponential then binary search, see find_latest_motm in motm_http.py),
+so a monthly run needs no end_num:
+    python scrape_motm_categories.py --auto
+
+Finished pages are written to a progress journal as they arrive (see
+motm_journal.py); after a crash, re-run the same command with --resume to
+fetch only the pages that are still missing:
+    python scrape_motm_categories.py 1 315 --resume
+
+With --parse-workers N the pages are parsed in N worker processes while
+the fetch threads keep downloading (see fetch_parse_ordered in
+motm_fetch.py), so parsing is spread over all cores:
+    python scrape_motm_categories.py 1 315 --workers 4 --parse-workers 4
 """
 
-import json
+import argparse
 import re
 import sys
-import time
+from functools import partial
 from pathlib import Path
+from urllib.parse import urlparse
+
+from html_parse import PARSER_BACKENDS, parse_page
+from motm_fetch import DEFAULT_RATE, TokenBucket, fetch_ordered, fetch_parse_ordered, host_rate_limiter
+from motm_http import (MOTM_URL_PREFIX, add_cache_arguments, add_client_arguments, auto_motm_numbers,
+                       configure_cache, configure_client, fetch_molecule_page, incremental_motm_numbers)
+from motm_journal import add_journal_arguments, open_journal
+from motm_store import STORE_PATH, MotmStore, add_store_arguments, write_json
+from kotlin_sources import read_num_months
 
 try:
-    import requests
+    # requests is only used through motm_http; imported here to report it missing up front
+    import requests  # noqa: F401
     from bs4 import BeautifulSoup
 except ImportError:
     print("Error: Required packages not installed.")
@@ -86,6 +127,14 @@ CATEGORY_SECTIONS = {
     "Protein Structure Prediction": "Structures",
 }
 
+# Site category names that are another name for an existing MotmByCategory.kt
+# block; their entries are merged into that block instead of starting a new one
+CATEGORY_ALIASES = {
+    "Integrative/Hybrid Methods": "Hybrid Methods",
+    "Nobel Prizes and PDB structures": "Nobel Prizes and PDB Structures",
+    "Protein Structure Prediction, Design, and Computed Structure Models": "Protein Structure Prediction",
+}
+
 # Existing categories in MotmByCategory.kt (for reference)
 EXISTING_HEALTH_CATEGORIES = [
     "You and Your Health", "Immune System", "HIV and AIDS", "Diabetes",
@@ -107,29 +156,29 @@ EXISTING_STRUCTURES_CATEGORIES = [
 ]
 
 
-def fetch_molecule_page(molecule_num: int, retries: int = 3) -> str:
-    """Fetch HTML for a molecule page with retry logic."""
-    url = f"https://pdb101.rcsb.org/motm/{molecule_num}"
-
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            if attempt < retries - 1:
-                wait_time = 2 ** attempt
-                print(f"  Retry {attempt + 1} for molecule {molecule_num} (waiting {wait_time}s)...")
-                time.sleep(wait_time)
-            else:
-                print(f"  ERROR: Failed to fetch molecule {molecule_num}: {e}")
-                return None
-    return None
+def canonical_category(category: str) -> str:
+    """The MotmByCategory.kt block name for a category name from the site."""
+    return CATEGORY_ALIASES.get(category, category)
+
 
+# Section to array name in MotmByCategory.kt
+SECTION_ARRAY_NAMES = {
+    "Health": "MotmCategoryHealth",
+    "Life": "MotmCategoryLife",
+    "Biotech": "MotmCategoryBiotech",
+    "Structures": "MotmCategoryStructures"
+}
+
+
+def extract_molecule_data(html: str, molecule_num: int, soup: BeautifulSoup = None,
+                          backend: str = "auto") -> dict:
+    """Extract title, tagline, and categories from molecule page.
 
-def extract_molecule_data(html: str, molecule_num: int) -> dict:
-    """Extract title, tagline, and categories from molecule page."""
-    soup = BeautifulSoup(html, 'html.parser')
+    A parse tree already built for the page can be passed in as soup,
+    otherwise a strained tree is built with the given parser backend.
+    """
+    if soup is None:
+        soup = parse_page(html, backend, molecule_tags_only=True)
 
     data = {
         "number": molecule_num,
@@ -220,6 +269,7 @@ def categorize_molecules(all_molecules: list) -> dict:
         num = str(mol["number"])
         for cat in mol["categories"]:
             section = CATEGORY_SECTIONS.get(cat)
+            cat = canonical_category(cat)
             if section:
                 if cat not in sections[section]:
                     sections[section][cat] = []
@@ -243,12 +293,7 @@ def generate_kotlin_category_updates(sections: dict) -> str:
     output.append("")
 
     section_order = ["Health", "Life", "Biotech", "Structures"]
-    section_names = {
-        "Health": "MotmCategoryHealth",
-        "Life": "MotmCategoryLife",
-        "Biotech": "MotmCategoryBiotech",
-        "Structures": "MotmCategoryStructures"
-    }
+    section_names = SECTION_ARRAY_NAMES
 
     existing_categories = {
         "Health": EXISTING_HEALTH_CATEGORIES,
@@ -288,9 +333,10 @@ def generate_kotlin_corpus_updates(all_molecules: list) -> str:
     output.append("=" * 60)
 
     # numMonths update
-    max_num = max(m["number"] for m in all_molecules)
-    output.append(f"\n// Update numMonths constant:")
-    output.append(f"private const val numMonths = {max_num}")
+    if all_molecules:
+        max_num = max(m["number"] for m in all_molecules)
+        output.append(f"\n// Update numMonths constant:")
+        output.append(f"private const val numMonths = {max_num}")
 
     # corpus list entries
     output.append("\n// Add to corpus list:")
@@ -309,56 +355,41 @@ def generate_kotlin_corpus_updates(all_molecules: list) -> str:
 
     # thumbnail hints
     output.append("\n// Add to motmThumbnailImageList:")
-    output.append("// NOTE: These are hints - actual filenames may differ")
+    output.append("// (files are made by fetch_thumbnails.py; *-homepage-tn.png names are placeholders)")
     for mol in sorted(all_molecules, key=lambda x: x["number"]):
-        # Generate a placeholder filename based on title
-        safe_title = re.sub(r'[^a-zA-Z0-9]', '_', mol["title"])[:30]
-        output.append(f'            "{mol["number"]}-{safe_title}-homepage-tn.png",')
+        output.append(f'            "{thumbnail_filename(mol)}",')
 
     return "\n".join(output)
 
 
-def main():
-    # Parse command line arguments
-    start_num = 258
-    end_num = 313
-
-    if len(sys.argv) >= 3:
-        start_num = int(sys.argv[1])
-        end_num = int(sys.argv[2])
-    elif len(sys.argv) == 2:
-        end_num = int(sys.argv[1])
-
-    print(f"Scraping molecules {start_num} to {end_num}...")
-    print(f"Total: {end_num - start_num + 1} molecules")
-    print()
-
-    # Scrape all molecules
-    all_molecules = []
-
-    for num in range(start_num, end_num + 1):
-        print(f"Fetching molecule {num}...", end=" ", flush=True)
-
-        html = fetch_molecule_page(num)
-        if html:
-            data = extract_molecule_data(html, num)
-            all_molecules.append(data)
-            print(f"OK - {data['title']} ({len(data['categories'])} categories)")
-        else:
-            print("FAILED")
+def thumbnail_filename(mol: dict) -> str:
+    """
+    Thumbnail filename for motmThumbnailImageList.
 
-        # Rate limiting - be nice to the server
-        time.sleep(1)
+    Named after the og:image the page points at ("N-<image name>-tn.png"),
+    which is the file fetch_thumbnails.py writes.  Without a hint, a
+    placeholder based on the title is returned.
+    """
+    hint = mol.get("thumbnail_hint")
+    if hint:
+        stem = re.sub(r'[^A-Za-z0-9_-]', '_', Path(urlparse(hint).path).stem)
+        if not stem.startswith(f'{mol["number"]}-'):
+            stem = f'{mol["number"]}-{stem}'
+        return f'{stem}-tn.png'
+    safe_title = re.sub(r'[^a-zA-Z0-9]', '_', mol["title"])[:30]
+    return f'{mol["number"]}-{safe_title}-homepage-tn.png'
 
-    print(f"\nSuccessfully scraped {len(all_molecules)} molecules")
 
-    # Create output directory
-    output_dir = Path(__file__).parent
+def save_molecule_outputs(all_molecules: list, output_dir: Path, store_path: Path = STORE_PATH):
+    """Upsert into the metadata store, then write molecule_data.json, category_updates.txt and corpus_updates.txt."""
+    with MotmStore(store_path) as store:
+        store.upsert_molecules(all_molecules)
+        all_molecules = store.molecules(mol["number"] for mol in all_molecules)
+    print(f"Updated {len(all_molecules)} molecules in: {store_path}")
 
     # Save raw data as JSON
     json_path = output_dir / "molecule_data.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(all_molecules, f, indent=2, ensure_ascii=False)
+    write_json(json_path, all_molecules)
     print(f"Saved raw data to: {json_path}")
 
     # Categorize molecules
@@ -395,7 +426,107 @@ def main():
         total = sum(len(mols) for mols in sections["Unknown"].values())
         print(f"Unknown: {total} entries need manual mapping")
 
-    print("\nDone! Review the output files and apply updates to Kotlin files.")
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape MotM titles, taglines and categories")
+    parser.add_argument("range", nargs="*", type=int,
+                        help="[start_num] end_num (default 258 313)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of concurrent fetch threads (default 1)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse pages in N worker processes while fetching continues "
+                             "(default 0: parse in the main process)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="global starting request rate in requests/second (default 1)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="keep --rate fixed instead of adapting it to server responses")
+    parser.add_argument("--base-url", default=MOTM_URL_PREFIX,
+                        help="MotM page URL prefix, e.g. a local test server")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only fetch MotM entries missing from the Kotlin sources "
+                             "(end_num, if given, caps the search for new entries)")
+    parser.add_argument("--auto", action="store_true",
+                        help="scrape from start_num (default Corpus.numMonths + 1) to the newest "
+                             "MotM entry online")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="auto",
+                        help="HTML parser backend (default auto: lxml if installed)")
+    add_cache_arguments(parser)
+    add_client_arguments(parser)
+    add_journal_arguments(parser)
+    add_store_arguments(parser)
+    args = parser.parse_args()
+
+    args.start_num = 258
+    args.end_num = 313
+    if len(args.range) >= 2:
+        args.start_num, args.end_num = args.range[0], args.range[1]
+    elif len(args.range) == 1:
+        args.end_num = args.range[0]
+    return args
+
+
+def main():
+    args = parse_args()
+    configure_cache(args)
+    configure_client(args)
+    limiter = TokenBucket(args.rate) if args.fixed_rate else host_rate_limiter(args.base_url, args.rate)
+
+    if args.incremental:
+        end_num = args.end_num if args.range else None
+        numbers = incremental_motm_numbers(read_num_months(), end_num=end_num,
+                                           limiter=limiter, base_url=args.base_url)
+        print(f"Incremental update: {len(numbers)} molecules missing from the Kotlin sources")
+        if not numbers:
+            print("No new MotM entries")
+            return
+    elif args.auto:
+        numbers = auto_motm_numbers(read_num_months(), args.range[0] if args.range else None,
+                                    limiter=limiter, base_url=args.base_url)
+        if not numbers:
+            print("No new MotM entries online")
+            return
+        print(f"Scraping molecules {numbers[0]} to {numbers[-1]}...")
+    else:
+        numbers = range(args.start_num, args.end_num + 1)
+        print(f"Scraping molecules {args.start_num} to {args.end_num}...")
+    print(f"Total: {len(numbers)} molecules")
+    print(f"Workers: {args.workers}, rate limit: {args.rate} requests/second")
+    print()
+
+    # Scrape all molecules - rate limiting is shared across all workers
+    def fetch(num):
+        return fetch_molecule_page(num, limiter=limiter, base_url=args.base_url)
+
+    # Finished pages go to the progress journal; failed ones are retried on --resume
+    journal = open_journal(args, "scrape_motm_categories")
+    todo = [num for num in numbers if num not in journal]
+
+    parse = partial(extract_molecule_data, backend=args.parser)
+    if args.parse_workers > 0:
+        pages = fetch_parse_ordered(todo, fetch, parse, args.workers, args.parse_workers)
+    else:
+        pages = ((num, parse(html, num) if html else None)
+                 for num, html in fetch_ordered(todo, fetch, args.workers))
+
+    for num, data in pages:
+        print(f"Fetching molecule {num}...", end=" ", flush=True)
+
+        if data:
+            journal.record(num, data)
+            print(f"OK - {data['title']} ({len(data['categories'])} categories)")
+        else:
+            print("FAILED")
+
+    results = journal.results(numbers)
+    journal.close()
+    all_molecules = [results[num] for num in numbers if num in results]
+
+    print(f"\nSuccessfully scraped {len(all_molecules)} molecules")
+
+    save_molecule_outputs(all_molecules, Path(__file__).parent, args.db)
+
+    print("\nDone! Review the output files, then run merge_kotlin.py to apply them to the Kotlin files.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Scrape Molecule of the Month pages once for both categories and PDB codes
+
+scrape_motm_categories.py and scrape_pdb_codes.py each download and parse
+the same /motm/N pages.  This script fetches each page once, builds one
+parse tree, and runs extract_molecule_data and extract_pdb_codes on it.
+
+Output files (same as the two separate scripts, including the
+motm_data.sqlite tables):
+- molecule_data.json, category_updates.txt, corpus_updates.txt
+- pdb_codes.json, pdb_updates.txt
+
+Usage:
+    python scrape_motm_pages.py [start_num] [end_num] [--workers N] [--rate R]
+
+Example:
+    python scrape_motm_pages.py 314 315
+
+With --incremental only the MotM entries missing from the Kotlin sources
+in mollib are fetched (see kotlin_sources.py); new entries after
+Corpus.numMonths are found by probing the site:
+    python scrape_motm_pages.py --incremental
+
+With --auto the range runs from Corpus.numMonths + 1 (or the one number
+given) to the newest MotM online, found with a few HEAD requests
+(exponential then binary search, see find_latest_motm in motm_http.py),
+so a monthly run needs no end_num:
+    python scrape_motm_pages.py --auto
+
+Finished pages are written to a progress journal as they arrive (see
+motm_journal.py); after a crash, re-run the same command with --resume to
+fetch only the pages that are still missing:
+    python scrape_motm_pages.py 1 315 --resume
+
+With --parse-workers N the pages are parsed in N worker processes while
+the fetch threads keep downloading (see fetch_parse_ordered in
+motm_fetch.py), so parsing is spread over all cores:
+    python scrape_motm_pages.py 1 315 --workers 4 --parse-workers 4
+"""
+
+import argparse
+import sys
+from functools import partial
+from pathlib import Path
+
+try:
+    # Only probed: the extractors import bs4 themselves; report it missing up front
+    import bs4  # noqa: F401
+except ImportError:
+    print("Error: Required packages not installed.")
+    print("Run: pip install requests beautifulsoup4")
+    sys.exit(1)
+
+from html_parse import PARSER_BACKENDS, parse_page
+from motm_fetch import DEFAULT_RATE, TokenBucket, fetch_ordered, fetch_parse_ordered, host_rate_limiter
+from motm_http import (MOTM_URL_PREFIX, add_cache_arguments, add_client_arguments, auto_motm_numbers,
+                       configure_cache, configure_client, fetch_molecule_page, incremental_motm_numbers)
+from motm_journal import add_journal_arguments, open_journal
+from motm_store import add_store_arguments
+from pdb_holdings import add_holdings_arguments, load_holdings
+from kotlin_sources import motm_numbers_without_pdbs, read_num_months
+from scrape_motm_categories import extract_molecule_data, save_molecule_outputs
+from scrape_pdb_codes import extract_pdb_codes, save_pdb_code_outputs
+
+
+def extract_page_data(html: str, molecule_num: int, backend: str = "auto", holdings=None) -> dict:
+    """Parse a page once and run both extractors on it."""
+    soup = parse_page(html, backend)
+    return {"molecule": extract_molecule_data(html, molecule_num, soup),
+            "pdb_codes": extract_pdb_codes(html, molecule_num, soup, holdings=holdings)}
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape MotM categories and PDB codes in one pass")
+    parser.add_argument("range", nargs="*", type=int,
+                        help="[start_num] end_num (default 258 313)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of concurrent fetch threads (default 1)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse pages in N worker processes while fetching continues "
+                             "(default 0: parse in the main process)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="global starting request rate in requests/second (default 1)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="keep --rate fixed instead of adapting it to server responses")
+    parser.add_argument("--base-url", default=MOTM_URL_PREFIX,
+                        help="MotM page URL prefix, e.g. a local test server")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only fetch MotM entries missing from the Kotlin sources "
+                             "(end_num, if given, caps the search for new entries)")
+    parser.add_argument("--auto", action="store_true",
+                        help="scrape from start_num (default Corpus.numMonths + 1) to the newest "
+                             "MotM entry online")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="auto",
+                        help="HTML parser backend (default auto: lxml if installed)")
+    parser.add_argument("--output-dir", type=Path, default=Path(__file__).parent,
+                        help="directory for the JSON and *_updates.txt outputs (default: this directory)")
+    add_cache_arguments(parser)
+    add_client_arguments(parser)
+    add_journal_arguments(parser)
+    add_store_arguments(parser)
+    add_holdings_arguments(parser)
+    args = parser.parse_args()
+
+    args.start_num = 258
+    args.end_num = 313
+    if len(args.range) >= 2:
+        args.start_num, args.end_num = args.range[0], args.range[1]
+    elif len(args.range) == 1:
+        args.end_num = args.range[0]
+    return args
+
+
+def main():
+    args = parse_args()
+    configure_cache(args)
+    configure_client(args)
+    limiter = TokenBucket(args.rate) if args.fixed_rate else host_rate_limiter(args.base_url, args.rate)
+
+    if args.incremental:
+        end_num = args.end_num if args.range else None
+        numbers = incremental_motm_numbers(read_num_months(), motm_numbers_without_pdbs(),
+                                           end_num=end_num, limiter=limiter,
+                                           base_url=args.base_url)
+        print(f"Incremental update: {len(numbers)} molecules missing from the Kotlin sources")
+        if not numbers:
+            print("No new MotM entries")
+            return
+    elif args.auto:
+        numbers = auto_motm_numbers(read_num_months(), args.range[0] if args.range else None,
+                                    limiter=limiter, base_url=args.base_url)
+        if not numbers:
+            print("No new MotM entries online")
+            return
+        print(f"Scraping molecules {numbers[0]} to {numbers[-1]}...")
+    else:
+        numbers = range(args.start_num, args.end_num + 1)
+        print(f"Scraping molecules {args.start_num} to {args.end_num}...")
+    print(f"Total: {len(numbers)} molecules")
+    print(f"Workers: {args.workers}, rate limit: {args.rate} requests/second")
+    print()
+
+    def fetch(num):
+        return fetch_molecule_page(num, limiter=limiter, base_url=args.base_url)
+
+    # Finished pages go to the progress journal; failed ones are retried on --resume
+    journal = open_journal(args, "scrape_motm_pages")
+    todo = [num for num in numbers if num not in journal]
+
+    parse = partial(extract_page_data, backend=args.parser, holdings=load_holdings(args))
+    if args.parse_workers > 0:
+        pages = fetch_parse_ordered(todo, fetch, parse, args.workers, args.parse_workers)
+    else:
+        pages = ((num, parse(html, num) if html else None)
+                 for num, html in fetch_ordered(todo, fetch, args.workers))
+
+    for num, page in pages:
+        print(f"Fetching molecule {num}...", end=" ", flush=True)
+
+        if page:
+            data = page["molecule"]
+            codes = page["pdb_codes"]
+            journal.record(num, page)
+            print(f"OK - {data['title']} ({len(data['categories'])} categories, "
+                  f"{len(codes['pdb_codes'])} PDB codes)")
+        else:
+            print("FAILED")
+
+    results = journal.results(numbers)
+    journal.close()
+    all_molecules = [results[num]["molecule"] for num in numbers if num in results]
+    all_pdb_codes = [results[num]["pdb_codes"] if num in results else {"number": num, "pdb_codes": []}
+                     for num in numbers]
+
+    print(f"\nSuccessfully scraped {len(all_molecules)} molecules")
+
+    save_molecule_outputs(all_molecules, args.output_dir, args.db)
+    print()
+    save_pdb_code_outputs(all_pdb_codes, args.output_dir, args.db)
+
+    print("\nDone! Review the output files, then run merge_kotlin.py to apply them to the Kotlin files.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ This script fetches molecule pages and extracts PDB codes from:
 - Direct PDB code references in the text
 
 Output:
-- pdb_codes.json: Raw scraped data
+- motm_pdb table in motm_data.sqlite (see motm_store.py)
+- pdb_codes.json: Raw scraped data, exported from the store
 - pdb_updates.txt: Formatted Kotlin entries for PDBs.kt
 
 Usage:
@@ -15,95 +16,131 @@ Usage:
 
 Example:
     python scrape_pdb_codes.py 278 313
+
+Responses are kept in the shared on-disk cache (see motm_http.py), so a
+range already fetched by scrape_motm_categories.py is not downloaded again.
+
+With --incremental only the MotM entries missing from the Kotlin sources
+in mollib are fetched (see kotlin_sources.py); new entries after
+Corpus.numMonths are found by probing the site:
+    python scrape_pdb_codes.py --incremental
+
+With --auto the range runs from Corpus.numMonths + 1 (or the one number
+given) to the newest MotM online, found with a few HEAD requests
+(exponential then binary search, see find_latest_motm in motm_http.py),
+so a monthly run needs no end_num:
+    python scrape_pdb_codes.py --auto
+
+Finished pages are written to a progress journal as they arrive (see
+motm_journal.py); after a crash, re-run the same command with --resume to
+fetch only the pages that are still missing:
+    python scrape_pdb_codes.py 1 315 --resume
+
+If the PDB holdings index has been downloaded (python pdb_holdings.py
+update), every code is checked against it locally: obsolete entries are
+replaced by their successors, and text matches that are not PDB entries
+are dropped before they reach PDBs.kt or scrape_pdb_info.py.
 """
 
-import json
+import argparse
 import re
 import sys
-import time
 from pathlib import Path
 
 try:
-    import requests
+    # requests is only used through motm_http; imported here to report it missing up front
+    import requests  # noqa: F401
     from bs4 import BeautifulSoup
 except ImportError:
     print("Error: Required packages not installed.")
     print("Run: pip install requests beautifulsoup4")
     sys.exit(1)
 
+from html_parse import PARSER_BACKENDS, parse_page
+from motm_fetch import DEFAULT_RATE, TokenBucket, host_rate_limiter
+from motm_http import (MOTM_URL_PREFIX, add_cache_arguments, add_client_arguments, auto_motm_numbers,
+                       configure_cache, configure_client, fetch_molecule_page, incremental_motm_numbers)
+from motm_journal import add_journal_arguments, open_journal
+from motm_store import STORE_PATH, MotmStore, add_store_arguments, write_json
+from pdb_holdings import add_holdings_arguments, load_holdings
+from kotlin_sources import motm_numbers_without_pdbs, read_num_months
 
-def fetch_molecule_page(molecule_num: int, retries: int = 3) -> str:
-    """Fetch HTML for a molecule page with retry logic."""
-    url = f"https://pdb101.rcsb.org/motm/{molecule_num}"
 
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            if attempt < retries - 1:
-                wait_time = 2 ** attempt
-                print(f"  Retry {attempt + 1} for molecule {molecule_num} (waiting {wait_time}s)...")
-                time.sleep(wait_time)
-            else:
-                print(f"  ERROR: Failed to fetch molecule {molecule_num}: {e}")
-                return None
-    return None
+# PDB code extraction patterns, compiled once at import.
+# Links to RCSB structure pages: /structure/XXXX or /3d-view/XXXX
+LINK_PATTERN = re.compile(r'/(structure|3d-view)/([0-9A-Za-z]{4})(?![0-9A-Za-z])')
 
+# PDB codes in text: digit followed by 3 alphanumerics
+# Common patterns: "PDB entry 1abc", "structure 7xyz", etc.
+CODE_PATTERN = re.compile(r'\b([0-9][0-9A-Za-z]{3})\b')
 
-def extract_pdb_codes(html: str, molecule_num: int) -> dict:
-    """Extract PDB codes from molecule page."""
-    soup = BeautifulSoup(html, 'html.parser')
+# Explicit mentions: "PDB ID: XXXX" or "PDB: XXXX" or "PDB entry XXXX"
+# These are kept even when is_likely_pdb_code rejects them
+EXPLICIT_PATTERN = re.compile(r'PDB[:\s]+(?:ID[:\s]+)?(?:entry[:\s]+)?([0-9][0-9A-Za-z]{3})\b', re.IGNORECASE)
 
-    data = {
-        "number": molecule_num,
-        "pdb_codes": []
-    }
+# Common numbers that look like PDB codes (years are rejected as all-digit codes)
+EXCLUDED_CODES = frozenset({'1000', '2000', '3000', '4000', '5000', '100k', '200k'})
 
-    pdb_codes = set()
 
-    # Method 1: Look for links to RCSB structure pages
-    # Pattern: /structure/XXXX or rcsb.org/structure/XXXX
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-
-        # Match /structure/XXXX patterns
-        match = re.search(r'/structure/([0-9A-Za-z]{4})(?:[^0-9A-Za-z]|$)', href)
-        if match:
-            pdb_code = match.group(1).lower()
-            pdb_codes.add(pdb_code)
-            continue
+def link_pdb_code(href: str) -> str:
+    """PDB code of a /structure/XXXX link, else of a /3d-view/XXXX link, else None."""
+    if '/structure/' not in href and '/3d-view/' not in href:
+        return None
+    matches = LINK_PATTERN.findall(href)
+    for kind, code in matches:
+        if kind == 'structure':
+            return code.lower()
+    return matches[0][1].lower() if matches else None
 
-        # Match rcsb.org/3d-view/XXXX patterns
-        match = re.search(r'/3d-view/([0-9A-Za-z]{4})(?:[^0-9A-Za-z]|$)', href)
-        if match:
-            pdb_code = match.group(1).lower()
-            pdb_codes.add(pdb_code)
 
-    # Method 2: Look for PDB codes in text (4 alphanumeric, starting with digit)
-    # PDB codes typically start with a digit and have 4 characters
-    text = soup.get_text()
+def text_pdb_codes(text: str) -> set:
+    """PDB codes mentioned in page text."""
+    candidates = {code.lower() for code in CODE_PATTERN.findall(text)}
+    rejected = {code for code in candidates if not is_likely_pdb_code(code)}
+    pdb_codes = candidates - rejected
 
-    # Pattern for PDB codes: digit followed by 3 alphanumerics
-    # Common patterns: "PDB entry 1abc", "structure 7xyz", etc.
-    pdb_pattern = re.compile(r'\b([0-9][0-9A-Za-z]{3})\b')
+    # Every explicit mention is also a candidate, so the explicit scan is
+    # only needed to rescue candidates the filter rejected
+    if rejected:
+        pdb_codes.update(rejected.intersection(code.lower() for code in EXPLICIT_PATTERN.findall(text)))
+    return pdb_codes
 
-    for match in pdb_pattern.finditer(text):
-        potential_code = match.group(1).lower()
-        # Filter out obvious non-PDB codes (years, common numbers)
-        if not is_likely_pdb_code(potential_code):
-            continue
-        pdb_codes.add(potential_code)
 
-    # Method 3: Look for specific PDB mention patterns
-    # "PDB ID: XXXX" or "PDB: XXXX" or "PDB entry XXXX"
-    pdb_explicit = re.compile(r'PDB[:\s]+(?:ID[:\s]+)?(?:entry[:\s]+)?([0-9][0-9A-Za-z]{3})\b', re.IGNORECASE)
-    for match in pdb_explicit.finditer(text):
-        pdb_code = match.group(1).lower()
-        pdb_codes.add(pdb_code)
+def extract_pdb_codes(html: str, molecule_num: int, soup: BeautifulSoup = None,
+                      backend: str = "auto", holdings=None) -> dict:
+    """Extract PDB codes from molecule page.
+
+    A parse tree already built for the page can be passed in as soup,
+    otherwise one is built with the given parser backend.  With a
+    PdbHoldings index, obsolete codes are replaced by their successors and
+    text matches that are not PDB entries at all are dropped.
+    """
+    if soup is None:
+        soup = parse_page(html, backend)
+
+    data = {
+        "number": molecule_num,
+        "pdb_codes": []
+    }
 
-    data["pdb_codes"] = sorted(list(pdb_codes))
+    # Method 1: Look for links to RCSB structure pages
+    link_codes = {link_pdb_code(link['href']) for link in soup.find_all('a', href=True)}
+    link_codes.discard(None)
+
+    # Methods 2 and 3: PDB codes and explicit PDB mentions in the text
+    text_codes = text_pdb_codes(soup.get_text()) - link_codes
+
+    if holdings is None:
+        pdb_codes = link_codes | text_codes
+    else:
+        pdb_codes = set()
+        for code in link_codes:
+            # A structure link is kept even if the index predates the entry
+            pdb_codes.update(holdings.resolve(code) or [code])
+        for code in text_codes:
+            pdb_codes.update(holdings.resolve(code))
+
+    data["pdb_codes"] = sorted(pdb_codes)
     return data
 
 
@@ -111,20 +148,13 @@ def is_likely_pdb_code(code: str) -> bool:
     """Filter out unlikely PDB codes."""
     code = code.lower()
 
-    # Exclude years (1900-2099)
-    if re.match(r'^(19|20)\d{2}$', code):
-        return False
-
     # Exclude common number patterns
-    excluded = {'1000', '2000', '3000', '4000', '5000', '100k', '200k'}
-    if code in excluded:
+    if code in EXCLUDED_CODES:
         return False
 
     # PDB codes should have at least one letter after the first digit
-    if code[1:].isdigit():
-        return False
-
-    return True
+    # (this also excludes years)
+    return not code[1:].isdigit()
 
 
 def generate_kotlin_updates(all_molecules: list) -> str:
@@ -149,52 +179,20 @@ def generate_kotlin_updates(all_molecules: list) -> str:
     return "\n".join(output)
 
 
-def main():
-    # Parse command line arguments
-    start_num = 278
-    end_num = 313
-
-    if len(sys.argv) >= 3:
-        start_num = int(sys.argv[1])
-        end_num = int(sys.argv[2])
-    elif len(sys.argv) == 2:
-        end_num = int(sys.argv[1])
-
-    print(f"Scraping PDB codes for molecules {start_num} to {end_num}...")
-    print(f"Total: {end_num - start_num + 1} molecules")
-    print()
-
-    # Scrape all molecules
-    all_molecules = []
-
-    for num in range(start_num, end_num + 1):
-        print(f"Fetching molecule {num}...", end=" ", flush=True)
-
-        html = fetch_molecule_page(num)
-        if html:
-            data = extract_pdb_codes(html, num)
-            all_molecules.append(data)
-            print(f"OK - {len(data['pdb_codes'])} PDB codes found")
-        else:
-            print("FAILED")
-            all_molecules.append({"number": num, "pdb_codes": []})
-
-        # Rate limiting
-        time.sleep(1)
-
-    print(f"\nSuccessfully scraped {len(all_molecules)} molecules")
+def save_pdb_code_outputs(all_molecules: list, output_dir: Path, store_path: Path = STORE_PATH):
+    """Upsert into the metadata store, then write pdb_codes.json and pdb_updates.txt."""
+    with MotmStore(store_path) as store:
+        run = store.upsert_pdb_codes(all_molecules)
+        all_molecules = store.pdb_code_entries(mol["number"] for mol in all_molecules)
+    print(f"Updated {len(all_molecules)} pages in: {store_path} (run {run})")
 
     # Calculate stats
     total_codes = sum(len(m["pdb_codes"]) for m in all_molecules)
     print(f"Total PDB codes found: {total_codes}")
 
-    # Create output directory
-    output_dir = Path(__file__).parent
-
     # Save raw data as JSON
     json_path = output_dir / "pdb_codes.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(all_molecules, f, indent=2, ensure_ascii=False)
+    write_json(json_path, all_molecules)
     print(f"Saved raw data to: {json_path}")
 
     # Generate Kotlin updates
@@ -214,7 +212,97 @@ def main():
             codes += f"... (+{len(mol['pdb_codes']) - 5} more)"
         print(f"Molecule {mol['number']}: {len(mol['pdb_codes'])} codes - {codes}")
 
-    print("\nDone! Review pdb_updates.txt and apply to PDBs.kt")
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape PDB codes from MotM pages")
+    parser.add_argument("range", nargs="*", type=int,
+                        help="[start_num] end_num (default 278 313)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="starting request rate in requests/second (default 1)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="keep --rate fixed instead of adapting it to server responses")
+    parser.add_argument("--base-url", default=MOTM_URL_PREFIX,
+                        help="MotM page URL prefix, e.g. a local test server")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only fetch MotM entries missing from the Kotlin sources "
+                             "(end_num, if given, caps the search for new entries)")
+    parser.add_argument("--auto", action="store_true",
+                        help="scrape from start_num (default Corpus.numMonths + 1) to the newest "
+                             "MotM entry online")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="auto",
+                        help="HTML parser backend (default auto: lxml if installed)")
+    add_cache_arguments(parser)
+    add_client_arguments(parser)
+    add_journal_arguments(parser)
+    add_store_arguments(parser)
+    add_holdings_arguments(parser)
+    args = parser.parse_args()
+
+    args.start_num = 278
+    args.end_num = 313
+    if len(args.range) >= 2:
+        args.start_num, args.end_num = args.range[0], args.range[1]
+    elif len(args.range) == 1:
+        args.end_num = args.range[0]
+    return args
+
+
+def main():
+    args = parse_args()
+    configure_cache(args)
+    configure_client(args)
+    limiter = TokenBucket(args.rate) if args.fixed_rate else host_rate_limiter(args.base_url, args.rate)
+    holdings = load_holdings(args)
+
+    if args.incremental:
+        end_num = args.end_num if args.range else None
+        numbers = incremental_motm_numbers(read_num_months(), motm_numbers_without_pdbs(),
+                                           end_num=end_num, limiter=limiter,
+                                           base_url=args.base_url)
+        print(f"Incremental update: {len(numbers)} molecules missing from the Kotlin sources")
+        if not numbers:
+            print("No new MotM entries")
+            return
+    elif args.auto:
+        numbers = auto_motm_numbers(read_num_months(), args.range[0] if args.range else None,
+                                    limiter=limiter, base_url=args.base_url)
+        if not numbers:
+            print("No new MotM entries online")
+            return
+        print(f"Scraping PDB codes for molecules {numbers[0]} to {numbers[-1]}...")
+    else:
+        numbers = range(args.start_num, args.end_num + 1)
+        print(f"Scraping PDB codes for molecules {args.start_num} to {args.end_num}...")
+    print(f"Total: {len(numbers)} molecules")
+    print()
+
+    # Scrape all molecules - the limiter only delays real network requests.
+    # Finished pages go to the progress journal; failed ones are retried on --resume
+    journal = open_journal(args, "scrape_pdb_codes")
+
+    for num in numbers:
+        if num in journal:
+            continue
+        print(f"Fetching molecule {num}...", end=" ", flush=True)
+
+        html = fetch_molecule_page(num, limiter=limiter, base_url=args.base_url)
+        if html:
+            data = extract_pdb_codes(html, num, backend=args.parser, holdings=holdings)
+            journal.record(num, data)
+            print(f"OK - {len(data['pdb_codes'])} PDB codes found")
+        else:
+            print("FAILED")
+
+    results = journal.results(numbers)
+    journal.close()
+    all_molecules = [results.get(num, {"number": num, "pdb_codes": []}) for num in numbers]
+
+    print(f"\nSuccessfully scraped {len(all_molecules)} molecules")
+
+    save_pdb_code_outputs(all_molecules, Path(__file__).parent, args.db)
+
+    print("\nDone! Review pdb_updates.txt, then run merge_kotlin.py to apply it to PDBs.kt")
 
 
 if __name__ == "__main__":
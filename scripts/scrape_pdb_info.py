@@ -2,23 +2,55 @@
 """
 Fetch PDB structure descriptions from RCSB PDB API
 
-This script reads pdb_codes.json and fetches the title/description
-for each PDB code from the RCSB API.
+This script reads the PDB codes found by the latest scrape_pdb_codes.py
+run from the metadata store (see motm_store.py) and fetches the
+title/description for each PDB code from the RCSB API.
 
 Output:
-- pdb_info.json: Raw fetched data
-- pdb_info_updates.txt: Formatted Kotlin entries for PdbInfoArray.kt
+- pdb_info table in motm_data.sqlite
+- pdb_info.json: Raw fetched data, exported from the store
+- pdb_info_updates.txt: Formatted entries for mollib/data/pdb_info.tsv
 
 Usage:
-    python scrape_pdb_info.py
-
-The script reads PDB codes from pdb_codes.json in the same directory.
+    python scrape_pdb_info.py [--batch-size N]
+
+A store that has no PDB codes yet is filled from pdb_codes.json in the
+same directory.
+Responses are kept in the shared on-disk cache (see motm_http.py).
+
+With --batch-size N the titles are requested N entries at a time through
+the RCSB GraphQL entries(entry_ids: [...]) query instead of one REST call
+per entry (at most MAX_BATCH_SIZE, 200, which keeps the GET URL short).
+Entries missing from a batch reply fall back to the REST call.
+
+With --incremental only codes that have no entry in pdb_info.tsv
+are fetched; this also picks up PDBs.kt codes that never had info added.
+
+Every fetched entry is written to a progress journal as it arrives (see
+motm_journal.py).  If a run dies part way, re-run it with --resume to
+fetch only the entries that are still missing or failed.
+
+With --sizes a second, batched pass records how big each structure is:
+the deposited atom count and polymer entity count (GraphQL, --batch-size
+or 100 entries per request) and the size of the .pdb.gz the app downloads
+from RCSB_PDB_DOWNLOAD (one HEAD request each; 0 means the entry is only
+available as mmCIF).  The sizes go to the pdb_size table, pdb_size.json
+and pdb_size_updates.txt, which merge_kotlin.py writes into
+PdbSizeArray.kt:
+    python scrape_pdb_info.py --batch-size 100 --sizes
+
+Codes that the PDB holdings index (see pdb_holdings.py) lists as obsolete
+are recorded as obsolete without a request and their current successors
+are fetched instead.  Codes the index does not know at all (entries
+released after the last pdb_holdings.py update) are fetched as usual.
 """
 
+import argparse
 import json
 import sys
 import time
 from pathlib import Path
+from urllib.parse import urlencode
 
 try:
     import requests
@@ -27,14 +59,43 @@ except ImportError:
     print("Run: pip install requests")
     sys.exit(1)
 
+from motm_fetch import TokenBucket, host_rate_limiter
+from motm_http import (add_cache_arguments, add_client_arguments, configure_cache, configure_client,
+                       http_get, http_head, retry_delay)
+from motm_journal import add_journal_arguments, open_journal
+from motm_store import MotmStore, add_store_arguments, write_json
+from pdb_holdings import add_holdings_arguments, load_holdings
+from kotlin_sources import pdb_codes_without_info, read_pdb_info_codes
+
+# RCSB allows reasonable request rates (requests per second)
+RCSB_RATE = 5.0
+
+RCSB_DATA_URL = "https://data.rcsb.org"
+
+ENTRY_TITLES_QUERY = "query($ids: [String!]!) { entries(entry_ids: $ids) { rcsb_id struct { title } } }"
+
+# Structure sizes for --sizes: counts from the data API, download size from
+# a HEAD of the .pdb.gz the app fetches (mollib URLs.RCSB_PDB_DOWNLOAD)
+RCSB_PDB_DOWNLOAD = "https://files.rcsb.org/download/"
+ENTRY_SIZES_QUERY = ("query($ids: [String!]!) { entries(entry_ids: $ids) "
+                     "{ rcsb_id rcsb_entry_info { deposited_atom_count polymer_entity_count } } }")
+SIZE_BATCH_SIZE = 100
 
-def fetch_pdb_info(pdb_code: str, retries: int = 3) -> dict:
+# The batch queries go out as GET requests, so the response cache and the
+# cassettes (both keyed by URL) cover them.  The IDs are part of the URL:
+# 200 of them make it about 3 KB, well below the 8 KB request line limit
+# common to web servers, past which a batch would fail with 414.
+MAX_BATCH_SIZE = 200
+
+
+def fetch_pdb_info(pdb_code: str, retries: int = 3, limiter: TokenBucket = None,
+                   data_url: str = RCSB_DATA_URL) -> dict:
     """Fetch PDB entry info from RCSB API."""
-    url = f"https://data.rcsb.org/rest/v1/core/entry/{pdb_code}"
+    url = f"{data_url}/rest/v1/core/entry/{pdb_code}"
 
     for attempt in range(retries):
         try:
-            response = requests.get(url, timeout=30)
+            response = http_get(url, limiter=limiter)
             if response.status_code == 404:
                 return {"pdb_code": pdb_code, "title": f"PDB entry {pdb_code}", "error": "not_found"}
             response.raise_for_status()
@@ -50,8 +111,8 @@ def fetch_pdb_info(pdb_code: str, retries: int = 3) -> dict:
             }
         except requests.RequestException as e:
             if attempt < retries - 1:
-                wait_time = 2 ** attempt
-                print(f"  Retry {attempt + 1} for {pdb_code} (waiting {wait_time}s)...")
+                wait_time = retry_delay(attempt, e)
+                print(f"  Retry {attempt + 1} for {pdb_code} (waiting {wait_time:.1f}s)...")
                 time.sleep(wait_time)
             else:
                 print(f"  ERROR: Failed to fetch {pdb_code}: {e}")
@@ -59,67 +120,314 @@ def fetch_pdb_info(pdb_code: str, retries: int = 3) -> dict:
     return {"pdb_code": pdb_code, "title": f"PDB entry {pdb_code}", "error": "max_retries"}
 
 
+def fetch_pdb_info_batch(pdb_codes: list, retries: int = 3, limiter: TokenBucket = None,
+                         data_url: str = RCSB_DATA_URL) -> list:
+    """Fetch PDB entry info for a batch of codes with one GraphQL request.
+
+    Codes that are missing from the reply (unknown or errored entries, or
+    the whole batch if the request fails) are fetched one by one with
+    fetch_pdb_info.
+    """
+    variables = json.dumps({"ids": [code.upper() for code in pdb_codes]})
+    url = f"{data_url}/graphql?" + urlencode({"query": ENTRY_TITLES_QUERY, "variables": variables})
+
+    titles = {}
+    for attempt in range(retries):
+        try:
+            response = http_get(url, limiter=limiter)
+            response.raise_for_status()
+            data = response.json()
+            for entry in (data.get("data") or {}).get("entries") or []:
+                title = ((entry or {}).get("struct") or {}).get("title")
+                if title:
+                    titles[entry["rcsb_id"].lower()] = title
+            break
+        except (requests.RequestException, ValueError) as e:
+            if attempt < retries - 1:
+                wait_time = retry_delay(attempt, e)
+                print(f"  Retry {attempt + 1} for batch of {len(pdb_codes)} (waiting {wait_time:.1f}s)...")
+                time.sleep(wait_time)
+            else:
+                print(f"  ERROR: Failed to fetch batch of {len(pdb_codes)}: {e}")
+
+    results = []
+    for pdb_code in pdb_codes:
+        if pdb_code.lower() in titles:
+            results.append({"pdb_code": pdb_code, "title": titles[pdb_code.lower()], "error": None})
+        else:
+            results.append(fetch_pdb_info(pdb_code, retries, limiter, data_url))
+    return results
+
+
+def fetch_all_pdb_info(pdb_list: list, batch_size: int = 0, limiter: TokenBucket = None,
+                       data_url: str = RCSB_DATA_URL):
+    """Yield PDB entry info for every code, batched through GraphQL if batch_size > 0."""
+    if batch_size <= 0:
+        for pdb in pdb_list:
+            yield fetch_pdb_info(pdb, limiter=limiter, data_url=data_url)
+        return
+
+    batch_size = min(batch_size, MAX_BATCH_SIZE)
+    for start in range(0, len(pdb_list), batch_size):
+        yield from fetch_pdb_info_batch(pdb_list[start:start + batch_size],
+                                        limiter=limiter, data_url=data_url)
+
+
+def fetch_pdb_download_size(pdb_code: str, retries: int = 3, limiter: TokenBucket = None,
+                            download_url: str = RCSB_PDB_DOWNLOAD):
+    """Bytes of the entry's .pdb.gz download, 0 if it has none (mmCIF only), None on failure."""
+    url = f"{download_url}{pdb_code.lower()}.pdb.gz"
+    for attempt in range(retries):
+        try:
+            response = http_head(url, limiter=limiter)
+            if response.status_code == 404:
+                return 0
+            response.raise_for_status()
+            length = response.headers.get("Content-Length")
+            return int(length) if length and length.isdigit() else None
+        except requests.RequestException as e:
+            if attempt < retries - 1:
+                time.sleep(retry_delay(attempt, e))
+            else:
+                print(f"  ERROR: Failed to get the download size of {pdb_code}: {e}")
+    return None
+
+
+def fetch_pdb_sizes_batch(pdb_codes: list, retries: int = 3, limiter: TokenBucket = None,
+                          data_url: str = RCSB_DATA_URL, download_url: str = RCSB_PDB_DOWNLOAD) -> list:
+    """Fetch atom and polymer entity counts for a batch of codes with one GraphQL request,
+    plus one HEAD request per code for the download size."""
+    variables = json.dumps({"ids": [code.upper() for code in pdb_codes]})
+    url = f"{data_url}/graphql?" + urlencode({"query": ENTRY_SIZES_QUERY, "variables": variables})
+
+    counts = {}
+    failure = None
+    for attempt in range(retries):
+        try:
+            response = http_get(url, limiter=limiter)
+            response.raise_for_status()
+            data = response.json()
+            for entry in (data.get("data") or {}).get("entries") or []:
+                info = (entry or {}).get("rcsb_entry_info") or {}
+                if info.get("deposited_atom_count") is not None:
+                    counts[entry["rcsb_id"].lower()] = info
+            failure = None
+            break
+        except (requests.RequestException, ValueError) as e:
+            failure = str(e)
+            if attempt < retries - 1:
+                wait_time = retry_delay(attempt, e)
+                print(f"  Retry {attempt + 1} for size batch of {len(pdb_codes)} (waiting {wait_time:.1f}s)...")
+                time.sleep(wait_time)
+            else:
+                print(f"  ERROR: Failed to fetch size batch of {len(pdb_codes)}: {e}")
+
+    results = []
+    for pdb_code in pdb_codes:
+        info = counts.get(pdb_code.lower())
+        if info is None:
+            results.append({"pdb_code": pdb_code, "atom_count": None, "polymer_entity_count": None,
+                            "download_bytes": None, "error": failure or "not_found"})
+            continue
+        download_bytes = fetch_pdb_download_size(pdb_code, retries, limiter, download_url)
+        results.append({"pdb_code": pdb_code,
+                        "atom_count": info["deposited_atom_count"],
+                        "polymer_entity_count": info.get("polymer_entity_count") or 0,
+                        "download_bytes": download_bytes,
+                        "error": None if download_bytes is not None else "download_size"})
+    return results
+
+
+def fetch_all_pdb_sizes(pdb_list: list, batch_size: int = SIZE_BATCH_SIZE, limiter: TokenBucket = None,
+                        data_url: str = RCSB_DATA_URL, download_url: str = RCSB_PDB_DOWNLOAD):
+    """Yield structure sizes for every code, batch_size codes per GraphQL request."""
+    batch_size = min(batch_size, MAX_BATCH_SIZE)
+    for start in range(0, len(pdb_list), batch_size):
+        yield from fetch_pdb_sizes_batch(pdb_list[start:start + batch_size], limiter=limiter,
+                                         data_url=data_url, download_url=download_url)
+
+
 def escape_kotlin_string(s: str) -> str:
     """Escape special characters for Kotlin string literals."""
-    return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ').replace('\r', '')
+    return (s.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$')
+            .replace('\n', ' ').replace('\r', ''))
+
 
+def format_pdb_info_entry(info: dict) -> str:
+    """Format one "code<TAB>title" line for pdb_info.tsv."""
+    pdb = info["pdb_code"].lower()
+    title = " ".join(info["title"].split())
+    # Truncate very long titles
+    if len(title) > 200:
+        title = title[:197] + "..."
+    return f"{pdb}\t{title}"
 
-def generate_kotlin_updates(all_info: list) -> str:
-    """Generate Kotlin code for PdbInfoArray.kt updates."""
+
+def format_pdb_size_entry(size: dict) -> str:
+    """Format one PdbEntrySize line for PdbSizeArray.kt."""
+    return (f'        PdbEntrySize("{size["pdb_code"].lower()}", {size["atom_count"]}, '
+            f'{size["polymer_entity_count"]}, {size["download_bytes"]}),')
+
+
+def generate_kotlin_size_updates(all_sizes: list) -> str:
+    """Generate Kotlin code for PdbSizeArray.kt updates."""
     output = []
     output.append("=" * 60)
-    output.append("UPDATES FOR PdbInfoArray.kt")
+    output.append("UPDATES FOR PdbSizeArray.kt")
     output.append("=" * 60)
     output.append("")
-    output.append("// Add these entries before the closing ) of pdbInfoList")
-    output.append("// (after the last PdbEntryInfo entry, add a comma first)")
+    output.append("// PdbEntrySize(pdbName, atomCount, polymerEntityCount, downloadBytes)")
+    output.append("// Replace the pdbSizeList entries (or run merge_kotlin.py)")
+    output.append("")
+
+    for size in sorted(all_sizes, key=lambda x: x["pdb_code"].lower()):
+        if not size["error"]:
+            output.append(format_pdb_size_entry(size))
+
+    return "\n".join(output)
+
+
+def generate_pdb_info_updates(all_info: list) -> str:
+    """Generate the new pdb_info.tsv lines."""
+    output = []
+    output.append("# " + "=" * 58)
+    output.append("# UPDATES FOR mollib/data/pdb_info.tsv")
+    output.append("# " + "=" * 58)
+    output.append("#")
+    output.append("# Add these code<TAB>title lines in code order (or run merge_kotlin.py)")
     output.append("")
 
     # Sort by PDB code for consistent ordering
     sorted_info = sorted(all_info, key=lambda x: x["pdb_code"].lower())
 
     for info in sorted_info:
-        pdb = info["pdb_code"].lower()
-        title = escape_kotlin_string(info["title"])
-        # Truncate very long titles
-        if len(title) > 200:
-            title = title[:197] + "..."
-        output.append(f'            PdbEntryInfo("{pdb}", "{title}"),')
+        output.append(format_pdb_info_entry(info))
 
     return "\n".join(output)
 
 
-def main():
-    script_dir = Path(__file__).parent
-
-    # Read PDB codes from pdb_codes.json
-    pdb_codes_file = script_dir / "pdb_codes.json"
-    if not pdb_codes_file.exists():
-        print(f"Error: {pdb_codes_file} not found")
-        print("Run scrape_pdb_codes.py first to generate this file")
-        sys.exit(1)
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Fetch PDB entry titles from the RCSB API")
+    parser.add_argument("--rate", type=float, default=RCSB_RATE,
+                        help="starting request rate in requests/second (default 5)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="keep --rate fixed instead of adapting it to server responses")
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help=f"fetch N titles per GraphQL request, at most {MAX_BATCH_SIZE}: the IDs go "
+                             f"in the GET URL, which servers reject (414) past about 8 KB "
+                             f"(default 0: one REST request per entry)")
+    parser.add_argument("--rcsb-url", default=RCSB_DATA_URL,
+                        help="RCSB data API root, e.g. a local test server")
+    parser.add_argument("--sizes", action="store_true",
+                        help="also fetch atom counts, polymer entity counts and download sizes")
+    parser.add_argument("--download-url", default=RCSB_PDB_DOWNLOAD,
+                        help="PDB file download prefix for --sizes, e.g. a local test server")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only fetch codes that are missing from pdb_info.tsv")
+    add_cache_arguments(parser)
+    add_client_arguments(parser)
+    add_journal_arguments(parser)
+    add_store_arguments(parser)
+    parser.add_argument("--output-dir", type=Path, default=Path(__file__).parent,
+                        help="directory for the JSON and *_updates.txt outputs (default: this directory)")
+    add_holdings_arguments(parser)
+    args = parser.parse_args()
+    if args.batch_size > MAX_BATCH_SIZE:
+        parser.error(f"--batch-size is at most {MAX_BATCH_SIZE}")
+    return args
+
+
+def save_pdb_sizes(args, pdb_codes: list, limiter, output_dir: Path):
+    """The --sizes pass: fetch structure sizes, store them, write pdb_size.json and pdb_size_updates.txt."""
+    print(f"\nFetching structure sizes for {len(pdb_codes)} entries")
+    journal = open_journal(args, "scrape_pdb_sizes",
+                           is_complete=lambda size: size["error"] in (None, "not_found"))
+    todo = [pdb for pdb in pdb_codes if pdb not in journal]
+    batch_size = args.batch_size if args.batch_size > 0 else SIZE_BATCH_SIZE
+
+    for i, size in enumerate(fetch_all_pdb_sizes(todo, batch_size, limiter, args.rcsb_url, args.download_url)):
+        journal.record(size["pdb_code"], size)
+        if size["error"]:
+            print(f"[{i+1}/{len(todo)}] {size['pdb_code']}: ERROR: {size['error']}")
+        else:
+            print(f"[{i+1}/{len(todo)}] {size['pdb_code']}: {size['atom_count']} atoms, "
+                  f"{size['polymer_entity_count']} polymer entities, {size['download_bytes']} bytes")
+
+    results = journal.results(pdb_codes)
+    journal.close()
+    with MotmStore(args.db) as store:
+        store.upsert_pdb_sizes([results[pdb] for pdb in pdb_codes if pdb in results])
+        all_sizes = store.pdb_sizes(pdb_codes)
+    json_path = output_dir / "pdb_size.json"
+    write_json(json_path, all_sizes)
+    print(f"Saved structure sizes to: {json_path}")
+
+    kotlin_path = output_dir / "pdb_size_updates.txt"
+    with open(kotlin_path, 'w', encoding='utf-8') as f:
+        f.write(generate_kotlin_size_updates(all_sizes))
+    print(f"Saved Kotlin updates to: {kotlin_path}")
 
-    with open(pdb_codes_file, 'r', encoding='utf-8') as f:
-        molecules_data = json.load(f)
 
-    # Collect all unique PDB codes
-    all_pdb_codes = set()
-    for mol in molecules_data:
-        for pdb in mol.get("pdb_codes", []):
-            all_pdb_codes.add(pdb.lower())
+def main():
+    args = parse_args()
+    configure_cache(args)
+    configure_client(args)
+
+    # Read the PDB codes of the latest scrape_pdb_codes.py run from the
+    # metadata store; a store that predates pdb_codes.json is filled from it
+    with MotmStore(args.db) as store:
+        all_pdb_codes = store.pdb_codes(latest_run=True)
+        pdb_codes_file = args.output_dir / "pdb_codes.json"
+        if not all_pdb_codes and pdb_codes_file.exists():
+            with open(pdb_codes_file, 'r', encoding='utf-8') as f:
+                store.upsert_pdb_codes(json.load(f))
+            all_pdb_codes = store.pdb_codes(latest_run=True)
+    if not all_pdb_codes:
+        print(f"Error: no PDB codes in {args.db} or {pdb_codes_file}")
+        print("Run scrape_pdb_codes.py first to generate them")
+        sys.exit(1)
 
-    print(f"Found {len(all_pdb_codes)} unique PDB codes to fetch")
+    if args.incremental:
+        pdb_list = pdb_codes_without_info(all_pdb_codes)
+        print(f"Found {len(pdb_list)} PDB codes missing from pdb_info.tsv")
+        if not pdb_list:
+            print("No new PDB codes")
+            return
+    else:
+        pdb_list = all_pdb_codes
+        print(f"Found {len(all_pdb_codes)} unique PDB codes to fetch")
     print()
 
-    # Fetch info for each PDB code
-    all_info = []
-    pdb_list = sorted(list(all_pdb_codes))
-
-    for i, pdb in enumerate(pdb_list):
-        print(f"[{i+1}/{len(pdb_list)}] Fetching {pdb}...", end=" ", flush=True)
-
-        info = fetch_pdb_info(pdb)
-        all_info.append(info)
+    # Fetch info for each PDB code; on --resume, fetches that failed with a
+    # network error are retried (not_found and obsolete are final)
+    journal = open_journal(args, "scrape_pdb_info",
+                           is_complete=lambda info: info["error"] in (None, "not_found", "obsolete"))
+    todo = [pdb for pdb in pdb_list if pdb not in journal]
+
+    # Obsolete codes are replaced by their successors before any request.
+    # Codes the index does not list at all may be newer than the index, so
+    # they go through the normal fetch.
+    holdings = load_holdings(args)
+    if holdings:
+        known = read_pdb_info_codes(include_commented=True) if args.incremental else set()
+        obsolete = [pdb for pdb in todo if holdings.is_obsolete(pdb) and not holdings.is_current(pdb)]
+        for pdb in obsolete:
+            journal.record(pdb, {"pdb_code": pdb, "title": f"PDB entry {pdb}", "error": "obsolete"})
+            successors = holdings.resolve(pdb)
+            print(f"  {pdb} is obsolete, replaced by {', '.join(successors) if successors else 'nothing'}")
+            pdb_list += [code for code in successors if code not in pdb_list and code not in known]
+        if obsolete:
+            print(f"Skipped {len(obsolete)} obsolete codes")
+        todo = [pdb for pdb in pdb_list if pdb not in journal]
+
+    limiter = TokenBucket(args.rate) if args.fixed_rate else host_rate_limiter(args.rcsb_url, args.rate)
+
+    infos = fetch_all_pdb_info(todo, args.batch_size, limiter, args.rcsb_url)
+
+    for i, info in enumerate(infos):
+        print(f"[{i+1}/{len(todo)}] Fetched {info['pdb_code']}...", end=" ", flush=True)
+        journal.record(info["pdb_code"], info)
 
         if info["error"]:
             print(f"ERROR: {info['error']}")
@@ -128,8 +436,9 @@ def main():
             title_preview = info["title"][:50] + "..." if len(info["title"]) > 50 else info["title"]
             print(f"OK - {title_preview}")
 
-        # Rate limiting - RCSB allows reasonable request rates
-        time.sleep(0.2)
+    results = journal.results(pdb_list)
+    journal.close()
+    all_info = [results[pdb] for pdb in pdb_list if pdb in results]
 
     print(f"\nSuccessfully fetched {len(all_info)} PDB entries")
 
@@ -140,20 +449,26 @@ def main():
         for e in errors:
             print(f"  - {e['pdb_code']}: {e['error']}")
 
-    # Save raw data as JSON
-    json_path = script_dir / "pdb_info.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(all_info, f, indent=2, ensure_ascii=False)
-    print(f"\nSaved raw data to: {json_path}")
-
-    # Generate Kotlin updates
-    kotlin_updates = generate_kotlin_updates(all_info)
-    kotlin_path = script_dir / "pdb_info_updates.txt"
-    with open(kotlin_path, 'w', encoding='utf-8') as f:
-        f.write(kotlin_updates)
-    print(f"Saved Kotlin updates to: {kotlin_path}")
-
-    print("\nDone! Review pdb_info_updates.txt and apply to PdbInfoArray.kt")
+    # Save to the store, then export the raw data as JSON
+    with MotmStore(args.db) as store:
+        store.upsert_pdb_info(all_info)
+        all_info = store.pdb_infos(pdb_list)
+    print(f"\nUpdated {len(all_info)} PDB entries in: {args.db}")
+    json_path = args.output_dir / "pdb_info.json"
+    write_json(json_path, all_info)
+    print(f"Saved raw data to: {json_path}")
+
+    # Generate the pdb_info.tsv lines
+    updates = generate_pdb_info_updates(all_info)
+    updates_path = args.output_dir / "pdb_info_updates.txt"
+    with open(updates_path, 'w', encoding='utf-8') as f:
+        f.write(updates)
+    print(f"Saved pdb_info.tsv updates to: {updates_path}")
+
+    if args.sizes:
+        save_pdb_sizes(args, [info["pdb_code"] for info in all_info if not info["error"]], limiter, args.output_dir)
+
+    print("\nDone! Review pdb_info_updates.txt, then run merge_kotlin.py to apply it to pdb_info.tsv")
 
 
 if __name__ == "__main__":
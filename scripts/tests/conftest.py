@@ -0,0 +1,43 @@
+"""
+Shared setup for the script tests
+
+The scripts are run from scripts/ and import each other as top-level
+modules, so the tests put that directory on sys.path the same way.
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+
+def run_with_timeout(function, timeout: float = 10.0):
+    """
+    Call function() on a daemon thread and return its result or re-raise
+    its exception.  Fails the test instead of hanging if it does not
+    finish in `timeout` seconds.
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = function()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise AssertionError(f"did not finish within {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -0,0 +1,49 @@
+"""Tests for the posting list encoding and the search index of export_assets.py."""
+
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import SCRIPT_DIR
+from export_assets import (ASSET_PATH, KOTLIN_PATH, MotmDataAsset, build_asset, check_asset, decode_postings,
+                           encode_postings, read_datasets)
+
+
+@pytest.mark.parametrize("docs", [[], [0], [5], [0, 1, 2], [3, 130, 131, 20000, 70000]])
+def test_postings_round_trip(docs):
+    assert decode_postings(encode_postings(docs)) == docs
+
+
+def test_small_gaps_take_one_byte():
+    assert len(encode_postings(list(range(100)))) == 100
+    assert len(encode_postings([126, 300])) == 3
+
+
+def test_asset_matches_the_source_lists():
+    datasets = read_datasets()
+    assert check_asset(MotmDataAsset(build_asset(datasets)), datasets) == []
+
+
+def run_check(tmp_path) -> subprocess.CompletedProcess:
+    command = [sys.executable, str(SCRIPT_DIR / "export_assets.py"), "--check",
+               "--output", str(tmp_path / ASSET_PATH.name), "--kotlin", str(tmp_path / KOTLIN_PATH.name)]
+    return subprocess.run(command, capture_output=True, text=True, encoding="utf-8", timeout=120)
+
+
+def test_check_passes_on_the_committed_files(tmp_path):
+    shutil.copy(ASSET_PATH, tmp_path)
+    shutil.copy(KOTLIN_PATH, tmp_path)
+    result = run_check(tmp_path)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_check_fails_on_a_stale_asset_and_writes_nothing(tmp_path):
+    stale = ASSET_PATH.read_bytes()[:-1] + b"x"
+    (tmp_path / ASSET_PATH.name).write_bytes(stale)
+    result = run_check(tmp_path)
+    assert result.returncode == 1
+    assert "out of date" in result.stdout
+    assert (tmp_path / ASSET_PATH.name).read_bytes() == stale
+    assert not (tmp_path / KOTLIN_PATH.name).exists()
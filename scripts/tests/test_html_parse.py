@@ -0,0 +1,67 @@
+"""The HTML parser backends must give the page extractors identical results."""
+
+import pytest
+
+from conftest import FIXTURE_DIR
+from html_parse import HAVE_LXML, PARSER_BACKENDS, parse_page
+from scrape_motm_categories import extract_molecule_data
+from scrape_pdb_codes import extract_pdb_codes
+
+PAGES = sorted((int(path.stem), path.read_text(encoding="utf-8"))
+               for path in (FIXTURE_DIR / "pages").glob("*.html"))
+
+BACKENDS = [backend for backend in PARSER_BACKENDS if backend != "lxml" or HAVE_LXML]
+
+
+def page(number: int) -> str:
+    return dict(PAGES)[number]
+
+
+@pytest.mark.parametrize("number, html", PAGES, ids=[f"motm{number}" for number, _ in PAGES])
+def test_backends_give_identical_molecule_data(number, html):
+    reference = extract_molecule_data(html, number, parse_page(html, "html.parser"))
+    for backend in BACKENDS:
+        for strained in (False, True):
+            assert extract_molecule_data(html, number, parse_page(html, backend, strained)) == reference, \
+                f"{backend} (strained={strained})"
+        assert extract_molecule_data(html, number, backend=backend) == reference, backend
+
+
+@pytest.mark.parametrize("number, html", PAGES, ids=[f"motm{number}" for number, _ in PAGES])
+def test_backends_give_identical_pdb_codes(number, html):
+    reference = extract_pdb_codes(html, number, backend="html.parser")
+    for backend in BACKENDS:
+        assert extract_pdb_codes(html, number, backend=backend) == reference, backend
+
+
+def test_page_with_structure_links():
+    assert extract_pdb_codes(page(1), 1)["pdb_codes"] == ["1a6m", "1a6n", "1mbn", "1mbo"]
+    data = extract_molecule_data(page(1), 1)
+    assert data["title"] == "Myoglobin"
+    assert data["categories"] == ["Biological Energy", "Protein Synthesis"]
+
+
+def test_page_without_pdb_links():
+    assert extract_pdb_codes(page(2), 2)["pdb_codes"] == []
+    data = extract_molecule_data(page(2), 2)
+    assert data["title"] == "Anniversary Issue"
+    assert data["tagline"].startswith("Twenty years")
+    assert data["categories"] == []
+
+
+def test_page_with_nested_category_markup():
+    data = extract_molecule_data(page(3), 3)
+    assert len(data["categories"]) == 3
+    assert any("Enzymes" in category for category in data["categories"])
+    assert extract_pdb_codes(page(3), 3)["pdb_codes"] == ["1e79", "5ara"]
+
+
+def test_page_with_non_ascii_title():
+    data = extract_molecule_data(page(4), 4)
+    assert data["title"] == "β-Galactosidase & Lac Repressor — “Operón”"
+    assert "Ångström" in data["tagline"]
+    assert "Central Dogma – Génétique" in data["categories"]
+
+
+def test_fixture_pages_are_present():
+    assert [number for number, _ in PAGES] == [1, 2, 3, 4]
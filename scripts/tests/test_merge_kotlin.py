@@ -0,0 +1,67 @@
+"""Tests for merging scraped category membership into MotmByCategory.kt."""
+
+from merge_kotlin import merge_categories
+
+MOTM_BY_CATEGORY = """\
+object MotmByCategory {
+
+    val MotmCategoryHealth = arrayOf(
+        "Section Health",
+        "Cancer",
+        "100",  // Aaa
+    )
+
+    val MotmCategoryLife = arrayOf(
+        "Section Life",
+        "Enzymes",
+        "101",  // Bbb
+    )
+
+    val MotmCategoryBiotech = arrayOf(
+        "Section Biotech",
+        "Nanotechnology",
+        "102",  // Ccc
+    )
+
+    val MotmCategoryStructures = arrayOf(
+        "Section Structures",
+        "Hybrid Methods",
+        "103",  // Ddd
+        "Protein Structure Prediction",
+        "259",  // Designed Proteins
+        "287",  // AlphaFold
+    )
+}"""
+
+
+def molecule(number, title, *categories):
+    return {"number": number, "title": title, "categories": list(categories)}
+
+
+def test_aliased_category_merges_into_the_existing_block():
+    long_name = "Protein Structure Prediction, Design, and Computed Structure Models"
+    molecules = [molecule(259, "Designed Proteins", long_name),
+                 molecule(287, "AlphaFold", long_name),
+                 molecule(300, "Zymogen", long_name, "Integrative/Hybrid Methods")]
+    text, added = merge_categories(MOTM_BY_CATEGORY, molecules)
+
+    assert long_name not in text
+    assert "Integrative/Hybrid Methods" not in text
+    assert text.count('"259"') == 1 and text.count('"287"') == 1
+    assert sorted(added) == [("Hybrid Methods", "300"), ("Protein Structure Prediction", "300")]
+    lines = text.split("\n")
+    assert lines[lines.index('        "Protein Structure Prediction",') + 3].startswith('        "300",')
+    assert lines[lines.index('        "Hybrid Methods",') + 2].startswith('        "300",')
+
+
+def test_merge_is_idempotent_for_aliases():
+    molecules = [molecule(300, "Zymogen", "Integrative/Hybrid Methods")]
+    text, _ = merge_categories(MOTM_BY_CATEGORY, molecules)
+    again, added = merge_categories(text, molecules)
+    assert again == text and added == []
+
+
+def test_unaliased_new_category_gets_its_own_block():
+    text, added = merge_categories(MOTM_BY_CATEGORY, [molecule(300, "Zymogen", "Vaccines")])
+    assert added == [("Vaccines", "300")]
+    assert '        "Vaccines",' in text
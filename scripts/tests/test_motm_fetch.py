@@ -0,0 +1,213 @@
+"""Tests for the concurrent fetch helpers and rate limiters in motm_fetch.py."""
+
+import email.utils
+import random
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from conftest import run_with_timeout
+from motm_fetch import (AdaptiveRateLimiter, HostRateLimiter, fetch_ordered, fetch_parse_ordered,
+                        parse_retry_after)
+from motm_http import http_get
+
+
+def delayed_fetch(delays: dict, item: int) -> str:
+    """Stand-in for a page fetch that takes a different time for each item."""
+    time.sleep(delays[item])
+    return f"page {item}"
+
+
+def failing_fetch(bad_item: int, item: int) -> str:
+    if item == bad_item:
+        raise RuntimeError(f"fetch of {item} failed")
+    time.sleep(0.001)
+    return f"page {item}"
+
+
+def parse_page(raw: str, item: int) -> str:
+    """Runs in the parse processes, so it has to be a module-level function."""
+    return raw.upper()
+
+
+def random_delays(count: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    return {item: rng.uniform(0, 0.02) for item in range(count)}
+
+
+@pytest.mark.parametrize("workers", [1, 3, 8])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_fetch_ordered_keeps_input_order(workers, seed):
+    delays = random_delays(40, seed)
+    results = run_with_timeout(lambda: list(fetch_ordered(range(40), partial(delayed_fetch, delays), workers)))
+    assert results == [(item, f"page {item}") for item in range(40)]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_fetch_ordered_propagates_fetch_errors(workers):
+    with pytest.raises(RuntimeError, match="fetch of 7 failed"):
+        run_with_timeout(lambda: list(fetch_ordered(range(30), partial(failing_fetch, 7), workers)))
+
+
+def test_fetch_parse_ordered_keeps_input_order():
+    delays = random_delays(30, 4)
+    results = run_with_timeout(lambda: list(fetch_parse_ordered(
+        range(30), partial(delayed_fetch, delays), parse_page, workers=4, parse_workers=2)), timeout=30)
+    assert results == [(item, f"PAGE {item}") for item in range(30)]
+
+
+def test_fetch_parse_ordered_passes_on_failed_fetches():
+    fetch = partial(delayed_fetch, {item: 0.0 for item in range(10)})
+    results = run_with_timeout(lambda: list(fetch_parse_ordered(
+        range(10), lambda item: None if item == 5 else fetch(item), parse_page, workers=2)), timeout=30)
+    assert results[5] == (5, None)
+    assert [item for item, _ in results] == list(range(10))
+
+
+def test_fetch_parse_ordered_propagates_fetch_errors():
+    with pytest.raises(RuntimeError, match="fetch of 7 failed"):
+        run_with_timeout(lambda: list(fetch_parse_ordered(
+            range(30), partial(failing_fetch, 7), parse_page, workers=3, parse_workers=2)), timeout=30)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(" 120 ") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_http_date():
+    value = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 28 <= parse_retry_after(value) <= 30
+    past = email.utils.formatdate(time.time() - 30, usegmt=True)
+    assert parse_retry_after(past) == 0.0
+
+
+@pytest.mark.parametrize("http_date", [False, True], ids=["seconds", "http-date"])
+def test_429_sets_pause_until_from_retry_after(http_date):
+    # Built in the test: an HTTP date is only valid for the moment it was made
+    expected = 30.0 if http_date else 2.0
+    retry_after = email.utils.formatdate(time.time() + 30, usegmt=True) if http_date else "2"
+    limiter = AdaptiveRateLimiter(10.0)
+    before = time.monotonic()
+    limiter.feedback(429, 0.1, parse_retry_after(retry_after))
+    assert expected - 3 <= limiter.pause_until - before <= expected + 0.5
+    assert limiter.rate == 5.0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET /?status=429&retry_after=2&delay=0.3 with that status and
+    Retry-After, after sleeping `delay` seconds (all optional; default a
+    200 straight away).
+    """
+
+    def do_GET(self):
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        time.sleep(float(query.get("delay", 0)))
+        self.send_response(int(query.get("status", 200)))
+        if "retry_after" in query:
+            self.send_header("Retry-After", query["retry_after"])
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_get_reports_retry_after_to_the_limiter(stub_server):
+    limiter = HostRateLimiter(default_rate=10.0)
+    url = stub_server + "?status=429&retry_after=2"
+    before = time.monotonic()
+    assert http_get(url, limiter=limiter).status_code == 429
+    host_limiter = limiter.for_url(url)
+    assert 1.5 <= host_limiter.pause_until - before <= 2.5
+    assert host_limiter.rate == 5.0
+
+
+def test_http_get_latency_drives_the_rate(stub_server):
+    limiter = HostRateLimiter(default_rate=50.0)
+    host_limiter = limiter.for_url(stub_server)
+
+    def get(delay, count):
+        rates = []
+        for _ in range(count):
+            assert http_get(f"{stub_server}?delay={delay}", limiter=limiter).status_code == 200
+            rates.append(host_limiter.rate)
+        return rates
+
+    # Fast responses raise the rate, responses far slower than usual cut it
+    fast = get(0.005, 5)
+    assert fast == sorted(fast) and fast[-1] > 50.0
+    slow = get(0.5, 3)
+    assert slow == sorted(slow, reverse=True) and slow[-1] < fast[-1]
+    # Once the server is fast again the rate climbs back
+    recovered = get(0.005, 5)
+    assert recovered == sorted(recovered) and recovered[-1] > slow[-1]
+
+
+def test_pause_until_is_not_shortened_by_a_later_429():
+    limiter = AdaptiveRateLimiter(10.0)
+    limiter.feedback(429, 0.1, 30.0)
+    pause_until = limiter.pause_until
+    limiter.feedback(503, 0.1, 2.0)
+    assert limiter.pause_until == pause_until
+
+
+def test_acquire_waits_out_the_pause():
+    limiter = AdaptiveRateLimiter(0)
+    limiter.feedback(429, 0.01, 0.2)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_aimd_rate_stays_within_bounds():
+    rng = random.Random(5)
+    limiter = AdaptiveRateLimiter(10.0, min_rate=1.0, max_rate=40.0, increase=2.0)
+    statuses = [200, 200, 200, 304, 404, 429, 503, 500, None]
+    for _ in range(2000):
+        status = rng.choice(statuses)
+        latency = rng.choice([0.01, 0.02, 0.5])
+        limiter.feedback(status, latency, 0.0 if status in (429, 503) else None)
+        assert 1.0 <= limiter.rate <= 40.0
+
+
+def test_aimd_rate_reaches_both_bounds():
+    limiter = AdaptiveRateLimiter(10.0, min_rate=1.0, max_rate=40.0, increase=2.0)
+    for _ in range(100):
+        limiter.feedback(200, 0.01)
+    assert limiter.rate == 40.0
+    for _ in range(100):
+        limiter.feedback(429, 0.01, 0.0)
+    assert limiter.rate == 1.0
+
+
+def test_limiter_is_shared_safely_between_threads():
+    limiter = AdaptiveRateLimiter(10.0, min_rate=1.0, max_rate=40.0)
+
+    def report(seed):
+        rng = random.Random(seed)
+        for _ in range(500):
+            limiter.feedback(rng.choice([200, 429, 500]), 0.01, 0.0)
+
+    threads = [threading.Thread(target=report, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert 1.0 <= limiter.rate <= 40.0
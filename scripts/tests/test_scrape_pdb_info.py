@@ -0,0 +1,76 @@
+"""
+Run scrape_pdb_info.py against a local stand-in for the RCSB data API
+with a small PDB holdings index.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import SCRIPT_DIR
+from motm_store import MotmStore
+from pdb_holdings import write_holdings
+
+TITLES = {"4hhb": "DEOXY HUMAN HEMOGLOBIN", "2abc": "Successor of 1abc", "9zzz": "Released after the index"}
+
+
+class EntryHandler(BaseHTTPRequestHandler):
+    """GET /rest/v1/core/entry/<code> with the title from TITLES, or a 404."""
+    requested = []
+
+    def do_GET(self):
+        code = self.path.rsplit("/", 1)[-1].lower()
+        self.requested.append(code)
+        body = json.dumps({"struct": {"title": TITLES[code]}}).encode() if code in TITLES else b"{}"
+        self.send_response(200 if code in TITLES else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def rcsb_server():
+    EntryHandler.requested = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EntryHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def run_scraper(tmp_path, rcsb_url, *options) -> subprocess.CompletedProcess:
+    command = [sys.executable, str(SCRIPT_DIR / "scrape_pdb_info.py"), "--rcsb-url", rcsb_url,
+               "--output-dir", str(tmp_path), "--db", str(tmp_path / "motm_data.sqlite"),
+               "--journal", str(tmp_path / "journal.jsonl"), "--holdings", str(tmp_path / "holdings"),
+               "--no-cache", "--rate", "0", *options]
+    return subprocess.run(command, capture_output=True, text=True, encoding="utf-8", timeout=60, cwd=tmp_path)
+
+
+def test_holdings_skip_only_obsolete_codes(tmp_path, rcsb_server):
+    # 9zzz is newer than the index: it is not listed at all, so it is still fetched
+    write_holdings(tmp_path / "holdings", ["4hhb", "2abc"], [("1abc", "2abc")])
+    with MotmStore(tmp_path / "motm_data.sqlite") as store:
+        store.upsert_pdb_codes([{"number": 1, "pdb_codes": ["4hhb", "1abc", "9zzz"]}])
+
+    result = run_scraper(tmp_path, rcsb_server)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "1abc is obsolete, replaced by 2abc" in result.stdout
+    assert sorted(EntryHandler.requested) == ["2abc", "4hhb", "9zzz"]
+
+    with open(tmp_path / "pdb_info.json", 'r', encoding='utf-8') as f:
+        infos = {info["pdb_code"]: info for info in json.load(f)}
+    assert infos["1abc"]["error"] == "obsolete"
+    assert {code: infos[code]["title"] for code in TITLES} == TITLES
+
+    # The obsolete code is final: a resumed run asks for nothing
+    EntryHandler.requested = []
+    assert run_scraper(tmp_path, rcsb_server, "--resume").returncode == 0
+    assert EntryHandler.requested == []
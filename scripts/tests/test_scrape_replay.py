@@ -0,0 +1,63 @@
+"""
+Replay the recorded MotM pages through scrape_motm_pages.py and compare
+its outputs with the golden JSON files.
+
+fixtures/motm_cassette.zip holds the four fixture pages under their
+pdb101.rcsb.org URLs plus a 404 for issue 5, which is not published.
+After a change to the extractors that is meant to alter the output,
+review the difference and copy the new files over fixtures/golden/.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import FIXTURE_DIR, SCRIPT_DIR
+
+CASSETTE = FIXTURE_DIR / "motm_cassette.zip"
+GOLDEN_DIR = FIXTURE_DIR / "golden"
+
+
+def run_replay(tmp_path, *options) -> subprocess.CompletedProcess:
+    """Run scrape_motm_pages.py for issues 1-5 from the cassette, with every output under tmp_path."""
+    command = [sys.executable, str(SCRIPT_DIR / "scrape_motm_pages.py"), "1", "5",
+               "--replay", str(CASSETTE), "--output-dir", str(tmp_path),
+               "--db", str(tmp_path / "motm_data.sqlite"), "--journal", str(tmp_path / "journal.jsonl"),
+               "--no-holdings", "--rate", "0", *options]
+    return subprocess.run(command, capture_output=True, text=True, encoding="utf-8", timeout=60, cwd=tmp_path)
+
+
+def load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("options", [
+    (),
+    ("--workers", "3"),
+    ("--workers", "2", "--parse-workers", "2"),
+    ("--parser", "html.parser"),
+], ids=["serial", "threads", "parse-processes", "html.parser"])
+def test_replay_matches_golden_output(tmp_path, options):
+    result = run_replay(tmp_path, *options)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Not in cassette" not in result.stdout
+    for name in ("molecule_data.json", "pdb_codes.json"):
+        assert load(tmp_path / name) == load(GOLDEN_DIR / name), name
+
+
+def test_replay_reports_the_unpublished_issue(tmp_path):
+    result = run_replay(tmp_path)
+    assert "Fetching molecule 5... FAILED" in result.stdout
+    assert "Successfully scraped 4 molecules" in result.stdout
+
+
+def test_resume_from_the_journal_needs_no_requests(tmp_path):
+    assert run_replay(tmp_path).returncode == 0
+    (tmp_path / "molecule_data.json").unlink()
+    result = run_replay(tmp_path, "--resume")
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Fetching molecule 1..." not in result.stdout
+    assert load(tmp_path / "molecule_data.json") == load(GOLDEN_DIR / "molecule_data.json")